@@ -3,6 +3,7 @@
 import json
 import os
 import logging
+import tempfile
 from dotenv import load_dotenv
 
 # 환경 변수 로딩
@@ -34,10 +35,145 @@ class Config:
     """FastAPI 설정 값을 관리하는 클래스"""
 
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
-    SHUTTLE_URL: str = "https://ibook.tukorea.ac.kr/Viewer/bus01"
+    # 셔틀버스 시간표 iBook 뷰어 URL (부하 테스트 시 로컬 가짜 업스트림으로 교체)
+    SHUTTLE_URL: str = os.getenv(
+        "SHUTTLE_URL", "https://ibook.tukorea.ac.kr/Viewer/bus01"
+    )
     school_info_path: str = os.path.join(
         os.path.abspath(os.path.join(CONFIG_DIR, "school_info.json"))
     )
+    # school_info.json 변경 감시 주기(초), 0 이하이면 감시하지 않음
+    SCHOOL_INFO_RELOAD_INTERVAL: float = float(
+        os.getenv("SCHOOL_INFO_RELOAD_INTERVAL", "5")
+    )
+    # 조직 API 응답의 Cache-Control max-age(초)
+    ORGANIZATION_CACHE_MAX_AGE: int = int(os.getenv("ORGANIZATION_CACHE_MAX_AGE", "60"))
+    # depth/fields/flat 옵션 조합별 조직 응답 본문을 보관할 최대 개수 (스냅샷마다)
+    ORGANIZATION_VIEW_CACHE_SIZE: int = int(
+        os.getenv("ORGANIZATION_VIEW_CACHE_SIZE", "256")
+    )
+    # 조직 이름 자동완성 결과 최대 개수
+    AUTOCOMPLETE_MAX_LIMIT: int = int(os.getenv("AUTOCOMPLETE_MAX_LIMIT", "50"))
+    # 전화번호/URL 일괄 역조회 요청 하나에 담을 수 있는 최대 항목 수
+    LOOKUP_BATCH_MAX_ITEMS: int = int(os.getenv("LOOKUP_BATCH_MAX_ITEMS", "200"))
+    # 조직 일괄 조회 요청 하나에 담을 수 있는 최대 경로/이름 수
+    ORGANIZATION_BATCH_MAX_ITEMS: int = int(
+        os.getenv("ORGANIZATION_BATCH_MAX_ITEMS", "200")
+    )
+
+    # 업스트림(iBook) 공용 HTTP 클라이언트 설정
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(
+        os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "False").lower() == "true"
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+    HTTP_WRITE_TIMEOUT: float = float(os.getenv("HTTP_WRITE_TIMEOUT", "10"))
+    HTTP_POOL_TIMEOUT: float = float(os.getenv("HTTP_POOL_TIMEOUT", "5"))
+
+    # iBook GET 요청 헤지: 최근 성공 응답 시간의 이 분위수만큼 기다린 뒤 한 번 더 요청 (0이면 사용 안 함)
+    UPSTREAM_HEDGE_QUANTILE: float = float(os.getenv("UPSTREAM_HEDGE_QUANTILE", "0.95"))
+    # 헤지 지연 하한(초)과 응답 시간 표본이 부족할 때의 헤지 지연(초)
+    UPSTREAM_HEDGE_MIN_DELAY: float = float(
+        os.getenv("UPSTREAM_HEDGE_MIN_DELAY", "0.05")
+    )
+    UPSTREAM_HEDGE_DEFAULT_DELAY: float = float(
+        os.getenv("UPSTREAM_HEDGE_DEFAULT_DELAY", "1")
+    )
+    # iBook GET 요청 최대 재시도 횟수와 full jitter 백오프 기본/최대 지연(초)
+    UPSTREAM_MAX_RETRIES: int = int(os.getenv("UPSTREAM_MAX_RETRIES", "2"))
+    UPSTREAM_RETRY_BASE_DELAY: float = float(
+        os.getenv("UPSTREAM_RETRY_BASE_DELAY", "0.1")
+    )
+    UPSTREAM_RETRY_MAX_DELAY: float = float(os.getenv("UPSTREAM_RETRY_MAX_DELAY", "2"))
+    # 재시도/헤지 예산: 요청 대비 비율과 요청이 적을 때도 허용할 초당 개수
+    UPSTREAM_RETRY_BUDGET_RATIO: float = float(
+        os.getenv("UPSTREAM_RETRY_BUDGET_RATIO", "0.1")
+    )
+    UPSTREAM_RETRY_BUDGET_MIN_PER_SECOND: float = float(
+        os.getenv("UPSTREAM_RETRY_BUDGET_MIN_PER_SECOND", "1")
+    )
+    # 연속 실패가 이 횟수가 되면 서킷을 열어 바로 실패 (0이면 사용 안 함)
+    UPSTREAM_BREAKER_FAILURES: int = int(os.getenv("UPSTREAM_BREAKER_FAILURES", "5"))
+    # 서킷이 열린 뒤 시험 요청을 보내기까지의 시간(초)
+    UPSTREAM_BREAKER_COOLDOWN: float = float(
+        os.getenv("UPSTREAM_BREAKER_COOLDOWN", "30")
+    )
+
+    # 셔틀버스 bookcode/이미지 목록 캐시 (초)
+    SHUTTLE_CACHE_TTL: float = float(os.getenv("SHUTTLE_CACHE_TTL", "600"))
+    # TTL 이후 백그라운드 갱신 동안 이전 값을 계속 반환할 시간
+    SHUTTLE_CACHE_STALE_TTL: float = float(
+        os.getenv("SHUTTLE_CACHE_STALE_TTL", "86400")
+    )
+    # 셔틀버스 json/text/base64 응답의 Cache-Control max-age(초)
+    SHUTTLE_RESPONSE_MAX_AGE: int = int(os.getenv("SHUTTLE_RESPONSE_MAX_AGE", "60"))
+    # 셔틀버스 base64 응답 본문을 보관할 최대 크기(바이트), 넘으면 매번 스트리밍
+    SHUTTLE_REPRESENTATION_MAX_BYTES: int = int(
+        os.getenv("SHUTTLE_REPRESENTATION_MAX_BYTES", str(8 * 1024 * 1024))
+    )
+    # /metrics 엔드포인트와 요청 메트릭 기록 사용 여부
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # 셔틀버스 이미지 바이트 캐시 (메모리 LRU + 디스크)
+    IMAGE_CACHE_DIR: str = os.getenv(
+        "IMAGE_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), "sandol_static_info", "images"),
+    )
+    IMAGE_CACHE_MEMORY_MAX_BYTES: int = int(
+        os.getenv("IMAGE_CACHE_MEMORY_MAX_BYTES", str(64 * 1024 * 1024))
+    )
+    IMAGE_CACHE_DISK_MAX_BYTES: int = int(
+        os.getenv("IMAGE_CACHE_DISK_MAX_BYTES", str(512 * 1024 * 1024))
+    )
+    # URL의 이미지가 바뀌었는지 다시 확인하기 전까지의 시간(초)
+    IMAGE_CACHE_TTL: float = float(os.getenv("IMAGE_CACHE_TTL", "3600"))
+    # 셔틀버스 캐시를 백그라운드에서 미리 갱신하는 간격(초, 0이면 사용 안 함)
+    # 요청이 iBook을 기다리지 않도록 SHUTTLE_CACHE_TTL보다 짧게 설정
+    SHUTTLE_PREFETCH_INTERVAL: float = float(
+        os.getenv("SHUTTLE_PREFETCH_INTERVAL", "300")
+    )
+    # 미리 갱신이 실패했을 때 다시 시도하기까지의 시간(초)
+    SHUTTLE_PREFETCH_RETRY_INTERVAL: float = float(
+        os.getenv("SHUTTLE_PREFETCH_RETRY_INTERVAL", "30")
+    )
+    # 여러 워커가 리더 하나의 셔틀버스 캐시를 나눠 쓸지 여부
+    # (워커들이 같은 IMAGE_CACHE_DIR, ZIP_BUNDLE_DIR을 써야 함)
+    SHARED_CACHE_ENABLED: bool = (
+        os.getenv("SHARED_CACHE_ENABLED", "true").lower() == "true"
+    )
+    # 리더 잠금 파일과 게시 파일을 둘 디렉터리
+    SHARED_CACHE_DIR: str = os.getenv(
+        "SHARED_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), "sandol_static_info", "shared"),
+    )
+    # 팔로워가 게시 파일 변경을 확인하고 리더 잠금을 다시 시도하는 간격(초)
+    SHARED_CACHE_POLL_INTERVAL: float = float(
+        os.getenv("SHARED_CACHE_POLL_INTERVAL", "5")
+    )
+    # 여러 페이지를 받을 때 동시에 진행할 이미지 다운로드 수
+    IMAGE_FETCH_CONCURRENCY: int = int(os.getenv("IMAGE_FETCH_CONCURRENCY", "4"))
+
+    # 전체 이미지 ZIP 묶음을 저장할 디렉터리 (Range 요청/이어받기용)
+    ZIP_BUNDLE_DIR: str = os.getenv(
+        "ZIP_BUNDLE_DIR",
+        os.path.join(tempfile.gettempdir(), "sandol_static_info", "bundles"),
+    )
+    # 디스크에 보관할 ZIP 묶음 수 (최신 이미지 세트부터)
+    ZIP_BUNDLE_KEEP: int = int(os.getenv("ZIP_BUNDLE_KEEP", "2"))
+
+    # 이미지 변환(WebP/리사이즈)에 사용할 프로세스 수 (Pillow 필요)
+    IMAGE_VARIANT_WORKERS: int = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+    # 변환된 이미지를 보관할 메모리 크기(바이트)
+    IMAGE_VARIANT_CACHE_MAX_BYTES: int = int(
+        os.getenv("IMAGE_VARIANT_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+    )
+    # quality 쿼리가 없을 때 사용할 품질
+    IMAGE_VARIANT_DEFAULT_QUALITY: int = int(
+        os.getenv("IMAGE_VARIANT_DEFAULT_QUALITY", "80")
+    )
 
     class HttpStatus:
         """HTTP 상태 코드를 정의하는 클래스"""
@@ -45,6 +181,8 @@ class Config:
         OK = 200
         CREATED = 201
         NO_CONTENT = 204
+        PARTIAL_CONTENT = 206
+        NOT_MODIFIED = 304
         BAD_REQUEST = 400
         UNAUTHORIZED = 401
         FORBIDDEN = 403
@@ -52,6 +190,8 @@ class Config:
         NOT_ACCEPTABLE = 406
         CONFLICT = 409
         UNSUPPORTED_MEDIA_TYPE = 415
+        RANGE_NOT_SATISFIABLE = 416
+        TOO_MANY_REQUESTS = 429
         INTERNAL_SERVER_ERROR = 500
         NOT_IMPLEMENTED = 501
         BAD_GATEWAY = 502
@@ -63,6 +203,7 @@ class Config:
         BASE64 = "application/base64"
         ZIP = "application/zip"
         OCTET_STREAM = "application/octet-stream"
+        TEXT = "text/plain"
 
     class ImageType:
         """이미지 타입을 정의하는 클래스"""
@@ -70,6 +211,7 @@ class Config:
         JPEG = "image/jpeg"
         PNG = "image/png"
         GIF = "image/gif"
+        WEBP = "image/webp"
 
     @staticmethod
     def get_school_info_file():
@@ -0,0 +1,3 @@
+from app.middleware.metrics import MetricsMiddleware
+
+__all__ = ["MetricsMiddleware"]
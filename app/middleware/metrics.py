@@ -0,0 +1,63 @@
+"""요청 처리 시간과 응답 크기를 메트릭에 기록하는 ASGI 미들웨어
+
+`BaseHTTPMiddleware`는 요청마다 태스크와 스트림을 새로 만들어 스트리밍 응답에
+비용이 크므로, `send`만 감싸는 순수 ASGI 미들웨어로 구현합니다.
+
+라벨은 카디널리티가 커지지 않도록 실제 경로 대신 라우트 템플릿
+(`/bus/image/{index}`)을 쓰고, 라우터가 Accept 협상으로 고른 응답 타입은
+`request.state.response_type`에서 읽습니다.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import HTTP_REQUEST_DURATION, HTTP_RESPONSE_BYTES
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트/응답 타입별 처리 시간 히스토그램과 응답 바이트 카운터를 기록합니다."""
+
+    def __init__(self, app: ASGIApp):
+        """MetricsMiddleware를 초기화합니다.
+
+        Args:
+            app (ASGIApp): 감쌀 ASGI 앱
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """HTTP 요청을 처리하며 응답 상태, 바이트 수, 처리 시간을 기록합니다."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        state = scope.setdefault("state", {})
+        status = 500
+        sent = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status, sent
+            if message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+            elif message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            response_type = state.get("response_type", "")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                path,
+                str(status),
+                response_type,
+            )
+            HTTP_RESPONSE_BYTES.inc(path, response_type, amount=sent)
@@ -1,3 +1,6 @@
 """API 서버를 구성하는 모듈들"""
 from app.routers.bus import router as bus_router
-from app.routers.organization import router as organization_router
\ No newline at end of file
+from app.routers.organization import router as organization_router
+from app.routers.metrics import router as metrics_router
+
+__all__ = ["bus_router", "organization_router", "metrics_router"]
@@ -1,13 +1,67 @@
-from typing import Literal, Union
-from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse, Response
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, HTTPException
+from fastapi.responses import Response
 
 from app.config import Config, logger
-from app.utils import BookDownloader
-from app.utils.image_response import build_image_response
+from app.utils.image_response import build_image_response, build_variant_response
+from app.utils.image_variants import VariantSpec, pillow_available
+from app.utils.negotiation import negotiate
+from app.utils.shuttle import ShuttleImageService, get_shuttle_service
 
 router = APIRouter(prefix="/bus")
 
+# Accept 협상 후보 (MIME 타입 → response_type), q 값이 같으면 앞의 것을 우선
+ALL_IMAGES_TYPES = {
+    Config.Accept.JSON: "json",
+    Config.Accept.BASE64: "base64",
+    Config.Accept.ZIP: "zip",
+    Config.Accept.OCTET_STREAM: "octet-stream",
+}
+IMAGE_TYPES = {
+    Config.Accept.JSON: "json",
+    Config.Accept.BASE64: "base64",
+    Config.Accept.OCTET_STREAM: "octet-stream",
+    Config.Accept.ZIP: "zip",
+    Config.Accept.TEXT: "text",
+    Config.ImageType.JPEG: "jpeg",
+    Config.ImageType.WEBP: "webp",
+}
+# width/quality를 지정했을 때의 후보 (변환할 수 있는 이미지 형식만)
+VARIANT_TYPES = {
+    Config.ImageType.JPEG: "jpeg",
+    Config.ImageType.WEBP: "webp",
+}
+
+
+def negotiate_response_type(request: Request, types: dict[str, str]) -> str:
+    """Accept 헤더(q 값 포함)에 가장 잘 맞는 response_type을 고릅니다.
+
+    Accept 헤더가 없거나 `*/*`이면 첫 번째 후보(json)를 고르며, Pillow가 없으면
+    WebP는 후보에서 제외합니다. (예전에는 이 경우 406을 반환했음)
+
+    Raises:
+        HTTPException: 받아들일 수 있는 형식이 없는 경우 406
+    """
+    offers = [
+        media_type
+        for media_type in types
+        if media_type != Config.ImageType.WEBP or pillow_available()
+    ]
+    media_type = negotiate(request.headers.get("accept"), offers)
+    if media_type is None:
+        raise HTTPException(
+            status_code=Config.HttpStatus.NOT_ACCEPTABLE,
+            detail="지원되지 않는 Accept 헤더입니다.",
+        )
+    request.state.response_type = types[media_type]  # 메트릭 라벨용
+    return types[media_type]
+
+
+def vary_accept(response: Response) -> Response:
+    """Accept에 따라 달라지는 응답임을 캐시에 알립니다."""
+    response.headers["Vary"] = "Accept"
+    return response
+
 
 @router.get(
     "/images",
@@ -37,42 +91,35 @@ router = APIRouter(prefix="/bus")
                 },
             },
         },
+        Config.HttpStatus.PARTIAL_CONTENT: {
+            "description": "Range 요청에 대한 ZIP 일부 (묶음 파일이 준비된 경우)"
+        },
         Config.HttpStatus.NOT_FOUND: {"description": "버스 이미지가 없습니다."},
         Config.HttpStatus.NOT_ACCEPTABLE: {
-            "description": "지원되지 않는 Accept 헤더입니다."
+            "description": "Accept 헤더의 형식을 하나도 제공할 수 없습니다. "
+            "(Accept가 없거나 */*이면 JSON)"
         },
     },
     response_class=Response,
 )
-async def get_all_bus_images(request: Request):
+async def get_all_bus_images(
+    request: Request,
+    shuttle: ShuttleImageService = Depends(get_shuttle_service),
+):
     """모든 버스 이미지들을 Accept 헤더에 따라 다양한 형식으로 반환합니다."""
-    accept_header = request.headers.get("accept", "").lower()
     logger.info("모든 버스 이미지 요청 수신")
+    response_type = negotiate_response_type(request, ALL_IMAGES_TYPES)
 
-    # MIME 타입에 따라 response_type 결정
-    if Config.Accept.JSON in accept_header:
-        response_type = "json"
-    elif Config.Accept.BASE64 in accept_header:
-        response_type = "base64"
-    elif Config.Accept.ZIP in accept_header:
-        response_type = "zip"
-    elif Config.Accept.OCTET_STREAM in accept_header:
-        response_type = "octet-stream"
-    else:
-        raise HTTPException(
-            status_code=Config.HttpStatus.NOT_ACCEPTABLE,
-            detail="지원되지 않는 Accept 헤더입니다.",
-        )
-
-    downloader = BookDownloader(Config.SHUTTLE_URL)
-    image_urls = await downloader.fetch_image_list()
+    image_urls = await shuttle.get_image_urls()
 
     if not image_urls:
         raise HTTPException(
             status_code=Config.HttpStatus.NOT_FOUND, detail="버스 이미지가 없습니다."
         )
 
-    return await build_image_response(image_urls, response_type)
+    return vary_accept(
+        await build_image_response(image_urls, response_type, request, shuttle)
+    )
 
 
 @router.get(
@@ -93,41 +140,59 @@ async def get_all_bus_images(request: Request):
                 Config.ImageType.JPEG: {
                     "schema": {"type": "string", "format": "binary"}
                 },
-                "text/plain": {"example": "https://example.com/img1.jpg"},
+                Config.ImageType.WEBP: {
+                    "schema": {"type": "string", "format": "binary"}
+                },
+                Config.Accept.TEXT: {"example": "https://example.com/img1.jpg"},
             },
         },
+        Config.HttpStatus.PARTIAL_CONTENT: {
+            "description": "Range 요청에 대한 이미지 일부"
+        },
         Config.HttpStatus.NOT_FOUND: {"description": "해당 index의 이미지가 없습니다."},
         Config.HttpStatus.NOT_ACCEPTABLE: {
-            "description": "지원되지 않는 Accept 헤더입니다."
+            "description": "Accept 헤더의 형식을 하나도 제공할 수 없습니다. "
+            "(Accept가 없거나 */*이면 JSON, width/quality를 지정하면 JPEG, "
+            "width/quality는 image/jpeg, image/webp 응답에만 사용 가능)"
+        },
+        Config.HttpStatus.NOT_IMPLEMENTED: {
+            "description": "이미지 변환(Pillow)을 사용할 수 없습니다."
         },
     },
     response_class=Response,
 )
-async def get_bus_image_by_index(index: int, request: Request):
-    """특정 인덱스(1부터 시작)의 버스 이미지를 Accept 헤더에 따라 다양한 형식으로 반환합니다."""
-    accept_header = request.headers.get("accept", "").lower()
-    logger.info(f"버스 이미지 요청 (index={index})")
+async def get_bus_image_by_index(
+    index: int,
+    request: Request,
+    width: Optional[int] = Query(
+        None,
+        ge=16,
+        le=4096,
+        description="이미지 너비(px), 원본보다 크면 원본 크기 "
+        "(image/jpeg, image/webp 응답만 가능, 그 외 Accept이면 406)",
+    ),
+    quality: Optional[int] = Query(
+        None,
+        ge=1,
+        le=100,
+        description="JPEG/WebP 인코딩 품질 "
+        "(image/jpeg, image/webp 응답만 가능, 그 외 Accept이면 406)",
+    ),
+    shuttle: ShuttleImageService = Depends(get_shuttle_service),
+):
+    """특정 인덱스(1부터 시작)의 버스 이미지를 Accept 헤더에 따라 다양한 형식으로 반환합니다.
 
-    if Config.Accept.JSON in accept_header:
-        response_type = "json"
-    elif Config.Accept.BASE64 in accept_header:
-        response_type = "base64"
-    elif Config.Accept.OCTET_STREAM in accept_header:
-        response_type = "octet-stream"
-    elif Config.Accept.ZIP in accept_header:
-        response_type = "zip"
-    elif "text/plain" in accept_header:
-        response_type = "text"
-    elif Config.ImageType.JPEG in accept_header:
-        response_type = "jpeg"
-    else:
-        raise HTTPException(
-            status_code=Config.HttpStatus.NOT_ACCEPTABLE,
-            detail="지원되지 않는 Accept 헤더입니다.",
-        )
+    `image/webp`를 요청하거나 `width`/`quality`를 지정하면 변환된 이미지를 반환합니다.
+    `width`/`quality`를 지정하면 JPEG/WebP 중에서만 협상하므로, Accept가 이미지 형식을
+    받지 않으면 옵션을 무시하지 않고 406으로 응답합니다.
+    """
+    logger.info(f"버스 이미지 요청 (index={index})")
+    variant = width is not None or quality is not None
+    response_type = negotiate_response_type(
+        request, VARIANT_TYPES if variant else IMAGE_TYPES
+    )
 
-    downloader = BookDownloader(Config.SHUTTLE_URL)
-    image_urls = await downloader.fetch_image_list()
+    image_urls = await shuttle.get_image_urls()
 
     if index < 1 or index > len(image_urls):
         raise HTTPException(
@@ -135,4 +200,33 @@ async def get_bus_image_by_index(index: int, request: Request):
             detail="해당 index의 이미지가 없습니다.",
         )
 
-    return await build_image_response(image_urls[index - 1], response_type)
+    image_url = image_urls[index - 1]
+    if response_type == "webp" or variant:
+        spec = VariantSpec(
+            format=response_type,
+            width=width,
+            quality=quality or Config.IMAGE_VARIANT_DEFAULT_QUALITY,
+        )
+        return await build_variant_response(image_url, spec, shuttle.variants, request)
+
+    return vary_accept(
+        await build_image_response(
+            image_url, response_type, request, shuttle, index=index
+        )
+    )
+
+
+@router.get("/cache/stats", summary="셔틀버스 이미지 캐시 통계")
+async def get_image_cache_stats(
+    shuttle: ShuttleImageService = Depends(get_shuttle_service),
+):
+    """이미지 캐시의 hit/miss/eviction 카운터와 사용량을 반환합니다."""
+    return shuttle.images.snapshot_stats()
+
+
+@router.get("/status", summary="셔틀버스 시간표 백그라운드 갱신 상태")
+async def get_prefetch_status(
+    shuttle: ShuttleImageService = Depends(get_shuttle_service),
+):
+    """마지막 성공/변경 시각, 실패 횟수 등 백그라운드 갱신 상태를 반환합니다."""
+    return shuttle.snapshot_status()
@@ -0,0 +1,14 @@
+"""Prometheus가 수집하는 /metrics 엔드포인트"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.utils.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", summary="Prometheus 메트릭", response_class=Response)
+async def get_metrics():
+    """요청 처리 시간, iBook 업스트림 호출, 캐시 적중률 등을 Prometheus 텍스트 형식으로 반환합니다."""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
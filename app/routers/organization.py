@@ -1,11 +1,169 @@
-from fastapi import APIRouter, Path, HTTPException
-from typing import Union, List
+from fastapi import APIRouter, Depends, Path, HTTPException, Query, Request, Response
+from typing import Callable, Hashable, Literal, Optional, Union, List
+
+from app.config import Config
+from app.schemas.organization import (
+    AutocompleteItem,
+    ContactLookupBatchRequest,
+    ContactLookupBatchResponse,
+    ContactLookupResult,
+    ContactMatch,
+    OrganizationBatchRequest,
+    OrganizationBatchResponse,
+)
+from app.utils.http_cache import CachedBody, cached_response
+from app.utils.organization_store import (
+    FULL_VIEW,
+    TREE_KEY,
+    OrganizationSnapshot,
+    TreeView,
+    get_organization_snapshot,
+    serialize_batch,
+    serialize_nodes,
+    serialize_view,
+)
 from app.utils.university_structure import (
-    get_tukorea_structure,
+    NODE_FIELDS,
     OrganizationGroup,
     OrganizationUnit,
 )
 
+VERSION_HEADER = "X-Organization-Version"
+CACHE_CONTROL = f"public, max-age={Config.ORGANIZATION_CACHE_MAX_AGE}"
+EMPTY_LIST_BODY = CachedBody.from_bytes(b"[]")
+
+
+def organization_response(
+    request: Request,
+    snapshot: OrganizationSnapshot,
+    key: Hashable,
+    serialize: Callable[[], bytes],
+    view: TreeView = FULL_VIEW,
+) -> Response:
+    """스냅샷에 캐시된 직렬화 본문으로 ETag/Cache-Control 응답을 만듭니다."""
+    return cached_response(
+        request,
+        snapshot.render_view(view, key, serialize),
+        CACHE_CONTROL,
+        headers={VERSION_HEADER: str(snapshot.version)},
+    )
+
+
+def empty_list_response(request: Request, snapshot: OrganizationSnapshot) -> Response:
+    """빈 리스트 응답 (임의 입력값으로 캐시가 커지지 않도록 스냅샷에 캐시하지 않음)"""
+    return cached_response(
+        request,
+        EMPTY_LIST_BODY,
+        CACHE_CONTROL,
+        headers={VERSION_HEADER: str(snapshot.version)},
+    )
+
+
+def get_tree_view(
+    depth: Optional[int] = Query(
+        None,
+        ge=0,
+        description="포함할 하위 조직 단계 수 (생략하면 전체, 0이면 조직 자신만)",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="쉼표로 구분한 노드 필드 (type,name,phone,url, 생략하면 전체)",
+    ),
+    flat: bool = Query(
+        False, description="트리 대신 `path`가 붙은 전위 순회 리스트로 반환"
+    ),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+) -> TreeView:
+    """쿼리 옵션을 캐시 키로 쓸 수 있는 정규화된 TreeView로 변환합니다."""
+    selected = NODE_FIELDS
+    if fields is not None:
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        if not requested:
+            raise HTTPException(
+                status_code=422, detail="fields에는 필드를 하나 이상 지정해야 합니다."
+            )
+        unknown = requested.difference(NODE_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"알 수 없는 필드: {', '.join(sorted(unknown))}",
+            )
+        selected = tuple(field for field in NODE_FIELDS if field in requested)
+    # 트리 높이 이상은 전체와 같으므로 캐시 키 수가 구조에 의해 제한됨
+    if depth is not None and depth >= snapshot.structure.height:
+        depth = None
+    return TreeView(depth=depth, fields=selected, flat=flat)
+
+
+# depth/fields/flat에 따라 응답 모양이 달라지므로 response_model 대신 모양별 예시로 문서화
+TREE_VIEW_RESPONSES = {
+    200: {
+        "description": "조직 노드 (`depth`/`fields`/`flat` 옵션에 따른 모양)",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "full": {
+                        "summary": "기본 (전체 트리, 모든 필드)",
+                        "value": {
+                            "type": "group",
+                            "name": "대학본부",
+                            "subunits": {
+                                "기획처": {
+                                    "type": "group",
+                                    "name": "기획처",
+                                    "subunits": {
+                                        "기획팀": {
+                                            "type": "unit",
+                                            "name": "기획팀",
+                                            "phone": "031-8041-0000",
+                                            "url": "https://example.com/plan",
+                                        }
+                                    },
+                                },
+                                "입학처": {
+                                    "type": "unit",
+                                    "name": "입학처",
+                                    "phone": "031-8041-0001",
+                                    "url": "https://example.com/ipsi",
+                                },
+                            },
+                        },
+                    },
+                    "projected": {
+                        "summary": "depth=1&fields=name (경계의 그룹은 subunits가 빈 객체)",
+                        "value": {
+                            "name": "대학본부",
+                            "subunits": {
+                                "기획처": {"name": "기획처", "subunits": {}},
+                                "입학처": {"name": "입학처"},
+                            },
+                        },
+                    },
+                    "flat": {
+                        "summary": "flat=true&fields=name,phone (전위 순회 리스트)",
+                        "value": [
+                            {"path": "대학본부", "name": "대학본부"},
+                            {"path": "대학본부/기획처", "name": "기획처"},
+                            {
+                                "path": "대학본부/기획처/기획팀",
+                                "name": "기획팀",
+                                "phone": "031-8041-0000",
+                            },
+                            {
+                                "path": "대학본부/입학처",
+                                "name": "입학처",
+                                "phone": "031-8041-0001",
+                            },
+                        ],
+                    },
+                }
+            }
+        },
+    },
+    422: {"description": "`fields`가 비어 있거나 알 수 없는 필드를 포함합니다."},
+}
+
+
 router = APIRouter(
     prefix="/organization",
     tags=["Organization"],
@@ -15,7 +173,8 @@ router = APIRouter(
 
 @router.get(
     "/tree",
-    response_model=OrganizationGroup,
+    response_model=None,
+    responses=TREE_VIEW_RESPONSES,
     summary="학교 전체 조직 트리 조회",
     description="""
 학교 전체 조직 구조를 트리 형태로 반환합니다.
@@ -23,11 +182,28 @@ router = APIRouter(
 
 - UI 초기 렌더링 또는 전체 구조 시각화 시 유용
 - 응답은 재귀 구조의 JSON입니다.
+- `depth`: 포함할 하위 조직 단계 수 (경계의 그룹은 `subunits`가 빈 객체)
+- `fields`: 포함할 필드 (예: `fields=name`이면 이름만, 그룹의 `subunits`는 항상 포함)
+- `flat=true`: 트리 대신 `path`가 붙은 리스트 (전위 순회 순서)
+
+예시:
+- `/organization/tree?depth=2&fields=name`
+- `/organization/tree?flat=true&fields=name,phone`
 """,
 )
-async def get_tree():
-    structure = get_tukorea_structure()
-    return structure.root
+async def get_tree(
+    request: Request,
+    view: TreeView = Depends(get_tree_view),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+):
+    structure = snapshot.structure
+    return organization_response(
+        request,
+        snapshot,
+        TREE_KEY,
+        lambda: serialize_view(structure, structure.root, view),
+        view,
+    )
 
 
 @router.get(
@@ -44,10 +220,154 @@ async def get_tree():
 """,
 )
 async def search_by_name(
+    request: Request,
     name: str = Path(..., description="조직 이름 (예: 입학처, 컴퓨터공학부)"),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+):
+    structure = snapshot.structure
+    results = structure._search_by_name(structure.root, name)
+    if not results:
+        return empty_list_response(request, snapshot)
+    # 결과가 있는 이름만 캐시하므로 키 개수는 조직 수로 제한됨
+    return organization_response(
+        request, snapshot, ("search", name), lambda: serialize_nodes(structure, results)
+    )
+
+
+@router.get(
+    "/autocomplete",
+    response_model=List[AutocompleteItem],
+    summary="조직 이름 자동완성",
+    description="""
+입력 중인 검색어로 조직을 찾아 순위대로 반환합니다.
+
+- 완성된 이름, 입력 중인 글자(예: `컴퓨턱`), 초성(예: `ㅋㅍㅌ`), 이름 일부(예: `공학`) 모두 지원
+- 순위: 정확히 일치 > 접두사 > 초성 접두사 > 부분 문자열 > 초성 부분 문자열, 같은 순위에서는 짧은 이름 우선
+- 반환된 `path`로 `/organization/{path}`를 조회할 수 있습니다.
+
+예시:
+- `/organization/autocomplete?q=ㅋㅍㅌ`
+- `/organization/autocomplete?q=공학&limit=5`
+""",
+)
+async def autocomplete(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=50, description="검색어"),
+    limit: int = Query(
+        10, ge=1, le=Config.AUTOCOMPLETE_MAX_LIMIT, description="최대 결과 수"
+    ),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+):
+    """검색어에 맞는 조직을 자동완성 순위대로 반환합니다."""
+    response.headers[VERSION_HEADER] = str(snapshot.version)
+    return snapshot.search_index.search(q, limit)
+
+
+@router.get(
+    "/lookup/phone/{phone}",
+    response_model=List[ContactMatch],
+    summary="전화번호로 조직 역조회",
+    description="""
+전화번호를 사용하는 모든 조직을 반환합니다. 없으면 빈 리스트를 반환합니다.
+
+- `-`, 공백, `+82` 국가번호 등 표기 차이는 무시됩니다.
+- 여러 조직이 같은 번호를 쓰는 경우 모두 반환됩니다.
+
+예시:
+- `/organization/lookup/phone/031-8041-0013`
+""",
+)
+async def lookup_by_phone(
+    response: Response,
+    phone: str = Path(..., description="전화번호 (예: 031-8041-0013)"),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+):
+    """전화번호를 쓰는 조직을 모두 반환합니다."""
+    response.headers[VERSION_HEADER] = str(snapshot.version)
+    return snapshot.contact_index.by_phone(phone)
+
+
+@router.get(
+    "/lookup/url",
+    response_model=List[ContactMatch],
+    summary="URL로 조직 역조회",
+    description="""
+URL에 해당하는 조직을 반환합니다. 없으면 빈 리스트를 반환합니다.
+
+- scheme, `www.`, 마지막 `/` 차이는 무시됩니다.
+- `scope=page`(기본): 같은 페이지의 조직, URL의 `#앵커`까지 같은 조직이 있으면 그 조직만
+- `scope=host`: 같은 호스트의 모든 조직
+
+예시:
+- `/organization/lookup/url?url=https://tukorea.ac.kr/tukorea/2510/subview.do`
+""",
+)
+async def lookup_by_url(
+    response: Response,
+    url: str = Query(..., min_length=1, max_length=2048, description="조회할 URL"),
+    scope: Literal["page", "host"] = Query("page", description="비교 범위"),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+):
+    """URL이 가리키는 조직을 scope 범위로 찾아 반환합니다."""
+    response.headers[VERSION_HEADER] = str(snapshot.version)
+    return snapshot.contact_index.by_url(url, scope)
+
+
+@router.post(
+    "/lookup/batch",
+    response_model=ContactLookupBatchResponse,
+    summary="전화번호/URL 일괄 역조회",
+    description="""
+여러 전화번호와 URL을 한 번에 역조회합니다.
+결과는 요청의 `phones`, `urls`와 같은 순서로 반환되며, 찾지 못한 항목은 `matches`가 빈 리스트입니다.
+""",
+)
+async def lookup_batch(
+    body: ContactLookupBatchRequest,
+    response: Response,
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
+):
+    """전화번호와 URL 목록을 요청 순서대로 한 번에 역조회합니다."""
+    response.headers[VERSION_HEADER] = str(snapshot.version)
+    index = snapshot.contact_index
+    return ContactLookupBatchResponse(
+        phones=[
+            ContactLookupResult(query=phone, matches=index.by_phone(phone))
+            for phone in body.phones
+        ],
+        urls=[
+            ContactLookupResult(query=url, matches=index.by_url(url, body.url_scope))
+            for url in body.urls
+        ],
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=OrganizationBatchResponse,
+    summary="조직 경로/이름 일괄 조회",
+    description="""
+여러 조직을 한 번에 조회합니다. 모든 질의는 같은 데이터 버전에서 처리됩니다.
+
+- 각 질의는 `/organization/{path}`와 같은 규칙으로 찾습니다. (전체 경로, 경로 일부, 이름)
+- 결과는 요청의 `queries`와 같은 순서로 반환되며, 찾지 못한 항목은 `found: false`, `node: null`입니다.
+
+예시 요청:
+```json
+{"queries": ["단과대학/SW대학/컴퓨터공학부", "입학처", "없는조직"]}
+```
+""",
+)
+async def get_batch(
+    body: OrganizationBatchRequest,
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
 ):
-    structure = get_tukorea_structure()
-    return structure._search_by_name(structure.root, name)
+    """여러 조직 질의를 같은 스냅샷에서 처리해 요청 순서대로 반환합니다."""
+    return Response(
+        serialize_batch(snapshot, body.queries),
+        media_type=Config.Accept.JSON,
+        headers={VERSION_HEADER: str(snapshot.version)},
+    )
 
 
 @router.get(
@@ -66,18 +386,27 @@ async def search_by_name(
 """,
 )
 async def get_children(
+    request: Request,
     path: str = Path(..., description="조직 경로 (예: 단과대학/SW대학)"),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
 ):
-    structure = get_tukorea_structure()
+    structure = snapshot.structure
     result = structure.get_unit(path)
-    if isinstance(result, OrganizationGroup):
-        return result.as_list()
-    return []
+    if result is None or not structure.is_group(result):
+        return empty_list_response(request, snapshot)
+    # 노드 id는 스냅샷 안에서 고유하므로 별칭 경로도 같은 캐시를 공유
+    return organization_response(
+        request,
+        snapshot,
+        ("children", result),
+        lambda: serialize_nodes(structure, structure.children(result)),
+    )
 
 
 @router.get(
     "/{path:path}",
-    response_model=Union[OrganizationGroup, OrganizationUnit, list],
+    response_model=None,
+    responses=TREE_VIEW_RESPONSES,
     summary="조직 경로 기반 조회",
     description="""
 조직 경로(`/` 구분자 사용)를 기반으로 특정 조직 정보를 조회합니다.
@@ -85,6 +414,7 @@ async def get_children(
 - `Group`일 경우 하위 포함 구조로 반환
 - `Unit`일 경우 전화번호 및 URL 포함 정보 반환
 - 존재하지 않으면 404 에러 발생
+- `depth`, `fields`, `flat` 옵션은 `/organization/tree`와 같습니다.
 
 예시:
 - `/organization/단과대학/SW대학/컴퓨터공학부`
@@ -95,10 +425,20 @@ async def get_children(
 """,
 )
 async def get_organization(
+    request: Request,
     path: str = Path(..., description="조직 경로 (예: 단과대학/SW대학/컴퓨터공학부)"),
+    view: TreeView = Depends(get_tree_view),
+    snapshot: OrganizationSnapshot = Depends(get_organization_snapshot),
 ):
-    structure = get_tukorea_structure()
+    structure = snapshot.structure
     result = structure.get_unit(path)
     if result is None:
         raise HTTPException(status_code=404, detail="조직을 찾을 수 없습니다.")
-    return result
+    # 별칭 경로("컴퓨터공학부", "SW대학/컴퓨터공학부")도 같은 노드 캐시를 공유
+    return organization_response(
+        request,
+        snapshot,
+        ("node", result),
+        lambda: serialize_view(structure, result, view),
+        view,
+    )
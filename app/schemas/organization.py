@@ -0,0 +1,138 @@
+"""조직 API 요청/응답 스키마"""
+
+from typing import List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from app.config import Config
+from app.utils.university_structure import OrganizationGroup, OrganizationUnit
+
+
+class AutocompleteItem(BaseModel):
+    """조직 이름 자동완성 결과
+
+    Attributes:
+        name (str): 조직 이름
+        path (str): 조직 전체 경로 (`/organization/{path}`로 조회 가능)
+        type (Literal["unit", "group"]): 조직 종류
+    """
+
+    name: str
+    path: str
+    type: Literal["unit", "group"]
+
+
+class ContactMatch(BaseModel):
+    """전화번호/URL 역조회 결과 조직
+
+    Attributes:
+        name (str): 조직 이름
+        path (str): 조직 전체 경로
+        phone (Optional[str]): 전화번호
+        url (Optional[str]): URL, 홈페이지 주소
+    """
+
+    name: str
+    path: str
+    phone: Optional[str] = None
+    url: Optional[str] = None
+
+
+class ContactLookupBatchRequest(BaseModel):
+    """전화번호/URL 일괄 역조회 요청
+
+    Attributes:
+        phones (List[str]): 조회할 전화번호 목록
+        urls (List[str]): 조회할 URL 목록
+        url_scope (Literal["page", "host"]): URL 비교 범위
+    """
+
+    phones: List[str] = Field(
+        default_factory=list, max_length=Config.LOOKUP_BATCH_MAX_ITEMS
+    )
+    urls: List[str] = Field(
+        default_factory=list, max_length=Config.LOOKUP_BATCH_MAX_ITEMS
+    )
+    url_scope: Literal["page", "host"] = "page"
+
+
+class ContactLookupResult(BaseModel):
+    """역조회 질의 하나의 결과
+
+    Attributes:
+        query (str): 요청에 담긴 원래 값
+        matches (List[ContactMatch]): 해당 조직 목록 (없으면 빈 리스트)
+    """
+
+    query: str
+    matches: List[ContactMatch]
+
+
+class ContactLookupBatchResponse(BaseModel):
+    """전화번호/URL 일괄 역조회 응답 (요청 순서와 같은 위치에 결과가 옴)
+
+    Attributes:
+        phones (List[ContactLookupResult]): 전화번호별 결과
+        urls (List[ContactLookupResult]): URL별 결과
+    """
+
+    phones: List[ContactLookupResult]
+    urls: List[ContactLookupResult]
+
+
+class OrganizationFlatItem(BaseModel):
+    """`flat=true` 조직 응답의 항목 (`fields`로 고른 필드만 포함)
+
+    Attributes:
+        path (str): 조직 전체 경로
+        type (Optional[Literal["unit", "group"]]): 조직 종류
+        name (Optional[str]): 조직 이름
+        phone (Optional[str]): 전화번호 (유닛만)
+        url (Optional[str]): URL, 홈페이지 주소 (유닛만)
+    """
+
+    path: str
+    type: Optional[Literal["unit", "group"]] = None
+    name: Optional[str] = None
+    phone: Optional[str] = None
+    url: Optional[str] = None
+
+
+class OrganizationBatchRequest(BaseModel):
+    """조직 일괄 조회 요청
+
+    Attributes:
+        queries (List[str]): 조회할 조직 경로 또는 이름 목록
+            (`/organization/{path}`와 같은 규칙, 예: "단과대학/SW대학", "입학처")
+    """
+
+    queries: List[str] = Field(
+        default_factory=list, max_length=Config.ORGANIZATION_BATCH_MAX_ITEMS
+    )
+
+
+class OrganizationBatchItem(BaseModel):
+    """일괄 조회 질의 하나의 결과
+
+    Attributes:
+        query (str): 요청에 담긴 원래 값
+        found (bool): 조직을 찾았는지 여부
+        path (Optional[str]): 찾은 조직의 전체 경로 (없으면 null)
+        node (Optional[Union[OrganizationGroup, OrganizationUnit]]):
+            찾은 조직 (`/organization/{path}` 응답과 같은 형식, 없으면 null)
+    """
+
+    query: str
+    found: bool
+    path: Optional[str] = None
+    node: Optional[Union[OrganizationGroup, OrganizationUnit]] = None
+
+
+class OrganizationBatchResponse(BaseModel):
+    """조직 일괄 조회 응답 (요청의 `queries`와 같은 위치에 결과가 옴)
+
+    Attributes:
+        results (List[OrganizationBatchItem]): 질의별 결과
+    """
+
+    results: List[OrganizationBatchItem]
@@ -0,0 +1,82 @@
+"""동시 실행 개수를 제한하면서 순서를 유지하는 비동기 fan-out 유틸리티
+
+`map_bounded`는 입력 순서대로 결과를 내보내면서 최대 `limit`개의 작업만 동시에
+실행합니다. 앞쪽 결과를 소비하는 즉시 다음 작업을 시작하므로 메모리에 쌓이는 결과도
+`limit`개를 넘지 않습니다. 작업 하나가 실패하거나 소비자가 중간에 멈추면 남은 작업은
+모두 취소됩니다.
+"""
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+from app.config import Config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+async def _cancel_all(tasks: Iterable[asyncio.Task]):
+    """작업을 취소하고 실제로 끝날 때까지 기다립니다."""
+    tasks = list(tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def map_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = Config.IMAGE_FETCH_CONCURRENCY,
+) -> AsyncIterator[R]:
+    """items 각각에 func를 동시에 실행하고 결과를 입력 순서대로 내보냅니다.
+
+    Args:
+        func (Callable[[T], Awaitable[R]]): 항목 하나를 처리하는 코루틴 함수
+        items (Iterable[T]): 처리할 항목
+        limit (int): 동시에 실행할 최대 작업 수
+
+    Yields:
+        R: 입력 순서대로의 결과
+
+    Raises:
+        Exception: func에서 발생한 첫 번째 예외 (남은 작업은 취소됨)
+    """
+    pending = iter(items)
+    window: deque[asyncio.Task] = deque()
+
+    def fill():
+        while len(window) < max(limit, 1):
+            item = next(pending, _DONE)
+            if item is _DONE:
+                return
+            window.append(asyncio.create_task(func(item)))
+
+    try:
+        fill()
+        while window:
+            head = window[0]
+            # 앞 작업을 기다리는 동안 뒤 작업이 먼저 실패해도 바로 멈추도록 함께 기다림
+            while not head.done():
+                done, _ = await asyncio.wait(
+                    window, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        raise task.exception()
+            window.popleft()
+            fill()
+            yield head.result()
+    finally:
+        await _cancel_all(window)
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = Config.IMAGE_FETCH_CONCURRENCY,
+) -> list[R]:
+    """`map_bounded`의 결과를 입력 순서대로 리스트로 모아 반환합니다."""
+    return [result async for result in map_bounded(func, items, limit)]
@@ -0,0 +1,125 @@
+"""비동기 로더 결과를 캐시하는 TTL 캐시 모듈
+
+- TTL 이내: 캐시된 값을 바로 반환
+- TTL 경과 후 stale_ttl 이내: 이전 값을 바로 반환하고 백그라운드에서 갱신
+  (stale-while-revalidate)
+- 그 이후 또는 값이 없음: 로더를 호출해 새 값을 기다림
+
+같은 키에 대해 동시에 들어온 갱신 요청은 로더 호출 하나로 합쳐집니다(single-flight).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from app.config import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    """캐시 조회 카운터
+
+    Attributes:
+        hits (int): 캐시된 값을 바로 반환한 횟수 (stale 포함)
+        misses (int): 값을 불러올 때까지 기다린 횟수
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    fetched_at: float
+
+
+class AsyncTTLCache(Generic[T]):
+    """stale-while-revalidate와 single-flight를 지원하는 비동기 TTL 캐시"""
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, name: str = "cache"):
+        """AsyncTTLCache를 초기화합니다.
+
+        Args:
+            ttl (float): 값을 신선하다고 보는 시간(초)
+            stale_ttl (float): TTL 이후 갱신을 기다리지 않고 이전 값을 반환할 시간(초)
+            name (str): 로그에 표시할 캐시 이름
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self._entries: Dict[Hashable, _Entry[T]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = CacheStats()
+
+    def peek(self, key: Hashable) -> Optional[T]:
+        """만료 여부와 관계없이 캐시된 값을 반환합니다. (없으면 None)"""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: Hashable, value: T):
+        """값을 직접 저장합니다."""
+        self._entries[key] = _Entry(value=value, fetched_at=time.monotonic())
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """key(없으면 전체)의 캐시를 비웁니다."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        try:
+            value = await loader()
+            self.set(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _start_refresh(
+        self, key: Hashable, loader: Callable[[], Awaitable[T]]
+    ) -> asyncio.Task:
+        """진행 중인 갱신이 있으면 그 작업을, 없으면 새 작업을 반환합니다."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader))
+            task.add_done_callback(self._on_done)
+            self._inflight[key] = task
+        return task
+
+    def _on_done(self, task: asyncio.Task):
+        # 기다리는 호출자가 없어도 예외가 기록되도록 여기서 확인
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"[{self.name}] 갱신 실패: {task.exception()}")
+
+    async def refresh(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """TTL과 관계없이 값을 새로 불러옵니다. (동시 호출은 하나로 합쳐짐)"""
+        # 호출자가 취소되어도 다른 대기자가 공유하는 작업은 취소되지 않도록 shield
+        return await asyncio.shield(self._start_refresh(key, loader))
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """캐시된 값을 반환하고, 필요하면 loader로 갱신합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+            loader (Callable[[], Awaitable[T]]): 값을 새로 불러오는 코루틴 함수
+
+        Returns:
+            T: 캐시된 값 또는 새로 불러온 값
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self.ttl:
+                self.stats.hits += 1
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self._start_refresh(key, loader)  # 실패하면 이전 값을 계속 사용
+                self.stats.hits += 1
+                return entry.value
+
+        self.stats.misses += 1
+        return await self.refresh(key, loader)
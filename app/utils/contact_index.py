@@ -0,0 +1,144 @@
+"""전화번호/URL로 조직을 역조회하는 인덱스 모듈
+
+school_info.json의 `phone`, `url` 값을 정규화한 키로 해시 인덱스를 만듭니다.
+같은 번호나 같은 페이지를 여러 조직이 함께 쓰는 경우가 있으므로
+(예: 교무팀과 교육기획팀은 모두 03180410013) 모든 조직을 반환합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional
+from urllib.parse import urlsplit
+
+from app.schemas.organization import ContactMatch
+from app.utils.university_structure import UniversityStructure
+
+# 국가번호(82)가 붙은 번호의 최소 자릿수 (82 + 앞의 0을 뺀 9자리 이상)
+INTERNATIONAL_PHONE_MIN_DIGITS = 11
+
+
+def normalize_phone(phone: str) -> str:
+    """전화번호를 숫자만 남긴 국내 형식으로 정규화합니다.
+
+    예) "031-8041-0013", "+82 31 8041 0013", "+82 (0)31-8041-0013" -> "03180410013"
+    """
+    digits = "".join(char for char in phone if char.isdigit())
+    if phone.lstrip().startswith("+82") or (
+        digits.startswith("82") and len(digits) >= INTERNATIONAL_PHONE_MIN_DIGITS
+    ):
+        digits = digits[2:]
+        if not digits.startswith("0"):
+            digits = "0" + digits
+    return digits
+
+
+@dataclass(frozen=True)
+class UrlKey:
+    """정규화된 URL 키
+
+    Attributes:
+        host (str): 소문자, `www.`와 기본 포트를 제거한 호스트
+        page (str): host + path(+query), 마지막 `/` 제거
+        fragment (str): `#` 뒤 앵커 (없으면 빈 문자열)
+    """
+
+    host: str
+    page: str
+    fragment: str
+
+
+def normalize_url(url: str) -> Optional[UrlKey]:
+    """URL을 scheme/`www.`/끝 `/` 차이에 무관한 키로 정규화합니다.
+
+    Returns:
+        Optional[UrlKey]: 호스트를 알 수 없으면 None
+    """
+    url = url.strip()
+    if "://" not in url and not url.startswith("//"):
+        url = "//" + url
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:  # 잘못된 포트 등
+        return None
+
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if not host:
+        return None
+    if port not in (None, 80, 443):
+        host = f"{host}:{port}"
+
+    page = host + parts.path.rstrip("/")
+    if parts.query:
+        page = f"{page}?{parts.query}"
+    return UrlKey(host=host, page=page, fragment=parts.fragment)
+
+
+class ContactIndex:
+    """전화번호/URL -> 조직 해시 인덱스"""
+
+    def __init__(self, units: List[ContactMatch]):
+        """조직 목록으로 인덱스를 구성합니다. (목록 순서가 결과 순서가 됨)"""
+        self._by_phone: Dict[str, List[ContactMatch]] = {}
+        self._by_page: Dict[str, List[ContactMatch]] = {}
+        self._by_host: Dict[str, List[ContactMatch]] = {}
+        # page 결과 안에서 앵커가 같은 조직만 고를 때 사용
+        self._fragments: Dict[int, str] = {}
+
+        for unit in units:
+            if unit.phone:
+                phone = normalize_phone(unit.phone)
+                if phone:
+                    self._by_phone.setdefault(phone, []).append(unit)
+            if unit.url:
+                key = normalize_url(unit.url)
+                if key is not None:
+                    self._by_page.setdefault(key.page, []).append(unit)
+                    self._by_host.setdefault(key.host, []).append(unit)
+                    self._fragments[id(unit)] = key.fragment
+
+    @classmethod
+    def from_structure(cls, structure: UniversityStructure) -> "ContactIndex":
+        """조직 구조의 모든 유닛으로 인덱스를 만듭니다."""
+        units = [
+            ContactMatch(
+                name=structure.name_of(node),
+                path=structure.path_of(node),
+                phone=structure.phone_of(node),
+                url=structure.url_of(node),
+            )
+            for node in structure.units()
+            if node != structure.root
+        ]
+        return cls(units)
+
+    def by_phone(self, phone: str) -> List[ContactMatch]:
+        """전화번호를 쓰는 모든 조직을 반환합니다."""
+        return list(self._by_phone.get(normalize_phone(phone), []))
+
+    def by_url(
+        self, url: str, scope: Literal["page", "host"] = "page"
+    ) -> List[ContactMatch]:
+        """URL에 해당하는 조직을 반환합니다.
+
+        Args:
+            url (str): 조회할 URL (scheme 생략 가능)
+            scope (Literal["page", "host"]):
+                page - 같은 페이지(host + path)의 조직, URL에 앵커가 있고 앵커까지
+                같은 조직이 있으면 그 조직만 반환
+                host - 같은 호스트의 모든 조직
+
+        Returns:
+            List[ContactMatch]: 해당 조직 목록
+        """
+        key = normalize_url(url)
+        if key is None:
+            return []
+        if scope == "host":
+            return list(self._by_host.get(key.host, []))
+
+        matches = self._by_page.get(key.page, [])
+        if key.fragment:
+            exact = [m for m in matches if self._fragments[id(m)] == key.fragment]
+            if exact:
+                return exact
+        return list(matches)
@@ -0,0 +1,89 @@
+"""미리 직렬화된 응답 본문과 HTTP 조건부 요청(ETag) 처리를 위한 모듈"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.config import Config
+
+
+def make_etag(body: bytes) -> str:
+    """본문 내용 해시로 강한(strong) ETag를 만듭니다."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 주어진 ETag와 일치하는지 확인합니다.
+
+    RFC 9110에 따라 If-None-Match는 약한 비교를 사용하므로 `W/` 접두사는 무시합니다.
+
+    Args:
+        if_none_match (Optional[str]): 요청의 If-None-Match 헤더 값
+        etag (str): 현재 표현의 ETag
+
+    Returns:
+        bool: 일치하는 ETag가 있거나 `*`이면 True
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """직렬화가 끝난 불변 응답 본문
+
+    Attributes:
+        body (bytes): 응답 본문
+        etag (str): 본문 해시 기반 강한 ETag
+        media_type (str): 응답 Content-Type
+    """
+
+    body: bytes
+    etag: str
+    media_type: str = Config.Accept.JSON
+
+    @classmethod
+    def from_bytes(cls, body: bytes, media_type: str = Config.Accept.JSON):
+        """본문으로부터 ETag를 계산해 CachedBody를 만듭니다."""
+        return cls(body=body, etag=make_etag(body), media_type=media_type)
+
+
+def cached_response(
+    request: Request,
+    cached: CachedBody,
+    cache_control: str,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """캐시된 본문으로 응답을 만들고, If-None-Match가 일치하면 304를 반환합니다.
+
+    Args:
+        request (Request): 현재 요청
+        cached (CachedBody): 미리 직렬화된 본문
+        cache_control (str): Cache-Control 헤더 값
+        headers (Optional[Mapping[str, str]]): 추가로 붙일 헤더
+
+    Returns:
+        Response: 200 응답 또는 본문 없는 304 응답
+    """
+    response_headers = {"ETag": cached.etag, "Cache-Control": cache_control}
+    if headers:
+        response_headers.update(headers)
+
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(
+            status_code=Config.HttpStatus.NOT_MODIFIED, headers=response_headers
+        )
+    return Response(
+        content=cached.body, media_type=cached.media_type, headers=response_headers
+    )
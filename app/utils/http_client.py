@@ -0,0 +1,62 @@
+"""업스트림(iBook) 요청에 공용으로 사용하는 HTTP 클라이언트 모듈
+
+커넥션 풀을 공유하는 `httpx.AsyncClient` 하나를 FastAPI lifespan에서 만들어
+`app.state.http_client`에 두고 종료 시 닫습니다. 연결 수, keep-alive, HTTP/2,
+단계별 타임아웃은 Config로 설정합니다.
+"""
+
+import importlib.util
+
+import httpx
+from fastapi import Request
+
+from app.config import Config, logger
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 사용 여부 (h2 패키지가 없으면 경고 후 HTTP/1.1 사용)"""
+    if not Config.HTTP2_ENABLED:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("[HttpClient] h2 패키지가 없어 HTTP/1.1로 동작합니다.")
+        return False
+    return True
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Config 설정으로 새 AsyncClient를 만듭니다."""
+    return httpx.AsyncClient(
+        http2=_http2_enabled(),
+        limits=httpx.Limits(
+            max_connections=Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=Config.HTTP_CONNECT_TIMEOUT,
+            read=Config.HTTP_READ_TIMEOUT,
+            write=Config.HTTP_WRITE_TIMEOUT,
+            pool=Config.HTTP_POOL_TIMEOUT,
+        ),
+    )
+
+
+def open_http_client() -> httpx.AsyncClient:
+    """프로세스 공용 클라이언트를 만듭니다. (lifespan 시작 시 호출)"""
+    client = create_http_client()
+    logger.info("[HttpClient] 공용 HTTP 클라이언트 생성")
+    return client
+
+
+async def close_http_client(client: httpx.AsyncClient):
+    """공용 클라이언트의 연결을 모두 닫습니다. (lifespan 종료 시 호출)"""
+    await client.aclose()
+    logger.info("[HttpClient] 공용 HTTP 클라이언트 종료")
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """lifespan이 만든 공용 클라이언트를 반환 (FastAPI 의존성으로 사용)"""
+    client = getattr(request.app.state, "http_client", None)
+    if client is None:
+        raise RuntimeError("공용 HTTP 클라이언트가 아직 생성되지 않았습니다.")
+    return client
@@ -0,0 +1,277 @@
+"""디스크 캐시 파일을 HTTP Range 요청에 맞춰 보내는 모듈
+
+- `Range: bytes=...`의 단일/다중 범위(multipart/byteranges)와 접미 범위(`-500`)
+- `If-Range`가 현재 ETag(또는 Last-Modified)와 다르면 전체 본문
+- `If-None-Match`가 일치하면 304
+- 범위를 만족할 수 없으면 416
+
+범위 응답은 파일을 메모리 매핑(mmap)해 필요한 구간만 잘라 보내므로 다시 받거나
+파일 전체를 읽지 않습니다. 파일 열기와 매핑은 응답을 시작하기 전에 스레드에서 하므로,
+그 사이 파일이 정리되면 호출한 쪽에 `FileNotFoundError`가 전달되어 다른 방법으로
+응답할 수 있습니다. Range 헤더가 없는 요청은 `FileResponse`로 보냅니다.
+"""
+
+import asyncio
+import mmap
+import os
+import secrets
+from email.utils import formatdate
+from typing import Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.config import Config
+from app.utils.http_cache import etag_matches
+
+CHUNK_SIZE = 64 * 1024
+
+Ranges = list[tuple[int, int]]  # [start, end) 구간 목록
+
+
+class RangeNotSatisfiableError(Exception):
+    """요청한 범위가 모두 파일 밖에 있는 경우"""
+
+
+def parse_range(header: str, size: int) -> Optional[Ranges]:
+    """Range 헤더를 [start, end) 구간 목록으로 해석합니다.
+
+    Args:
+        header (str): Range 헤더 값 (예: "bytes=0-99,200-")
+        size (int): 전체 길이
+
+    Returns:
+        Optional[Ranges]: 겹치는 구간을 합친 목록,
+            bytes 단위가 아니거나 문법이 잘못되면 None (RFC 9110에 따라 전체 응답)
+
+    Raises:
+        RangeNotSatisfiableError: 만족할 수 있는 구간이 하나도 없는 경우
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges: Ranges = []
+    for part in spec.split(","):
+        first, sep, last = part.strip().partition("-")
+        if not sep or not (first.isdigit() or last.isdigit()):
+            return None
+        if not first:  # 접미 범위: 마지막 N바이트
+            length = int(last)
+            if length == 0 or size == 0:
+                continue
+            ranges.append((max(size - length, 0), size))
+            continue
+        start = int(first)
+        end = int(last) + 1 if last else size
+        if last and end <= start:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size)))
+
+    if not ranges:
+        raise RangeNotSatisfiableError()
+    return _merge(ranges)
+
+
+def _merge(ranges: Ranges) -> Ranges:
+    """겹치거나 맞닿은 구간을 합쳐 정렬된 목록으로 반환합니다."""
+    ranges = sorted(ranges)
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _multipart_parts(
+    ranges: Ranges, size: int, media_type: str
+) -> tuple[list[tuple[bytes, int, int]], bytes, str, int]:
+    """multipart/byteranges 본문의 구성 요소와 전체 길이를 계산합니다.
+
+    Args:
+        ranges (Ranges): 보낼 구간 (2개 이상)
+        size (int): 파일 크기
+        media_type (str): 파일의 Content-Type
+
+    Returns:
+        tuple: (파트별 (머리, start, end) 목록, 끝 경계, Content-Type, 본문 길이)
+    """
+    boundary = secrets.token_hex(16)
+    parts = []
+    for start, end in ranges:
+        head = (
+            f"--{boundary}\r\nContent-Type: {media_type}\r\n"
+            f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n"
+        ).encode("latin-1")
+        parts.append((head, start, end))
+    tail = f"\r\n--{boundary}--\r\n".encode("latin-1")
+    length = (
+        sum(len(head) + end - start for head, start, end in parts)
+        + len(tail)
+        + 2 * (len(parts) - 1)
+    )
+    return parts, tail, f"multipart/byteranges; boundary={boundary}", length
+
+
+def if_range_allows(if_range: Optional[str], etag: str, last_modified: str) -> bool:
+    """If-Range 조건을 만족해 범위 응답을 해도 되는지 확인합니다. (강한 비교)"""
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        return not if_range.startswith("W/") and if_range == etag
+    return if_range == last_modified
+
+
+def _map_file(path: str) -> Optional[mmap.mmap]:
+    """파일을 읽기 전용으로 메모리 매핑합니다. (빈 파일은 매핑할 수 없어 None)"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class MmapRangeResponse(Response):
+    """메모리 매핑한 파일에서 범위만 잘라 보내는 응답"""
+
+    def __init__(
+        self,
+        mapped: Optional[mmap.mmap],
+        size: int,
+        ranges: Optional[Ranges],
+        media_type: str,
+        headers: Mapping[str, str],
+    ):
+        """MmapRangeResponse를 초기화합니다.
+
+        Args:
+            mapped (Optional[mmap.mmap]): 미리 매핑한 파일 (응답을 보낸 뒤 닫음)
+            size (int): 파일 크기
+            ranges (Optional[Ranges]): 보낼 구간, None이면 전체(200)
+            media_type (str): 파일의 Content-Type
+            headers (Mapping[str, str]): 추가 헤더
+        """
+        super().__init__(headers=headers)
+        self.mapped = mapped
+        self.size = size
+        self.parts: list[tuple[bytes, int, int]] = []
+
+        if ranges is None:
+            self.status_code = Config.HttpStatus.OK
+            self.parts = [(b"", 0, size)]
+            self.headers["content-type"] = media_type
+            length = size
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.status_code = Config.HttpStatus.PARTIAL_CONTENT
+            self.parts = [(b"", start, end)]
+            self.headers["content-type"] = media_type
+            self.headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+            length = end - start
+        else:
+            self.status_code = Config.HttpStatus.PARTIAL_CONTENT
+            self.parts, self.tail, content_type, length = _multipart_parts(
+                ranges, size, media_type
+            )
+            self.headers["content-type"] = content_type
+        self.headers["content-length"] = str(length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """응답을 보내고 매핑을 닫습니다."""
+        try:
+            await self._send_ranges(scope, send)
+        finally:
+            if self.mapped is not None:
+                self.mapped.close()
+
+    async def _send_ranges(self, scope: Scope, send: Send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        mapped = self.mapped
+        if scope["method"].upper() == "HEAD" or mapped is None:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        multipart = len(self.parts) > 1
+        for index, (head, start, end) in enumerate(self.parts):
+            if index:
+                await self._send(send, b"\r\n")
+            if head:
+                await self._send(send, head)
+            for offset in range(start, end, CHUNK_SIZE):
+                await self._send(send, mapped[offset : min(offset + CHUNK_SIZE, end)])
+        if multipart:
+            await self._send(send, self.tail)
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    async def _send(send: Send, body: bytes):
+        await send({"type": "http.response.body", "body": body, "more_body": True})
+
+
+async def ranged_file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    etag: str,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """캐시 파일을 조건부/범위 요청을 처리해 보내는 응답을 만듭니다.
+
+    Args:
+        request (Request): 현재 요청
+        path (str): 보낼 파일 경로 (내용이 바뀌지 않는 content-addressed 파일)
+        media_type (str): 파일의 Content-Type
+        etag (str): 파일 내용에 대한 강한 ETag
+        headers (Optional[Mapping[str, str]]): 추가 헤더 (Content-Disposition 등)
+
+    Returns:
+        Response: 200, 206, 304, 416 중 하나
+
+    Raises:
+        FileNotFoundError: 응답을 만들기 전에 파일이 정리된 경우
+    """
+    stat = await asyncio.to_thread(os.stat, path)
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+    response_headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        **(headers or {}),
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=Config.HttpStatus.NOT_MODIFIED, headers=response_headers
+        )
+
+    range_header = request.headers.get("range")
+    if range_header is None or request.method not in ("GET", "HEAD"):
+        return FileResponse(
+            path, media_type=media_type, headers=response_headers, stat_result=stat
+        )
+
+    ranges = None
+    if if_range_allows(request.headers.get("if-range"), etag, last_modified):
+        try:
+            ranges = parse_range(range_header, stat.st_size)
+        except RangeNotSatisfiableError:
+            return Response(
+                status_code=Config.HttpStatus.RANGE_NOT_SATISFIABLE,
+                headers={
+                    **response_headers,
+                    "Content-Range": f"bytes */{stat.st_size}",
+                },
+            )
+    mapped = await asyncio.to_thread(_map_file, path)
+    return MmapRangeResponse(mapped, stat.st_size, ranges, media_type, response_headers)
@@ -1,9 +1,35 @@
 import os
 import json
-from typing import Optional
+import time
+import asyncio
+import hashlib
+import argparse
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterable, Optional
+from urllib.parse import urljoin
 from xml.etree import ElementTree
 import httpx
-from app.config.config import logger
+from app.config.config import Config, logger
+from app.utils.aio import gather_bounded
+from app.utils.http_client import create_http_client
+from app.utils.metrics import Family, observe_upstream
+from app.utils.resilience import (
+    CircuitBreaker,
+    LatencyTracker,
+    ResilienceStats,
+    RetryBudget,
+    UpstreamPolicy,
+    backoff_delay,
+    hedged,
+)
+
+# 다운로드 본문을 받는 단위와, 모아서 디스크에 한 번에 쓰는 크기
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+# 책 전체를 받을 때 파일별 URL/검증자/내용 해시를 기록하는 파일 (다음 실행 때 재사용)
+MANIFEST_FILE = ".ibook-manifest.json"
 
 
 class FetchError(Exception):
@@ -15,6 +41,144 @@ class FetchError(Exception):
         super().__init__(self.message)
 
 
+class CircuitOpenError(FetchError):
+    """서킷이 열려 있어 업스트림에 요청을 보내지 않은 경우"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            None, f"iBook 서킷이 열려 있습니다. ({retry_after:.0f}초 후 재시도)"
+        )
+        self.retry_after = retry_after
+
+
+def _retryable(status_code: int) -> bool:
+    """업스트림 장애로 보고 재시도할 상태 코드인지 여부"""
+    return (
+        status_code >= Config.HttpStatus.INTERNAL_SERVER_ERROR
+        or status_code == Config.HttpStatus.TOO_MANY_REQUESTS
+    )
+
+
+@dataclass
+class _Validators:
+    """업스트림 응답의 검증자와 내용 해시 (304 응답 시 재사용)"""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: str
+    body: Optional[bytes]
+
+
+@dataclass
+class ConditionalStats:
+    """조건부 요청 결과 카운터
+
+    Attributes:
+        downloaded (int): 내용이 바뀌었거나 처음 받은 횟수
+        not_modified (int): 업스트림이 304로 응답한 횟수
+        unchanged (int): 검증자 없이 받았지만 내용 해시가 같았던 횟수
+        skipped (int): 검증자가 같은 파일이 이미 있어 본문을 받지 않은 횟수
+    """
+
+    downloaded: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+
+@dataclass
+class DownloadSummary:
+    """파일 다운로드 결과
+
+    Attributes:
+        downloaded (int): 새로 받아 저장한 파일 수
+        skipped (int): 같은 파일이 이미 있어 건너뛴 파일 수
+        failed (int): 받지 못한 파일 수
+        files (dict[str, str]): 저장했거나 이미 있던 파일 이름 -> URL
+    """
+
+    downloaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    files: dict[str, str] = field(default_factory=dict)
+
+
+def _same_validators(previous: _Validators, headers: httpx.Headers) -> bool:
+    """응답의 강한 ETag나 Last-Modified가 이전에 기록한 값과 같은지 여부"""
+    etag = headers.get("etag")
+    if etag and previous.etag and not etag.startswith("W/"):
+        return etag == previous.etag
+    last_modified = headers.get("last-modified")
+    return bool(last_modified) and last_modified == previous.last_modified
+
+
+def _file_digest(path: str) -> Optional[tuple[int, str]]:
+    """파일 크기와 SHA-256 해시를 반환합니다. (파일이 없으면 None)"""
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "rb") as f:
+            while block := f.read(WRITE_BUFFER_SIZE):
+                hasher.update(block)
+                size += len(block)
+    except FileNotFoundError:
+        return None
+    return size, hasher.hexdigest()
+
+
+def _write_chunks(f, hasher, chunks: list[bytes]):
+    for chunk in chunks:
+        hasher.update(chunk)
+    f.writelines(chunks)
+
+
+async def _stream_to_file(response: httpx.Response, path: str) -> str:
+    """응답 본문을 같은 디렉터리의 임시 파일에 쓴 뒤 rename 하고 내용 해시를 반환합니다.
+
+    청크를 WRITE_BUFFER_SIZE만큼 모아 스레드에서 쓰므로 메모리 사용량은 파일 크기와
+    무관하고, 디스크 쓰기가 이벤트 루프를 막지 않습니다. 도중에 실패하면 임시 파일을
+    지우므로 path에는 이전 파일이나 완성된 파일만 남습니다.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    hasher = hashlib.sha256()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            buffer: list[bytes] = []
+            buffered = 0
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= WRITE_BUFFER_SIZE:
+                    await asyncio.to_thread(_write_chunks, f, hasher, buffer)
+                    buffer, buffered = [], 0
+            await asyncio.to_thread(_write_chunks, f, hasher, buffer)
+        await asyncio.to_thread(os.replace, tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return hasher.hexdigest()
+
+
+def _load_manifest(directory: str) -> dict:
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_manifest(directory: str, manifest: dict):
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, os.path.join(directory, MANIFEST_FILE))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 class BookDownloader:
     """한국공학대학교 iBook에서 파일을 비동기로 다운로드하는 클래스입니다."""
 
@@ -23,12 +187,37 @@ class BookDownloader:
         url: str = "https://ibook.tukorea.ac.kr/Viewer/menu02",
         file_list_url: str = "https://ibook.tukorea.ac.kr/web/RawFileList",
         image_save_path: str = "images",
+        client: Optional[httpx.AsyncClient] = None,
+        policy: Optional[UpstreamPolicy] = None,
     ):
+        """BookDownloader를 초기화합니다.
+
+        Args:
+            url (str): iBook 뷰어 페이지 URL
+            file_list_url (str): 첨부파일 목록 API URL
+            image_save_path (str): 이미지 저장 경로
+            client (Optional[httpx.AsyncClient]): 공용 HTTP 클라이언트,
+                없으면 메서드 호출마다 임시 클라이언트를 만들어 사용
+            policy (Optional[UpstreamPolicy]): 헤지/재시도/서킷 정책,
+                없으면 Config 설정 사용
+        """
         self.url = url
+        self.client = client
         self.file_list_url = file_list_url
         self.image_save_path = image_save_path
         self.bookcode = None
         self.file_name = None
+        self.stats = ConditionalStats()
+        self._validators: dict[str, _Validators] = {}
+        self.policy = policy or UpstreamPolicy.from_config()
+        self.latency = LatencyTracker()
+        self.budget = RetryBudget(
+            self.policy.budget_ratio, self.policy.budget_min_per_second
+        )
+        self.breaker = CircuitBreaker(
+            self.policy.breaker_failures, self.policy.breaker_cooldown
+        )
+        self.resilience = ResilienceStats()
         self.headers = {
             "Accept": "*/*",
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -37,35 +226,199 @@ class BookDownloader:
             "X-Requested-With": "XMLHttpRequest",
         }
 
-    async def fetch_bookcode(self):
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.url, timeout=10)
-            if response.status_code != 200:
-                raise FetchError(response.status_code, "bookcode 요청 실패")
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """공용 클라이언트가 있으면 그대로, 없으면 임시 클라이언트를 제공합니다."""
+        if self.client is not None:
+            yield self.client
+            return
+        async with create_http_client() as client:
+            yield client
+
+    def _spend_budget(self) -> bool:
+        if self.budget.try_spend():
+            return True
+        self.resilience.budget_exhausted += 1
+        return False
+
+    def _allow_hedge(self) -> bool:
+        if not self._spend_budget():
+            return False
+        self.resilience.hedges += 1
+        return True
+
+    def _hedge_delay(self) -> Optional[float]:
+        """최근 성공 응답 시간의 분위수로 정한 헤지 지연 (헤지 안 하면 None)"""
+        if self.policy.hedge_quantile <= 0:
+            return None
+        delay = self.latency.quantile(self.policy.hedge_quantile)
+        if delay is None:
+            return self.policy.hedge_default_delay
+        return max(self.policy.hedge_min_delay, delay)
+
+    async def _backoff(self, attempt: int) -> bool:
+        """attempt번째(1부터) 재시도가 허용되면 백오프만큼 기다린 뒤 True, 아니면 False"""
+        if attempt > self.policy.max_retries or not self._spend_budget():
+            return False
+        self.resilience.retries += 1
+        await asyncio.sleep(
+            backoff_delay(
+                attempt, self.policy.retry_base_delay, self.policy.retry_max_delay
+            )
+        )
+        return True
+
+    def _check_breaker(self):
+        if not self.breaker.allow():
+            self.resilience.short_circuited += 1
+            raise CircuitOpenError(self.breaker.retry_after())
+
+    async def _get(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        """멱등 GET을 헤지/재시도/서킷 정책에 따라 보냅니다.
+
+        응답이 느리면 헤지 요청을 보내고, 연결 오류나 5xx/429 응답은 full jitter
+        백오프로 재시도합니다. 헤지와 재시도는 모두 재시도 예산을 씁니다.
 
-            for line in response.text.splitlines():
-                if "var bookcode =" in line:
-                    self.bookcode = line.split("=")[1].strip().strip(";").strip("'")
-                    logger.info(f"[BookDownloader] bookcode: {self.bookcode}")
-                    return self.bookcode
+        Returns:
+            httpx.Response: 마지막 응답 (상태 코드 확인은 호출자가 함)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 요청을 보내지 않은 경우
+            httpx.TransportError: 재시도 후에도 연결에 실패한 경우
+        """
+        attempt = 0
+        while True:
+            self._check_breaker()
+            self.budget.deposit()
+            started = time.perf_counter()
+            response: Optional[httpx.Response] = None
+            try:
+                async with self._client() as client:
+                    response, hedge_won = await hedged(
+                        lambda: client.get(url, headers=headers),
+                        self._hedge_delay(),
+                        self._allow_hedge,
+                    )
+            except httpx.TransportError as e:
+                error = e
+            else:
+                if not _retryable(response.status_code):
+                    self.breaker.record_success()
+                    self.latency.observe(time.perf_counter() - started)
+                    self.resilience.hedge_wins += hedge_won
+                    return response
+
+            self.breaker.record_failure()
+            attempt += 1
+            if not await self._backoff(attempt):
+                if response is not None:
+                    return response
+                raise error
+
+    async def _conditional_get(
+        self,
+        url: str,
+        message: str,
+        headers: Optional[dict] = None,
+        keep_body: bool = True,
+        conditional: bool = True,
+    ) -> tuple[Optional[bytes], str]:
+        """이전 응답의 검증자로 조건부 GET을 보냅니다.
+
+        ETag/Last-Modified가 있으면 If-None-Match/If-Modified-Since를 보내고,
+        304 응답이면 이전 본문을 재사용합니다. 검증자가 없으면 전체를 받은 뒤
+        내용 해시로 변경 여부를 판단합니다. 서킷이 열려 있으면 요청 없이
+        마지막으로 받은 내용을 304와 같이 재사용합니다.
+
+        Args:
+            url (str): 요청 URL
+            message (str): 실패 시 FetchError 메시지
+            headers (Optional[dict]): 추가 요청 헤더
+            keep_body (bool): 304 응답에 재사용할 본문을 보관할지 여부
+            conditional (bool): False면 검증자를 보내지 않음
+
+        Returns:
+            tuple[Optional[bytes], str]: 본문과 내용 해시
+                (keep_body=False이고 304 응답이면 본문은 None)
+
+        Raises:
+            FetchError: 200/304가 아닌 응답
+            CircuitOpenError: 서킷이 열려 있고 재사용할 이전 내용이 없는 경우
+        """
+        previous = self._validators.get(url)
+        request_headers = dict(headers or {})
+        revalidating = conditional and previous is not None
+        if revalidating:
+            if previous.etag:
+                request_headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                request_headers["If-Modified-Since"] = previous.last_modified
+
+        try:
+            response = await self._get(url, request_headers)
+        except CircuitOpenError:
+            # keep_body=False이면 호출자가 같은 내용(해시)을 가진 경우에만 재사용 가능
+            if not revalidating or (keep_body and previous.body is None):
+                raise
+            self.resilience.stale_served += 1
+            return previous.body, previous.digest
+
+        if response.status_code == Config.HttpStatus.NOT_MODIFIED and revalidating:
+            self.stats.not_modified += 1
+            return previous.body, previous.digest
+        if response.status_code != Config.HttpStatus.OK:
+            raise FetchError(response.status_code, message)
+
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        if previous is not None and previous.digest == digest:
+            self.stats.unchanged += 1
+        else:
+            self.stats.downloaded += 1
+        self._validators[url] = _Validators(
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            digest=digest,
+            body=body if keep_body else None,
+        )
+        return body, digest
+
+    @observe_upstream()
+    async def fetch_bookcode(self):
+        body, _ = await self._conditional_get(self.url, "bookcode 요청 실패")
+        for line in body.decode("utf-8", errors="replace").splitlines():
+            if "var bookcode =" in line:
+                self.bookcode = line.split("=")[1].strip().strip(";").strip("'")
+                logger.info(f"[BookDownloader] bookcode: {self.bookcode}")
+                return self.bookcode
 
         raise FetchError(None, "bookcode를 찾을 수 없습니다.")
 
+    @observe_upstream()
     async def fetch_file_list(self) -> str:
         if self.bookcode is None:
             await self.fetch_bookcode()
 
         data = {"key": "kpu", "bookcode": self.bookcode, "base64": "N"}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.file_list_url,
-                headers=self.headers,
-                data=data,
-                timeout=10,
-            )
-            if response.status_code != 200:
-                raise FetchError(response.status_code, "파일 목록 요청 실패")
-            return response.text
+        # POST는 멱등이 아니므로 헤지/재시도 없이 서킷만 적용
+        self._check_breaker()
+        try:
+            async with self._client() as client:
+                response = await client.post(
+                    self.file_list_url,
+                    headers=self.headers,
+                    data=data,
+                )
+        except httpx.TransportError:
+            self.breaker.record_failure()
+            raise
+        if _retryable(response.status_code):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        if response.status_code != Config.HttpStatus.OK:
+            raise FetchError(response.status_code, "파일 목록 요청 실패")
+        return response.text
 
     def get_file_url(self, file_list_content: str) -> str:
         root = ElementTree.fromstring(file_list_content)
@@ -81,59 +434,297 @@ class BookDownloader:
             return f"https://{host}/contents/{bookcode[0]}/{bookcode[:3]}/{bookcode}/raw/{file_name}"
         raise FetchError(None, "파일 URL을 찾을 수 없습니다.")
 
-    async def download_file(self, file_url: str, save_as: str):
-        async with httpx.AsyncClient() as client:
-            response = await client.get(file_url, timeout=10)
-            if response.status_code != 200:
-                raise FetchError(response.status_code, "파일 다운로드 실패")
-            with open(save_as, "wb") as f:
-                f.write(response.content)
-        logger.info(f"[BookDownloader] 파일 저장 완료 → {save_as}")
+    async def download_to(
+        self,
+        url: str,
+        save_as: str,
+        message: str = "파일 다운로드 실패",
+        headers: Optional[dict] = None,
+    ) -> bool:
+        """url의 본문을 스트리밍으로 받아 save_as에 저장합니다.
+
+        본문을 `DOWNLOAD_CHUNK_SIZE` 단위로 받아 스레드에서 임시 파일에 쓰고 rename
+        하므로, 큰 파일도 메모리에 올리지 않고 이벤트 루프를 막지 않습니다.
+        서킷과 재시도는 `_get`과 같지만, 본문을 쓰는 중이라 헤지는 하지 않습니다.
 
-    async def fetch_image_list(self) -> list[str]:
-        if self.bookcode is None:
-            await self.fetch_bookcode()
+        save_as가 이미 있으면 다음 경우 본문을 받지 않고 건너뜁니다.
 
-        json_url = f"{self.url.rsplit('/', 1)[0]}/getBookXML/{self.bookcode}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(json_url, headers=self.headers, timeout=10)
-            if response.status_code != 200:
-                raise FetchError(
-                    response.status_code, "이미지 목록을 가져오지 못했습니다."
-                )
+        - 파일 내용 해시가 이전에 받은 해시와 같고, 그 검증자로 보낸 조건부 요청이 304
+        - 서버가 조건부 요청을 무시하고 200을 보냈지만, 응답의 ETag/Last-Modified가
+          파일 내용 해시와 함께 기록된 검증자와 같음
 
+        검증자로 판단할 수 없으면 본문을 받아 내용 해시를 비교합니다.
+
+        Args:
+            url (str): 요청 URL
+            save_as (str): 저장할 경로
+            message (str): 실패 시 FetchError 메시지
+            headers (Optional[dict]): 추가 요청 헤더
+
+        Returns:
+            bool: 새로 저장했으면 True, 같은 파일이 있었으면 False
+
+        Raises:
+            FetchError: 200/304가 아닌 응답
+            CircuitOpenError: 서킷이 열려 요청을 보내지 않은 경우
+            httpx.TransportError: 재시도 후에도 연결에 실패한 경우
+        """
+        existing = await asyncio.to_thread(_file_digest, save_as)
+        previous = self._validators.get(url)
+        validators = {}
+        if existing is not None and previous is not None:
+            if previous.digest == existing[1]:
+                if previous.etag:
+                    validators["If-None-Match"] = previous.etag
+                if previous.last_modified:
+                    validators["If-Modified-Since"] = previous.last_modified
+        request_headers = {**(headers or {}), **validators}
+
+        attempt = 0
+        while True:
+            self._check_breaker()
+            self.budget.deposit()
+            status: Optional[int] = None
             try:
-                image_data = response.json()
-                return ["https:" + img["src"].replace("\\/", "/") for img in image_data]
-            except json.JSONDecodeError as e:
-                raise FetchError(None, f"JSON 파싱 오류: {e}") from e
+                async with self._client() as client:
+                    async with client.stream(
+                        "GET", url, headers=request_headers
+                    ) as response:
+                        status = response.status_code
+                        if not _retryable(status):
+                            self.breaker.record_success()
+                            return await self._save_response(
+                                url,
+                                response,
+                                save_as,
+                                existing,
+                                message,
+                            )
+            except httpx.TransportError as e:
+                error = e
+                status = None
+
+            self.breaker.record_failure()
+            attempt += 1
+            if not await self._backoff(attempt):
+                if status is not None:
+                    raise FetchError(status, message)
+                raise error
+
+    async def _save_response(
+        self,
+        url: str,
+        response: httpx.Response,
+        save_as: str,
+        existing: Optional[tuple[int, str]],
+        message: str,
+    ) -> bool:
+        """download_to의 응답을 확인하고 필요하면 본문을 파일로 씁니다."""
+        request_headers = response.request.headers
+        conditional = (
+            "if-none-match" in request_headers or "if-modified-since" in request_headers
+        )
+        if response.status_code == Config.HttpStatus.NOT_MODIFIED and conditional:
+            self.stats.not_modified += 1
+            return False
+        if response.status_code != Config.HttpStatus.OK:
+            raise FetchError(response.status_code, message)
+
+        previous = self._validators.get(url)
+        if (
+            existing is not None
+            and previous is not None
+            and previous.digest == existing[1]
+            and _same_validators(previous, response.headers)
+        ):
+            self.stats.skipped += 1
+            digest, written = existing[1], False
+        else:
+            digest = await _stream_to_file(response, save_as)
+            if previous is not None and previous.digest == digest:
+                self.stats.unchanged += 1
+            else:
+                self.stats.downloaded += 1
+            written = existing is None or existing[1] != digest
+        self._validators[url] = _Validators(
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            digest=digest,
+            body=None,
+        )
+        return written
+
+    @observe_upstream()
+    async def download_file(self, file_url: str, save_as: str) -> bool:
+        """첨부파일을 save_as에 저장합니다. (같은 파일이 있으면 건너뜀)"""
+        if await self.download_to(file_url, save_as, "파일 다운로드 실패"):
+            logger.info(f"[BookDownloader] 파일 저장 완료 → {save_as}")
+            return True
+        logger.info(f"[BookDownloader] 같은 파일이 있어 건너뜀 → {save_as}")
+        return False
+
+    @observe_upstream()
+    async def fetch_image_list(self, bookcode: Optional[str] = None) -> list[str]:
+        if bookcode is None:
+            bookcode = self.bookcode or await self.fetch_bookcode()
+
+        json_url = f"{self.url.rsplit('/', 1)[0]}/getBookXML/{bookcode}"
+        body, _ = await self._conditional_get(
+            json_url, "이미지 목록을 가져오지 못했습니다.", headers=self.headers
+        )
+
+        try:
+            image_data = json.loads(body)
+            # src는 "//host/path" 형태이므로 뷰어 URL의 scheme을 따름
+            return [
+                urljoin(self.url, img["src"].replace("\\/", "/")) for img in image_data
+            ]
+        except json.JSONDecodeError as e:
+            raise FetchError(None, f"JSON 파싱 오류: {e}") from e
+
+    @observe_upstream()
+    async def fetch_image(
+        self, url: str, known_digest: Optional[str] = None
+    ) -> Optional[bytes]:
+        """이미지를 받습니다.
+
+        이미지 본문은 호출자(이미지 캐시)가 보관하므로 여기서는 검증자와 해시만
+        기억합니다.
+
+        Args:
+            url (str): 이미지 URL
+            known_digest (Optional[str]): 호출자가 이미 가진 내용의 SHA-256 해시
+
+        Returns:
+            Optional[bytes]: 이미지 바이트, 업스트림 내용이 known_digest와 같으면 None
+
+        Raises:
+            FetchError: 이미지를 받지 못한 경우
+        """
+        previous = self._validators.get(url)
+        conditional = (
+            known_digest is not None
+            and previous is not None
+            and previous.digest == known_digest
+        )
+        body, digest = await self._conditional_get(
+            url,
+            f"이미지 다운로드 실패: {url}",
+            keep_body=False,
+            conditional=conditional,
+        )
+        if digest == known_digest:
+            return None
+        return body
 
-    async def download_images(self, image_save_path: Optional[str] = None):
+    async def download_images(
+        self,
+        image_save_path: Optional[str] = None,
+        concurrency: int = Config.IMAGE_FETCH_CONCURRENCY,
+    ) -> DownloadSummary:
+        """모든 페이지 이미지를 page_{번호}.jpg로 저장합니다.
+
+        실패한 페이지는 경고만 남기고 나머지 페이지를 계속 받습니다.
+
+        Args:
+            image_save_path (Optional[str]): 저장 경로, 없으면 생성 시 지정한 경로
+            concurrency (int): 동시에 받을 페이지 수
+
+        Returns:
+            DownloadSummary: 다운로드 결과
+        """
         if image_save_path is None:
             image_save_path = self.image_save_path
 
+        summary = DownloadSummary()
         await self.fetch_bookcode()
         image_urls = await self.fetch_image_list()
 
         if not image_urls:
             logger.info("다운로드할 이미지가 없습니다.")
-            return
+            return summary
 
         os.makedirs(image_save_path, exist_ok=True)
 
-        async with httpx.AsyncClient() as client:
-            for idx, url in enumerate(image_urls, start=1):
-                save_as = os.path.join(image_save_path, f"page_{idx}.jpg")
-                response = await client.get(url, headers=self.headers, timeout=10)
+        async def save(page: tuple[int, str]):
+            idx, url = page
+            name = f"page_{idx}.jpg"
+            save_as = os.path.join(image_save_path, name)
+            try:
+                written = await self.download_to(
+                    url, save_as, f"이미지 다운로드 실패: {url}", self.headers
+                )
+            except (FetchError, httpx.HTTPError) as e:
+                summary.failed += 1
+                logger.warning(f"다운로드 실패: {url}, {e}")
+                return
+
+            summary.files[name] = url
+            if written:
+                summary.downloaded += 1
+                logger.info(f"이미지 저장 완료: {save_as}")
+            else:
+                summary.skipped += 1
+
+        await gather_bounded(save, enumerate(image_urls, start=1), concurrency)
+        return summary
+
+    async def mirror(
+        self,
+        directory: str,
+        concurrency: int = Config.IMAGE_FETCH_CONCURRENCY,
+        attachments: bool = True,
+    ) -> DownloadSummary:
+        """책의 모든 페이지 이미지(와 첨부파일)를 directory에 내려받습니다.
+
+        파일별 URL, 검증자, 내용 해시를 `MANIFEST_FILE`에 남겨 두고 다음 실행 때
+        조건부 요청에 사용하므로, 바뀌지 않은 파일은 다시 받지 않습니다.
+
+        Args:
+            directory (str): 저장 경로
+            concurrency (int): 동시에 받을 파일 수
+            attachments (bool): 첨부파일도 받을지 여부
+
+        Returns:
+            DownloadSummary: 다운로드 결과
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest = await asyncio.to_thread(_load_manifest, directory)
+        for record in manifest.values():
+            self._validators.setdefault(
+                record["url"],
+                _Validators(
+                    etag=record.get("etag"),
+                    last_modified=record.get("last_modified"),
+                    digest=record["digest"],
+                    body=None,
+                ),
+            )
 
-                if response.status_code == 200:
-                    with open(save_as, "wb") as f:
-                        f.write(response.content)
-                    logger.info(f"이미지 저장 완료: {save_as}")
+        summary = await self.download_images(directory, concurrency)
+        if attachments:
+            try:
+                file_url = self.get_file_url(await self.fetch_file_list())
+                save_as = os.path.join(directory, os.path.basename(self.file_name))
+                if await self.download_file(file_url, save_as):
+                    summary.downloaded += 1
                 else:
-                    logger.warning(
-                        f"다운로드 실패: {url}, 상태 코드: {response.status_code}"
-                    )
+                    summary.skipped += 1
+                summary.files[os.path.basename(save_as)] = file_url
+            except (FetchError, httpx.HTTPError, ElementTree.ParseError) as e:
+                summary.failed += 1
+                logger.warning(f"첨부파일 다운로드 실패: {e}")
+
+        for name, url in summary.files.items():
+            validators = self._validators[url]
+            manifest[name] = {
+                "url": url,
+                "etag": validators.etag,
+                "last_modified": validators.last_modified,
+                "digest": validators.digest,
+            }
+        await asyncio.to_thread(_save_manifest, directory, manifest)
+        return summary
 
     async def get_file(self, file_name: Optional[str] = None):
         file_name = file_name or self.file_name or "/tmp/data.xlsx"
@@ -141,3 +732,75 @@ class BookDownloader:
         file_list = await self.fetch_file_list()
         file_url = self.get_file_url(file_list)
         await self.download_file(file_url, file_name)
+
+    def collect_metrics(self) -> Iterable[Family]:
+        """헤지/재시도/서킷 카운터와 서킷 상태를 메트릭으로 내보냅니다."""
+        counters = (
+            ("ibook_hedges_total", "iBook 헤지 요청 수", self.resilience.hedges),
+            (
+                "ibook_hedge_wins_total",
+                "헤지 요청이 먼저 끝난 횟수",
+                self.resilience.hedge_wins,
+            ),
+            ("ibook_retries_total", "iBook 재시도 횟수", self.resilience.retries),
+            (
+                "ibook_retry_budget_exhausted_total",
+                "예산이 없어 재시도/헤지를 하지 않은 횟수",
+                self.resilience.budget_exhausted,
+            ),
+            (
+                "ibook_short_circuited_total",
+                "서킷이 열려 iBook에 요청을 보내지 않은 횟수",
+                self.resilience.short_circuited,
+            ),
+            (
+                "ibook_stale_served_total",
+                "서킷이 열려 이전 응답을 재사용한 횟수",
+                self.resilience.stale_served,
+            ),
+        )
+        for name, documentation, value in counters:
+            yield name, "counter", documentation, [({}, value, "")]
+        yield (
+            "ibook_circuit_open",
+            "gauge",
+            "iBook 서킷 상태 (0: closed, 1: open, 0.5: half-open)",
+            [({}, {"closed": 0, "open": 1, "half_open": 0.5}[self.breaker.state], "")],
+        )
+
+
+async def _mirror(args: argparse.Namespace):
+    async with create_http_client() as client:
+        downloader = BookDownloader(args.url, args.file_list_url, client=client)
+        started = time.perf_counter()
+        summary = await downloader.mirror(
+            args.output, args.concurrency, attachments=not args.no_attachments
+        )
+    print(
+        f"{args.output}: 받음 {summary.downloaded}, 건너뜀 {summary.skipped}, "
+        f"실패 {summary.failed} ({time.perf_counter() - started:.1f}s)"
+    )
+    if summary.failed:
+        raise SystemExit(1)
+
+
+def main():
+    """iBook 책 하나의 페이지 이미지와 첨부파일을 디렉터리로 내려받습니다.
+
+    python -m app.utils.ibookdownloader --url URL --output DIR [--concurrency 8]
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--url", default=Config.SHUTTLE_URL, help="iBook 뷰어 URL")
+    parser.add_argument(
+        "--file-list-url",
+        default="https://ibook.tukorea.ac.kr/web/RawFileList",
+        help="첨부파일 목록 API URL",
+    )
+    parser.add_argument("--output", default="images", help="저장 경로")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--no-attachments", action="store_true")
+    asyncio.run(_mirror(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
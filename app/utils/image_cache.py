@@ -0,0 +1,340 @@
+"""셔틀버스 이미지 바이트를 캐시하는 2단계(메모리 + 디스크) 캐시 모듈
+
+- 메모리: 바이트 합계로 크기를 제한하는 LRU
+- 디스크: 내용 해시(SHA-256)를 파일 이름으로 쓰는 content-addressed 저장소,
+  전체 크기를 넘으면 오래 쓰지 않은 파일부터 삭제
+
+URL -> 해시 매핑은 `AsyncTTLCache`로 관리하므로 같은 이미지를 동시에 요청해도
+업스트림 호출은 한 번이며, TTL이 지나면 백그라운드에서 다시 받아 변경을 반영합니다.
+다시 받을 때는 가진 내용의 해시를 함께 넘겨, 내용이 같으면(304 등) 저장을 건너뜁니다.
+디스크 파일은 `FileResponse`로 바로 보낼 수 있습니다.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Iterable, Optional
+
+from app.config import Config, logger
+from app.utils.cache import AsyncTTLCache
+from app.utils.ibookdownloader import FetchError
+
+
+@dataclass
+class ImageCacheStats:
+    """이미지 캐시 카운터
+
+    Attributes:
+        memory_hits (int): 메모리에서 찾은 횟수
+        disk_hits (int): 디스크에서 찾은 횟수
+        misses (int): 업스트림에서 받은 횟수
+        revalidated (int): 다시 확인했지만 내용이 같아 기존 항목을 재사용한 횟수
+        memory_evictions (int): 메모리에서 밀려난 항목 수
+        disk_evictions (int): 디스크에서 삭제된 파일 수
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+
+
+def _write_atomic(path: str, data: bytes):
+    """임시 파일에 쓴 뒤 rename 해서 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 합니다."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_file(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _remove_files(paths: list[str]):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class ImageCache:
+    """URL로 이미지 바이트를 가져오는 메모리 LRU + 디스크 캐시"""
+
+    def __init__(
+        self,
+        fetch: Callable[[str, Optional[str]], Awaitable[Optional[bytes]]],
+        directory: str = Config.IMAGE_CACHE_DIR,
+        max_memory_bytes: int = Config.IMAGE_CACHE_MEMORY_MAX_BYTES,
+        max_disk_bytes: int = Config.IMAGE_CACHE_DISK_MAX_BYTES,
+        ttl: float = Config.IMAGE_CACHE_TTL,
+    ):
+        """ImageCache를 초기화하고 디스크에 남아있는 파일을 색인합니다.
+
+        Args:
+            fetch (Callable[[str, Optional[str]], Awaitable[Optional[bytes]]]):
+                URL과 가진 내용의 해시를 받아 이미지를 받아오는 함수,
+                내용이 그 해시와 같으면 None을 반환
+            directory (str): 디스크 캐시 디렉터리
+            max_memory_bytes (int): 메모리 캐시 최대 크기(바이트)
+            max_disk_bytes (int): 디스크 캐시 최대 크기(바이트)
+            ttl (float): URL -> 내용 매핑을 다시 확인하기 전까지의 시간(초)
+        """
+        self._fetch = fetch
+        # 디스크 최대 크기를 넘었을 때 파일을 지워도 되는지 반환하는 함수
+        # (여러 워커가 디렉터리를 함께 쓰면 리더만 True가 되도록 바꿔 끼움)
+        self.can_prune: Callable[[], bool] = lambda: True
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = ImageCacheStats()
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()  # 해시 -> 파일 크기
+        self._disk_bytes = 0
+        self._writing: dict[str, asyncio.Task] = {}
+        self._digests: AsyncTTLCache[str] = AsyncTTLCache(
+            ttl=ttl, stale_ttl=Config.SHUTTLE_CACHE_STALE_TTL, name="ImageCache"
+        )
+        self._load_disk_index()
+
+    def _load_disk_index(self):
+        """디스크에 남은 파일을 수정 시각 순서(오래된 것 먼저)로 색인합니다."""
+        entries = []
+        if os.path.isdir(self.directory):
+            for dirpath, _, filenames in os.walk(self.directory):
+                for filename in filenames:
+                    if filename.startswith(".tmp-"):
+                        continue
+                    stat = os.stat(os.path.join(dirpath, filename))
+                    entries.append((stat.st_mtime, filename, stat.st_size))
+        for _, digest, size in sorted(entries):
+            self._disk[digest] = size
+            self._disk_bytes += size
+        if entries:
+            logger.info(
+                f"[ImageCache] 디스크 캐시 {len(entries)}개 "
+                f"({self._disk_bytes} bytes) 불러옴"
+            )
+
+    def path_for(self, digest: str) -> str:
+        """해시에 해당하는 디스크 파일 경로를 반환합니다."""
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _remember(self, digest: str, data: bytes):
+        """메모리 LRU에 넣고 최대 크기를 넘으면 오래된 항목부터 밀어냅니다."""
+        if len(data) > self.max_memory_bytes:
+            return
+        if digest in self._memory:
+            self._memory.move_to_end(digest)
+            return
+        self._memory[digest] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.stats.memory_evictions += 1
+
+    async def _store(self, digest: str, data: bytes):
+        """디스크에 저장하고 최대 크기를 넘으면 오래된 파일부터 삭제합니다.
+
+        `can_prune()`이 False면 다른 워커가 쓰는 파일일 수 있으므로 지우지 않습니다.
+        """
+        if digest in self._disk:
+            self._disk.move_to_end(digest)
+            return
+        # 내용이 같은 다른 URL이 동시에 저장 중이면 그 쓰기를 기다림
+        writing = self._writing.get(digest)
+        if writing is None:
+            writing = asyncio.create_task(
+                asyncio.to_thread(_write_atomic, self.path_for(digest), data)
+            )
+            self._writing[digest] = writing
+            try:
+                await asyncio.shield(writing)
+            finally:
+                self._writing.pop(digest, None)
+        else:
+            await asyncio.shield(writing)
+            return
+
+        self._disk[digest] = len(data)
+        self._disk_bytes += len(data)
+
+        if not self.can_prune():
+            return
+        evicted = []
+        # 방금 넣은 파일은 남겨둠
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            old_digest, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(self.path_for(old_digest))
+        if evicted:
+            self.stats.disk_evictions += len(evicted)
+            await asyncio.to_thread(_remove_files, evicted)
+
+    def _on_disk(self, digest: str) -> bool:
+        """디스크 파일이 실제로 있는지 확인하고, 사라졌으면 색인에서 제거합니다."""
+        if digest in self._disk and os.path.exists(self.path_for(digest)):
+            return True
+        self._forget_disk(digest)
+        return False
+
+    async def _download(self, url: str) -> str:
+        known = self._digests.peek(url)
+        # 디스크 파일이 없고 메모리에만 있으면 304를 받은 뒤 디스크에 다시 씀
+        restore: Optional[bytes] = None
+        if known is not None and not self._on_disk(known):
+            restore = self._memory.get(known)
+            if restore is None:
+                known = None  # 두 캐시에서 밀려났으면 조건 없이 다시 받음
+        data = await self._fetch(url, known)
+        if data is None:
+            self.stats.revalidated += 1
+            if restore is not None:
+                await self._store(known, restore)
+            return known
+        self.stats.misses += 1
+        digest = hashlib.sha256(data).hexdigest()
+        self._remember(digest, data)
+        await self._store(digest, data)
+        return digest
+
+    def known_digest(self, url: str) -> Optional[str]:
+        """이미 받은 적이 있는 URL의 내용 해시를 반환합니다. (없으면 None, 요청 없음)"""
+        return self._digests.peek(url)
+
+    async def digest(self, url: str, refresh: bool = False) -> str:
+        """URL 이미지의 내용 해시를 반환합니다. (없으면 받아서 캐시)"""
+        if refresh:
+            return await self._digests.refresh(url, lambda: self._download(url))
+        return await self._digests.get(url, lambda: self._download(url))
+
+    def adopt(self, pages: Iterable[tuple[str, str]]) -> bool:
+        """다른 프로세스가 디스크에 저장한 이미지들을 URL의 내용으로 등록합니다.
+
+        파일이 하나라도 없으면 아무것도 등록하지 않습니다.
+
+        Args:
+            pages (Iterable[tuple[str, str]]): (URL, 내용 해시) 목록
+
+        Returns:
+            bool: 모든 해시에 해당하는 파일이 디스크에 있어 등록했으면 True
+        """
+        found = []
+        for url, digest in pages:
+            size = self._disk.get(digest)
+            if size is None:
+                try:
+                    size = os.stat(self.path_for(digest)).st_size
+                except FileNotFoundError:
+                    return False
+            found.append((url, digest, size))
+
+        for url, digest, size in found:
+            if digest not in self._disk:
+                self._disk[digest] = size
+                self._disk_bytes += size
+            self._digests.set(url, digest)
+        return True
+
+    def _forget_disk(self, digest: str):
+        """디스크에서 사라진 파일을 색인에서 제거합니다."""
+        size = self._disk.pop(digest, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    async def _load(self, digest: str, count_hit: bool) -> Optional[bytes]:
+        data = self._memory.get(digest)
+        if data is not None:
+            self._memory.move_to_end(digest)
+            self.stats.memory_hits += count_hit
+            return data
+        if digest in self._disk:
+            data = await asyncio.to_thread(_read_file, self.path_for(digest))
+            if data is None:
+                self._forget_disk(digest)
+                return None
+            self._disk.move_to_end(digest)
+            self.stats.disk_hits += count_hit
+            self._remember(digest, data)
+            return data
+        return None
+
+    async def get_with_digest(self, url: str) -> tuple[str, bytes]:
+        """URL 이미지의 내용 해시와 그 해시에 해당하는 바이트를 반환합니다.
+
+        Raises:
+            FetchError: 업스트림에서 이미지를 받지 못한 경우
+        """
+        known = self._digests.peek(url) is not None
+        digest = await self.digest(url)
+        data = await self._load(digest, count_hit=known)
+        if data is None:
+            # 두 캐시에서 모두 밀려난 경우 다시 받음
+            digest = await self.digest(url, refresh=True)
+            data = await self._load(digest, False)
+        if data is None:
+            raise FetchError(None, f"이미지 캐시에 저장하지 못했습니다: {url}")
+        return digest, data
+
+    async def get(self, url: str) -> bytes:
+        """URL 이미지의 바이트를 반환합니다.
+
+        Raises:
+            FetchError: 업스트림에서 이미지를 받지 못한 경우
+        """
+        return (await self.get_with_digest(url))[1]
+
+    async def get_path(self, url: str) -> str:
+        """URL 이미지가 저장된 디스크 파일 경로를 반환합니다.
+
+        Raises:
+            FetchError: 업스트림에서 이미지를 받지 못한 경우
+        """
+        known = self._digests.peek(url) is not None
+        digest = await self.digest(url)
+        path = self.path_for(digest)
+        if digest in self._disk and os.path.exists(path):
+            self._disk.move_to_end(digest)
+            self.stats.disk_hits += known
+            return path
+
+        self._forget_disk(digest)
+        digest = await self.digest(url, refresh=True)
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            raise FetchError(None, f"이미지 캐시에 저장하지 못했습니다: {url}")
+        return path
+
+    def snapshot_stats(self) -> dict:
+        """카운터와 현재 사용량을 dict로 반환합니다."""
+        lookups = self.stats.memory_hits + self.stats.disk_hits + self.stats.misses
+        hits = self.stats.memory_hits + self.stats.disk_hits
+        return {
+            **asdict(self.stats),
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "memory_bytes": self._memory_bytes,
+            "memory_items": len(self._memory),
+            "max_memory_bytes": self.max_memory_bytes,
+            "disk_bytes": self._disk_bytes,
+            "disk_items": len(self._disk),
+            "max_disk_bytes": self.max_disk_bytes,
+        }
@@ -1,148 +1,504 @@
-from typing import Union
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Iterator,
+    Optional,
+    Union,
+)
 from fastapi.responses import (
-    JSONResponse,
+    Response,
     StreamingResponse,
-    PlainTextResponse,
 )
-from fastapi import HTTPException
-import httpx, base64, io, zipfile
+from fastapi import HTTPException, Request
+from contextlib import aclosing
+import asyncio
+import base64
+import json
+import os
+import httpx
+
+from app.config import Config, logger
+from app.utils.aio import map_bounded
+from app.utils.http_cache import CachedBody, cached_response, etag_matches, make_etag
+from app.utils.http_range import ranged_file_response
+from app.utils.ibookdownloader import FetchError
+from app.utils.image_cache import ImageCache
+from app.utils.image_variants import (
+    ImageVariantCache,
+    VariantRenderError,
+    VariantSpec,
+    VariantUnavailableError,
+)
+from app.utils.representation_cache import RepresentationCache, urls_version
+from app.utils.shuttle import ShuttleImageService
+from app.utils.zip_bundle import ZipBundleCache, stream_bundle
+
+# 3의 배수라 청크마다 인코딩해도 패딩 없이 이어 붙일 수 있음
+BASE64_CHUNK_SIZE = 48 * 1024
+# json/text/base64 응답의 Cache-Control
+CACHE_CONTROL = f"public, max-age={Config.SHUTTLE_RESPONSE_MAX_AGE}"
+
+
+async def fetch_image(images: ImageCache, url: str) -> bytes:
+    """캐시를 거쳐 이미지 바이트를 가져오는 함수입니다.
+
+    Args:
+        images (ImageCache): 이미지 캐시
+        url (str): 이미지 URL
+
+    Returns:
+        bytes: 이미지 바이트
+
+    Raises:
+        HTTPException: 업스트림에서 이미지를 받지 못한 경우 502
+    """
+    try:
+        return await images.get(url)
+    except (FetchError, httpx.HTTPError) as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY,
+            detail=f"이미지 다운로드 실패: {url}",
+        ) from e
 
-from app.config import Config
 
+async def fetch_image_path(images: ImageCache, url: str) -> str:
+    """캐시를 거쳐 이미지가 저장된 디스크 경로를 가져오는 함수입니다.
 
-async def build_response_json(image_urls: list[str]):
+    Args:
+        images (ImageCache): 이미지 캐시
+        url (str): 이미지 URL
+
+    Returns:
+        str: 디스크 캐시 파일 경로
+
+    Raises:
+        HTTPException: 업스트림에서 이미지를 받지 못한 경우 502
+    """
+    try:
+        return await images.get_path(url)
+    except (FetchError, httpx.HTTPError) as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 다운로드 실패"
+        ) from e
+
+
+async def jpeg_file_response(
+    request: Request, images: ImageCache, url: str
+) -> Response:
+    """디스크 캐시 파일을 JPEG 응답으로 보내는 함수입니다.
+
+    파일 이름이 내용 해시이므로 그대로 ETag로 사용하며, Range/If-Range 요청은
+    파일을 메모리 매핑해 필요한 구간만 보냅니다. 응답 전에 파일이 정리되었으면
+    캐시에서 다시 받아 한 번 더 시도합니다.
+    """
+
+    async def respond() -> Response:
+        path = await fetch_image_path(images, url)
+        return await ranged_file_response(
+            request,
+            path,
+            Config.ImageType.JPEG,
+            etag=f'"{os.path.basename(path)[:32]}"',
+            headers={"Content-Disposition": 'inline; filename="shuttle.jpg"'},
+        )
+
+    try:
+        return await respond()
+    except FileNotFoundError:
+        logger.warning(f"[ImageCache] 캐시 파일이 정리되어 다시 받습니다: {url}")
+    return await respond()
+
+
+async def build_cached_response(
+    request: Request, body: Awaitable[CachedBody]
+) -> Response:
+    """버전별로 미리 만든 본문으로 응답하는 함수입니다.
+
+    Args:
+        request (Request): 현재 요청 (If-None-Match 처리용)
+        body (Awaitable[CachedBody]): `RepresentationCache.get`이 돌려주는 본문
+
+    Returns:
+        Response: 200 응답 또는 304 응답
+
+    Raises:
+        HTTPException: 본문을 만드는 데 필요한 이미지를 받지 못한 경우 502
+    """
+    try:
+        cached = await body
+    except (FetchError, httpx.HTTPError) as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 다운로드 실패"
+        ) from e
+    return cached_response(request, cached, CACHE_CONTROL)
+
+
+async def build_response_json(
+    image_urls: list[str],
+    request: Request,
+    representations: RepresentationCache,
+    index: Optional[int] = None,
+):
     """Json 반환 값 생성하는 함수입니다.
 
     Args:
         image_urls (list[str]): 이미지 URL 리스트
+        request (Request): 현재 요청
+        representations (RepresentationCache): 표현 캐시
+        index (Optional[int]): 단일 이미지 요청의 index
 
     Returns:
-        JSONResponse: 이미지 URL 리스트를 포함한 JSON 응답
+        Response: 이미지 URL 리스트를 포함한 JSON 응답
     """
-    return JSONResponse(content={"image_urls": image_urls})
+
+    async def render() -> bytes:
+        # JSONResponse와 같은 인코딩 (이전 응답과 같은 바이트)
+        return json.dumps(
+            {"image_urls": image_urls}, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    return await build_cached_response(
+        request,
+        representations.get(
+            ("json", index), urls_version(image_urls), render, Config.Accept.JSON
+        ),
+    )
+
+
+def weak_urls_etag(kind: str, image_urls: list[str]) -> str:
+    """페이지 내용 해시를 모를 때 쓰는 URL 목록 기반의 약한 ETag를 만듭니다."""
+    return "W/" + make_etag(f"{kind}:{urls_version(image_urls)}".encode("utf-8"))
+
+
+async def stream_pages(
+    images: ImageCache, image_urls: list[str]
+) -> AsyncIterator[bytes]:
+    """이미지들을 동시에 받아 순서대로 내보내는 이터레이터를 반환합니다.
+
+    응답 헤더를 보내기 전에 첫 페이지를 받아 두므로, 시작부터 실패하면 502로 응답할 수
+    있습니다. 첫 페이지 이후에 실패하면 이미 응답이 시작되었으므로 연결을 끊습니다.
+
+    Raises:
+        HTTPException: 첫 페이지를 받지 못한 경우 502
+    """
+    pages = map_bounded(lambda url: fetch_image(images, url), image_urls)
+    first = await anext(pages)
+
+    async def iterate():
+        async with aclosing(pages):
+            yield first
+            async for content in pages:
+                yield content
+
+    return iterate()
 
 
-async def build_response_base64(image_urls: list[str]):
-    """Base64 인코딩된 이미지 반환 값 생성하는 함수입니다.
+def _base64_chunks(data: bytes) -> Iterator[bytes]:
+    """데이터를 3바이트 경계에서 잘라 Base64 청크로 인코딩합니다."""
+    view = memoryview(data)
+    for start in range(0, len(view), BASE64_CHUNK_SIZE):
+        yield base64.b64encode(view[start : start + BASE64_CHUNK_SIZE])
+
+
+async def base64_json_chunks(
+    pages: AsyncIterable[bytes], many: bool
+) -> AsyncIterator[bytes]:
+    """페이지를 받는 대로 Base64로 인코딩한 JSON 조각을 내보냅니다.
+
+    Args:
+        pages (AsyncIterable[bytes]): 순서대로의 이미지 바이트
+        many (bool): True면 `image_base64_list`, False면 `image_base64`
+    """
+    yield b'{"image_base64_list":[' if many else b'{"image_base64":'
+    idx = 0
+    async for content in pages:
+        yield b',"' if idx else b'"'
+        for chunk in _base64_chunks(content):
+            yield chunk
+        yield b'"'
+        idx += 1
+    yield b"]}" if many else b"}"
+
+
+async def build_response_base64(
+    image_urls: list[str],
+    request: Request,
+    shuttle: ShuttleImageService,
+    index: Optional[int] = None,
+):
+    """Base64 인코딩된 이미지를 담은 JSON 응답을 생성하는 함수입니다.
+
+    ETag는 이미지 세트 버전(페이지 내용 해시)으로 정하므로 본문을 만들기 전에 304로
+    응답할 수 있습니다. 같은 버전의 본문이 보관되어 있으면 그대로 보내고, 없으면
+    페이지를 받는 대로 인코딩해 JSON 조각으로 스트리밍하면서, 전체 크기가
+    `SHUTTLE_REPRESENTATION_MAX_BYTES` 이하이면 그 청크로 본문을 보관합니다.
+    따라서 원본, Base64 문자열, JSON 문서 전체를 요청마다 한꺼번에 메모리에 두지 않습니다.
+
+    아직 받지 않은 페이지가 있으면(콜드 캐시) 버전을 알 수 없으므로 페이지를 모두 받기를
+    기다리지 않고 URL 목록 기반의 약한 ETag로 스트리밍하며, 본문은 보관하지 않습니다.
 
     Args:
         image_urls (list[str]): 이미지 URL 리스트
+        request (Request): 현재 요청 (If-None-Match 처리용)
+        shuttle (ShuttleImageService): 셔틀버스 이미지 서비스
+        index (Optional[int]): 단일 이미지 요청의 index
 
     Returns:
-        JSONResponse: Base64로 인코딩된 이미지 데이터를 포함한 JSON 응답
+        Response: 이미지가 여러 개면 `image_base64_list`, 하나면 `image_base64`를
+            담은 JSON 응답 (보관된 본문 또는 스트리밍) 또는 304 응답
     """
-    base64_list = []
-    async with httpx.AsyncClient() as client:
-        for url in image_urls:
-            resp = await client.get(url, timeout=10)
-            if resp.status_code != Config.HttpStatus.OK:
-                raise HTTPException(
-                    status_code=Config.HttpStatus.BAD_GATEWAY,
-                    detail=f"이미지 다운로드 실패: {url}",
-                )
-            encoded = base64.b64encode(resp.content).decode("utf-8")
-            base64_list.append(encoded)
-    return JSONResponse(
-        content={"image_base64_list": base64_list}
-        if len(base64_list) > 1
-        else {"image_base64": base64_list[0]}
+    try:
+        version = await shuttle.bundles.cached_key(image_urls)
+    except (FetchError, httpx.HTTPError) as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 다운로드 실패"
+        ) from e
+    many = len(image_urls) > 1
+    if version is None:
+        pages = await stream_pages(shuttle.images, image_urls)
+        return StreamingResponse(
+            base64_json_chunks(pages, many),
+            media_type=Config.Accept.JSON,
+            headers={"ETag": weak_urls_etag("base64", image_urls)},
+        )
+
+    key = ("base64", index)
+    cached = shuttle.representations.peek(key, version)
+    if cached is not None:
+        return cached_response(request, cached, CACHE_CONTROL)
+
+    etag = make_etag(f"base64:{version}".encode("ascii"))
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=Config.HttpStatus.NOT_MODIFIED, headers=headers)
+    pages = await stream_pages(shuttle.images, image_urls)
+    chunks = base64_json_chunks(pages, many)
+    return StreamingResponse(
+        shuttle.representations.tee(key, version, chunks, etag, Config.Accept.JSON),
+        media_type=Config.Accept.JSON,
+        headers=headers,
     )
 
 
-async def build_response_zip(image_urls: list[str]):
+async def build_response_zip(
+    image_urls: list[str],
+    images: ImageCache,
+    request: Request,
+    bundles: ZipBundleCache,
+):
     """Zip 파일 반환 값 생성하는 함수입니다.
 
+    이미지 세트의 묶음 파일이 디스크에 있으면 Range 요청을 지원하는 파일 응답으로
+    보냅니다. 없으면 백그라운드에서 묶음을 만들면서, 이번 응답은 페이지를 받는 대로
+    ZIP 항목으로 스트리밍합니다. (묶음과 같은 바이트이므로 같은 ETag를 사용)
+    Range 요청인데 묶음이 없으면 묶음이 만들어질 때까지 기다립니다.
+
+    아직 받지 않은 페이지가 있으면(콜드 캐시) 내용 해시를 기다리지 않고 첫 페이지가
+    오는 대로 스트리밍하며, URL 목록으로 만든 약한 ETag를 붙입니다. 이 경우 304로
+    응답하지 않고 묶음도 만들지 않습니다. (다음 요청부터 강한 ETag와 묶음 사용)
+
     Args:
         image_urls (list[str]): 이미지 URL 리스트
+        images (ImageCache): 이미지 캐시
+        request (Request): 현재 요청
+        bundles (ZipBundleCache): ZIP 묶음 캐시
 
     Returns:
-        StreamingResponse: 이미지들을 포함한 ZIP 파일 스트리밍 응답
+        Response: ZIP 파일 응답 또는 스트리밍 응답
     """
-    zip_buffer = io.BytesIO()
-    async with httpx.AsyncClient() as client:
-        with zipfile.ZipFile(zip_buffer, "w") as zip_file:
-            for idx, url in enumerate(image_urls, 1):
-                resp = await client.get(url, timeout=10)
-                if resp.status_code != Config.HttpStatus.OK:
-                    raise HTTPException(
-                        status_code=Config.HttpStatus.BAD_GATEWAY,
-                        detail=f"이미지 다운로드 실패: {url}",
-                    )
-                zip_file.writestr(f"shuttle_{idx}.jpg", resp.content)
-    zip_buffer.seek(0)
+    try:
+        key = await bundles.cached_key(image_urls)
+        if key is None and "range" in request.headers:
+            key = await bundles.key(image_urls)
+    except (FetchError, httpx.HTTPError) as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 다운로드 실패"
+        ) from e
+    headers = {"Content-Disposition": "attachment; filename=shuttle_images.zip"}
+    if key is None:
+        pages = await stream_pages(images, image_urls)
+        return StreamingResponse(
+            stream_bundle(pages),
+            media_type=Config.Accept.ZIP,
+            headers={**headers, "ETag": weak_urls_etag("zip", image_urls)},
+        )
+
+    etag = bundles.etag(key)
+
+    path = bundles.ready(key)
+    if path is None and "range" in request.headers:
+        try:
+            path = await asyncio.shield(bundles.build(image_urls, key))
+        except (FetchError, httpx.HTTPError, ValueError) as e:
+            raise HTTPException(
+                status_code=Config.HttpStatus.BAD_GATEWAY, detail="ZIP 생성 실패"
+            ) from e
+        except OSError as e:
+            logger.warning(
+                f"[ZipBundleCache] 묶음 파일 사용 불가, 스트리밍으로 응답: {e}"
+            )
+    if path is not None:
+        try:
+            return await ranged_file_response(
+                request, path, Config.Accept.ZIP, etag=etag, headers=headers
+            )
+        except FileNotFoundError:
+            pass  # 다른 워커가 오래된 묶음을 정리한 경우 스트리밍으로 응답
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=Config.HttpStatus.NOT_MODIFIED, headers={"ETag": etag}
+        )
+    bundles.build(image_urls, key)
+    pages = await stream_pages(images, image_urls)
     return StreamingResponse(
-        zip_buffer,
-        media_type="application/zip",
-        headers={"Content-Disposition": "attachment; filename=shuttle_images.zip"},
+        stream_bundle(pages),
+        media_type=Config.Accept.ZIP,
+        headers={**headers, "ETag": etag, "Accept-Ranges": "bytes"},
     )
 
 
-async def build_response_octet_stream(image_urls: list[str]):
+async def build_response_octet_stream(
+    image_urls: list[str],
+    images: ImageCache,
+    request: Request,
+    bundles: ZipBundleCache,
+):
     """Octet-stream 반환 값 생성하는 함수입니다.
 
     Args:
         image_urls (list[str]): 이미지 URL 리스트
+        images (ImageCache): 이미지 캐시
+        request (Request): 현재 요청
+        bundles (ZipBundleCache): ZIP 묶음 캐시
 
     Returns:
-        StreamingResponse: 단일 이미지 또는 ZIP 파일 스트리밍 응답
+        Response: 단일 이미지 파일 응답 또는 ZIP 파일 응답
     """
     if len(image_urls) == 1:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(image_urls[0], timeout=10)
-            if resp.status_code != Config.HttpStatus.OK:
-                raise HTTPException(
-                    status_code=Config.HttpStatus.BAD_GATEWAY,
-                    detail="이미지 다운로드 실패",
-                )
-            return StreamingResponse(
-                iter([resp.content]),
-                media_type="image/jpeg",
-                headers={"Content-Disposition": "inline; filename=shuttle.jpg"},
-            )
-    else:
-        return await build_response_zip(image_urls)
+        return await jpeg_file_response(request, images, image_urls[0])
+    return await build_response_zip(image_urls, images, request, bundles)
 
 
-async def build_response_text(image_urls: list[str]):
+async def build_response_text(
+    image_urls: list[str],
+    request: Request,
+    representations: RepresentationCache,
+    index: Optional[int] = None,
+):
     """Plain text 반환 값 생성하는 함수입니다.
 
     Args:
         image_urls (list[str]): 이미지 URL 리스트
+        request (Request): 현재 요청
+        representations (RepresentationCache): 표현 캐시
+        index (Optional[int]): 단일 이미지 요청의 index
 
     Returns:
-        PlainTextResponse: 첫 번째 이미지 URL을 포함한 텍스트 응답
+        Response: 첫 번째 이미지 URL을 포함한 텍스트 응답
     """
-    return PlainTextResponse(content=image_urls[0])
+
+    async def render() -> bytes:
+        return image_urls[0].encode("utf-8")
+
+    return await build_cached_response(
+        request,
+        representations.get(
+            ("text", index),
+            urls_version(image_urls),
+            render,
+            f"{Config.Accept.TEXT}; charset=utf-8",
+        ),
+    )
 
 
-async def build_response_jpeg(image_urls: list[str]):
+async def build_response_jpeg(
+    image_urls: list[str], images: ImageCache, request: Request
+):
     """JPEG 이미지 반환 값 생성하는 함수입니다.
 
     Args:
         image_urls (list[str]): 이미지 URL 리스트
+        images (ImageCache): 이미지 캐시
+        request (Request): 현재 요청
 
     Returns:
-        StreamingResponse: JPEG 이미지 스트리밍 응답
+        Response: 디스크 캐시의 JPEG 이미지 파일 응답
     """
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(image_urls[0], timeout=10)
-        if resp.status_code != Config.HttpStatus.OK:
-            raise HTTPException(
-                status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 다운로드 실패"
+    return await jpeg_file_response(request, images, image_urls[0])
+
+
+async def build_variant_response(
+    image_url: str, spec: VariantSpec, variants: ImageVariantCache, request: Request
+) -> Response:
+    """WebP/축소 변환 이미지 반환 값 생성하는 함수입니다.
+
+    ETag는 원본 내용 해시와 변환 옵션으로 정하므로, 같은 원본이면 변환하기 전에
+    304로 응답할 수 있습니다.
+
+    Args:
+        image_url (str): 원본 이미지 URL
+        spec (VariantSpec): 변환 옵션
+        variants (ImageVariantCache): 변환 이미지 캐시
+        request (Request): 현재 요청 (If-None-Match 처리용)
+
+    Returns:
+        Response: 변환된 이미지 응답 또는 304 응답
+
+    Raises:
+        HTTPException: Pillow가 없으면 501, 원본을 받지 못하거나 변환하지 못하면 502
+    """
+    headers = {
+        "Content-Disposition": f'inline; filename="shuttle.{spec.format}"',
+        "Vary": "Accept",
+        "Cache-Control": CACHE_CONTROL,
+    }
+    try:
+        etag = spec.etag(await variants.images.digest(image_url))
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=Config.HttpStatus.NOT_MODIFIED,
+                headers={**headers, "ETag": etag},
             )
-        return StreamingResponse(
-            iter([resp.content]),
-            media_type="image/jpeg",
-            headers={"Content-Disposition": "inline; filename=shuttle.jpg"},
-        )
+        digest, content = await variants.get(image_url, spec)
+    except VariantUnavailableError as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.NOT_IMPLEMENTED, detail=str(e)
+        ) from e
+    except (FetchError, httpx.HTTPError) as e:
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 다운로드 실패"
+        ) from e
+    except VariantRenderError as e:  # 이미지가 아니거나 압축 폭탄인 경우
+        raise HTTPException(
+            status_code=Config.HttpStatus.BAD_GATEWAY, detail="이미지 변환 실패"
+        ) from e
+    return Response(
+        content=content,
+        media_type=spec.media_type,
+        headers={**headers, "ETag": spec.etag(digest)},
+    )
 
 
-async def build_image_response(image_urls: Union[str, list[str]], response_type: str):
+async def build_image_response(
+    image_urls: Union[str, list[str]],
+    response_type: str,
+    request: Request,
+    shuttle: ShuttleImageService,
+    index: Optional[int] = None,
+):
     """이미지 응답 생성하는 함수입니다.
 
+    json, text, base64 응답은 버전별로 미리 만든 본문을, jpeg와 zip 응답은 디스크의
+    이미지/묶음 파일을 그대로 보냅니다.
+
     Args:
         image_urls (Union[str, list[str]]): 이미지 URL 또는 URL 리스트
-        response_type (str): 응답 타입 (json, base64, zip, octet-stream, text, jpeg, png)
+        response_type (str): 응답 타입 (json, base64, zip, octet-stream, text, jpeg)
+        request (Request): 현재 요청 (조건부/Range 요청 처리용)
+        shuttle (ShuttleImageService): 셔틀버스 이미지 서비스
+        index (Optional[int]): 단일 이미지 요청의 index (전체 요청이면 None)
 
     Returns:
         Response: 요청된 타입에 따른 FastAPI 응답 객체
@@ -154,16 +510,17 @@ async def build_image_response(image_urls: Union[str, list[str]], response_type:
             status_code=Config.HttpStatus.NOT_FOUND, detail="이미지 없음"
         )
 
+    images, bundles = shuttle.images, shuttle.bundles
     if response_type == "json":
-        return await build_response_json(urls)
+        return await build_response_json(urls, request, shuttle.representations, index)
     if response_type == "base64":
-        return await build_response_base64(urls)
+        return await build_response_base64(urls, request, shuttle, index)
     if response_type == "zip":
-        return await build_response_zip(urls)
+        return await build_response_zip(urls, images, request, bundles)
     if response_type == "octet-stream":
-        return await build_response_octet_stream(urls)
+        return await build_response_octet_stream(urls, images, request, bundles)
     if response_type == "text":
-        return await build_response_text(urls)
+        return await build_response_text(urls, request, shuttle.representations, index)
     if response_type == "jpeg":
-        return await build_response_jpeg(urls)
+        return await build_response_jpeg(urls, images, request)
     raise HTTPException(status_code=400, detail="지원되지 않는 response_type입니다.")
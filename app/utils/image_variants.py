@@ -0,0 +1,179 @@
+"""셔틀버스 이미지의 WebP/축소 변환본을 만들고 캐시하는 모듈
+
+변환은 CPU를 오래 쓰므로 이벤트 루프를 막지 않도록 프로세스 풀에서 실행합니다.
+변환 결과는 원본 내용 해시와 변환 옵션을 키로 메모리 LRU에 보관하므로, 원본이
+바뀌면 자연스럽게 새 변환본을 만들고 같은 요청은 변환을 한 번만 합니다.
+
+Pillow가 설치되지 않은 환경에서는 `VariantUnavailableError`를 발생시키며, 원본
+JPEG 응답은 그대로 동작합니다.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import io
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from app.config import Config, logger
+from app.utils.cache import CacheStats
+from app.utils.image_cache import ImageCache
+
+VariantFormat = Literal["jpeg", "webp"]
+
+MEDIA_TYPES = {"jpeg": Config.ImageType.JPEG, "webp": Config.ImageType.WEBP}
+
+
+class VariantUnavailableError(Exception):
+    """Pillow가 없어 이미지를 변환할 수 없는 경우"""
+
+
+class VariantRenderError(Exception):
+    """원본이 이미지가 아니거나 너무 커서(압축 폭탄) 변환하지 못한 경우"""
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    """이미지 변환 옵션
+
+    Attributes:
+        format (VariantFormat): 출력 형식 (jpeg, webp)
+        width (Optional[int]): 출력 너비(px), 없으면 원본 너비 (확대하지 않음)
+        quality (int): 인코딩 품질 (1~100)
+    """
+
+    format: VariantFormat
+    width: Optional[int]
+    quality: int
+
+    @property
+    def media_type(self) -> str:
+        """출력 형식의 Content-Type"""
+        return MEDIA_TYPES[self.format]
+
+    def etag(self, digest: str) -> str:
+        """원본 내용 해시와 변환 옵션으로 변환본의 강한 ETag를 만듭니다."""
+        token = f"{digest}:{self.format}:{self.width}:{self.quality}"
+        return f'"{hashlib.sha256(token.encode("ascii")).hexdigest()[:32]}"'
+
+
+def pillow_available() -> bool:
+    """Pillow 설치 여부"""
+    return importlib.util.find_spec("PIL") is not None
+
+
+def render_variant(data: bytes, spec: VariantSpec) -> bytes:
+    """원본 이미지 바이트를 spec에 맞게 변환합니다. (프로세스 풀에서 실행)"""
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as original:
+            original.load()
+            resized = original
+            if spec.width is not None and spec.width < original.width:
+                height = max(1, round(original.height * spec.width / original.width))
+                resized = original.resize(
+                    (spec.width, height), Image.Resampling.LANCZOS
+                )
+            converted = resized
+            if resized.mode not in ("RGB", "L"):
+                converted = resized.convert("RGB")
+
+            output = io.BytesIO()
+            if spec.format == "webp":
+                converted.save(output, "WEBP", quality=spec.quality, method=4)
+            else:
+                converted.save(output, "JPEG", quality=spec.quality, optimize=True)
+            return output.getvalue()
+    except (OSError, Image.DecompressionBombError) as e:
+        # 프로세스 풀에서 돌려받을 수 있도록 Pillow 예외 대신 모듈 예외로 변환
+        raise VariantRenderError(str(e)) from e
+
+
+class ImageVariantCache:
+    """원본 해시 + 변환 옵션별 변환 결과 메모리 LRU"""
+
+    def __init__(
+        self,
+        images: ImageCache,
+        workers: int = Config.IMAGE_VARIANT_WORKERS,
+        max_bytes: int = Config.IMAGE_VARIANT_CACHE_MAX_BYTES,
+    ):
+        """ImageVariantCache를 초기화합니다. (프로세스 풀은 처음 변환할 때 생성)
+
+        Args:
+            images (ImageCache): 원본 이미지 캐시
+            workers (int): 변환에 사용할 프로세스 수
+            max_bytes (int): 변환 결과를 보관할 최대 메모리(바이트)
+        """
+        self.images = images
+        self.workers = workers
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, VariantSpec], bytes] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[tuple[str, VariantSpec], asyncio.Task] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.stats = CacheStats()
+
+    def _remember(self, key: tuple[str, VariantSpec], data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    async def _render(
+        self, url: str, key: tuple[str, VariantSpec]
+    ) -> tuple[str, bytes]:
+        try:
+            # 키를 정한 뒤 원본이 바뀌었으면 실제로 변환한 원본의 해시로 보관
+            digest, source = await self.images.get_with_digest(url)
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(
+                self._pool, render_variant, source, key[1]
+            )
+            self._remember((digest, key[1]), data)
+            return digest, data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get(self, url: str, spec: VariantSpec) -> tuple[str, bytes]:
+        """URL 이미지를 spec에 맞게 변환한 바이트를 반환합니다.
+
+        Returns:
+            tuple[str, bytes]: 변환에 쓴 원본의 내용 해시와 변환된 바이트
+
+        Raises:
+            VariantUnavailableError: Pillow가 설치되어 있지 않은 경우
+            VariantRenderError: 원본을 이미지로 변환하지 못한 경우
+            FetchError: 원본 이미지를 받지 못한 경우
+        """
+        if not pillow_available():
+            raise VariantUnavailableError("이미지 변환에는 Pillow가 필요합니다.")
+
+        key = (await self.images.digest(url), spec)
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return key[0], data
+
+        self.stats.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._render(url, key))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    def close(self):
+        """프로세스 풀을 종료합니다. (lifespan 종료 시 호출)"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+            logger.info("[ImageVariantCache] 변환 프로세스 풀 종료")
@@ -0,0 +1,267 @@
+"""Prometheus 텍스트 형식으로 내보내는 가벼운 메트릭 레지스트리
+
+요청마다 기록되는 값은 이벤트 루프 한 스레드에서만 바뀌므로 잠금 없이 dict에
+누적하고, 히스토그램은 `bisect`로 버킷 하나만 증가시킵니다. 누적 버킷 계산과 텍스트
+직렬화는 `/metrics`를 조회할 때만 합니다.
+
+캐시 적중률처럼 다른 객체가 이미 세고 있는 값은 `register_collector`로 등록한
+함수가 조회 시점에 읽어 옵니다.
+"""
+
+import functools
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# (라벨, 값, 이름 접미사) 예: ({"le": "0.1"}, 3, "_bucket")
+Sample = tuple[Mapping[str, str], float, str]
+# (메트릭 이름, 타입, 설명, 샘플 목록)
+Family = tuple[str, str, str, list[Sample]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Counter를 초기화합니다.
+
+        Args:
+            name (str): 메트릭 이름
+            documentation (str): HELP 설명
+            labelnames (Sequence[str]): 라벨 이름 (inc에는 같은 순서로 값을 전달)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        """라벨 값 조합의 카운터를 amount만큼 증가시킵니다."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """라벨 값 조합의 현재 값을 반환합니다."""
+        return self._values.get(labels, 0.0)
+
+    def collect(self) -> Iterable[Family]:
+        """라벨 조합별 값을 counter 메트릭 하나로 내보냅니다."""
+        samples = [
+            (dict(zip(self.labelnames, labels, strict=True)), value, "")
+            for labels, value in self._values.items()
+        ]
+        yield self.name, "counter", self.documentation, samples
+
+
+class Histogram:
+    """고정 버킷 히스토그램"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Histogram을 초기화합니다.
+
+        Args:
+            name (str): 메트릭 이름 (`_bucket`, `_sum`, `_count`가 붙음)
+            documentation (str): HELP 설명
+            labelnames (Sequence[str]): 라벨 이름
+            buckets (Sequence[float]): 오름차순 버킷 상한 (+Inf는 자동 추가)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # 라벨 값 조합 → [버킷별 개수..., +Inf 개수, 합계]
+        self._values: Dict[tuple, list] = {}
+
+    def observe(self, value: float, *labels: str):
+        """값 하나를 기록합니다."""
+        counts = self._values.get(labels)
+        if counts is None:
+            counts = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """라벨 값 조합의 관측 횟수를 반환합니다."""
+        counts = self._values.get(labels)
+        return sum(counts[:-1]) if counts is not None else 0
+
+    def collect(self) -> Iterable[Family]:
+        """라벨 조합별 누적 버킷, 합계, 개수를 histogram 메트릭 하나로 내보냅니다."""
+        samples = []
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for labels, counts in self._values.items():
+            base = dict(zip(self.labelnames, labels, strict=True))
+            cumulative = 0
+            for bound, count in zip(bounds, counts[:-1], strict=True):
+                cumulative += count
+                samples.append(({**base, "le": bound}, cumulative, "_bucket"))
+            samples.append((base, counts[-1], "_sum"))
+            samples.append((base, cumulative, "_count"))
+
+        yield self.name, "histogram", self.documentation, samples
+
+
+class MetricsRegistry:
+    """메트릭과 수집 함수를 모아 Prometheus 텍스트로 내보내는 레지스트리"""
+
+    def __init__(self):
+        """MetricsRegistry를 초기화합니다."""
+        self._metrics: Dict[str, object] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Family]]] = {}
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """카운터를 만들어 등록합니다."""
+        metric = Counter(name, documentation, labelnames)
+        self._metrics[name] = metric
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """히스토그램을 만들어 등록합니다."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics[name] = metric
+        return metric
+
+    def register_collector(self, key: str, collector: Callable[[], Iterable[Family]]):
+        """조회할 때마다 호출할 수집 함수를 등록합니다. (같은 key면 교체)"""
+        self._collectors[key] = collector
+
+    def unregister_collector(self, key: str):
+        """수집 함수를 제거합니다."""
+        self._collectors.pop(key, None)
+
+    def render(self) -> str:
+        """모든 메트릭을 Prometheus 텍스트 형식(0.0.4)으로 직렬화합니다."""
+        families: list[Family] = []
+        for metric in self._metrics.values():
+            families.extend(metric.collect())
+        for collector in self._collectors.values():
+            families.extend(collector())
+
+        lines = []
+        for name, kind, documentation, samples in families:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value, suffix in samples:
+                lines.append(
+                    f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ("method", "route", "status", "response_type"),
+)
+HTTP_RESPONSE_BYTES = registry.counter(
+    "http_response_bytes_total",
+    "응답 본문으로 보낸 바이트 수",
+    ("route", "response_type"),
+)
+UPSTREAM_DURATION = registry.histogram(
+    "ibook_upstream_duration_seconds",
+    "iBook 업스트림 호출 시간 (BookDownloader 메서드별)",
+    ("method",),
+)
+UPSTREAM_ERRORS = registry.counter(
+    "ibook_upstream_errors_total",
+    "iBook 업스트림 호출 실패 횟수 (BookDownloader 메서드별)",
+    ("method", "reason"),
+)
+
+
+def _error_reason(error: Exception) -> str:
+    status_code = getattr(error, "status_code", None)
+    return str(status_code) if status_code is not None else type(error).__name__
+
+
+def observe_upstream(method: Optional[str] = None):
+    """비동기 메서드의 호출 시간과 실패를 업스트림 메트릭에 기록하는 데코레이터
+
+    Args:
+        method (Optional[str]): method 라벨 값, 없으면 함수 이름
+    """
+
+    def decorator(func):
+        label = method or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                UPSTREAM_ERRORS.inc(label, _error_reason(e))
+                raise
+            finally:
+                UPSTREAM_DURATION.observe(time.perf_counter() - started, label)
+
+        return wrapper
+
+    return decorator
+
+
+def cache_families(caches: Mapping[str, tuple[int, int]]) -> Iterable[Family]:
+    """캐시별 (적중, 실패) 횟수로 적중/실패 카운터와 적중률 게이지를 만듭니다."""
+    hits, misses, ratios = [], [], []
+    for cache, (hit, miss) in caches.items():
+        labels = {"cache": cache}
+        hits.append((labels, hit, ""))
+        misses.append((labels, miss, ""))
+        ratios.append((labels, hit / (hit + miss) if hit + miss else 0.0, ""))
+    yield "cache_hits_total", "counter", "캐시 적중 횟수", hits
+    yield "cache_misses_total", "counter", "캐시 실패 횟수", misses
+    yield "cache_hit_ratio", "gauge", "캐시 적중률 (시작 이후 누적)", ratios
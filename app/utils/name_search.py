@@ -0,0 +1,274 @@
+"""조직 이름 자동완성/퍼지 검색 인덱스 모듈
+
+조직 이름을 자모(jamo)와 초성(chosung)으로 분해해 n-gram 역색인을 만듭니다.
+
+- "컴퓨터공" / "컴퓨턱" 처럼 입력 중인 이름은 자모 접두사로,
+- "ㅋㅍㅌ" 처럼 초성만 입력한 경우는 초성 접두사로,
+- "공학" 처럼 이름 중간 일부는 자모/초성 부분 문자열로 찾습니다.
+
+이름 id는 순위(짧은 이름 우선, 같은 길이는 사전순)대로 부여되고 각 posting
+리스트도 id 오름차순이므로, 후보를 앞에서부터 검사하다가 limit개를 채우면 바로
+멈출 수 있습니다.
+"""
+
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Literal
+
+from app.utils.university_structure import UniversityStructure
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# 겹받침/이중모음은 키보드 입력 순서대로 나눠야 입력 중인 글자와 접두사가 맞음
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+}
+COMPAT_CONSONANTS = frozenset(chr(c) for c in range(0x3131, 0x314F))  # ㄱ ~ ㅎ
+COMPAT_VOWELS = frozenset(chr(c) for c in range(0x314F, 0x3164))  # ㅏ ~ ㅣ
+
+ANCHOR = "\x00"  # 접두사 검색을 부분 문자열 검색으로 처리하기 위한 시작 표시
+MIN_GRAM = 2
+MAX_GRAM = 3
+
+
+def normalize_name(text: str) -> str:
+    """NFC 정규화 후 대소문자와 공백 차이를 제거합니다."""
+    return "".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 키보드 입력 순서의 자모열로 분해합니다.
+
+    예) "컴퓨터" -> "ㅋㅓㅁㅍㅠㅌㅓ", "닭" -> "ㄷㅏㄹㄱ"
+    """
+    out = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            out.append(CHOSUNG[index // 588])
+            jung = JUNGSUNG[(index % 588) // 28]
+            out.append(COMPOUND_JAMO.get(jung, jung))
+            jong = index % 28
+            if jong:
+                out.append(COMPOUND_JAMO.get(JONGSUNG[jong], JONGSUNG[jong]))
+        else:
+            out.append(COMPOUND_JAMO.get(char, char))
+    return "".join(out)
+
+
+def extract_chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꾸고 나머지 문자는 그대로 둡니다.
+
+    예) "컴퓨터공학부" -> "ㅋㅍㅌㄱㅎㅂ", "SW대학" -> "swㄷㅎ" (정규화 후)
+    """
+    out = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            out.append(CHOSUNG[(code - HANGUL_BASE) // 588])
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def is_chosung_query(text: str) -> bool:
+    """완성형 음절/모음 없이 자음이 하나 이상 포함된 질의인지 확인합니다."""
+    has_consonant = False
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST or char in COMPAT_VOWELS:
+            return False
+        if char in COMPAT_CONSONANTS:
+            has_consonant = True
+    return has_consonant
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """자동완성 결과 하나
+
+    Attributes:
+        name (str): 조직 이름
+        path (str): 조직 전체 경로
+        type (Literal["unit", "group"]): 조직 종류
+    """
+
+    name: str
+    path: str
+    type: Literal["unit", "group"]
+
+
+class _GramIndex:
+    """문자열 목록에 대한 n-gram 역색인 (posting은 id 오름차순)"""
+
+    def __init__(self, forms: List[str]):
+        self.forms = forms
+        self.postings: Dict[str, List[int]] = {}
+
+        for entry_id, form in enumerate(forms):
+            anchored = ANCHOR + form
+            grams = set()
+            for size in range(MIN_GRAM, MAX_GRAM + 1):
+                for start in range(len(anchored) - size + 1):
+                    grams.add(anchored[start : start + size])
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(entry_id)
+
+    def _candidates(self, needle: str) -> List[int]:
+        """needle을 포함할 수 있는 후보 중 가장 짧은 posting 리스트를 반환"""
+        size = min(MAX_GRAM, len(needle))
+        best: List[int] = []
+        for start in range(len(needle) - size + 1):
+            posting = self.postings.get(needle[start : start + size])
+            if posting is None:
+                return []
+            if not best or len(posting) < len(best):
+                best = posting
+        return best
+
+    def search(self, needle: str, limit: int, seen: set[int]) -> Iterable[int]:
+        """needle을 포함하는 id를 순위 순서로 최대 limit개 생성합니다.
+
+        Args:
+            needle (str): 찾을 문자열 (접두사 검색은 ANCHOR로 시작)
+            limit (int): 새로 찾을 최대 개수
+            seen (set[int]): 이미 결과에 포함된 id (건너뜀)
+        """
+        if len(needle) < MIN_GRAM or limit <= 0:
+            return
+        target = needle.removeprefix(ANCHOR)
+        anchored = needle.startswith(ANCHOR)
+        forms = self.forms
+        found = 0
+        for entry_id in self._candidates(needle):
+            if entry_id in seen:
+                continue
+            form = forms[entry_id]
+            if form.startswith(target) if anchored else target in form:
+                yield entry_id
+                found += 1
+                if found >= limit:
+                    return
+
+
+class NameSearchIndex:
+    """조직 이름 자동완성 인덱스"""
+
+    def __init__(self, entries: Dict[str, List[NameMatch]]):
+        """이름 -> 결과 목록으로부터 인덱스를 구성합니다.
+
+        Args:
+            entries (Dict[str, List[NameMatch]]): 이름별 조직 목록
+        """
+        self._matches: List[List[NameMatch]] = []
+        normalized: List[str] = []
+        by_normalized: Dict[str, List[NameMatch]] = {}
+        for name, matches in entries.items():
+            by_normalized.setdefault(normalize_name(name), []).extend(matches)
+
+        # id를 순위 순서(짧은 이름 우선, 같은 길이면 사전순)대로 부여
+        for key in sorted(by_normalized, key=lambda k: (len(k), k)):
+            normalized.append(key)
+            self._matches.append(by_normalized[key])
+
+        self._exact = {key: entry_id for entry_id, key in enumerate(normalized)}
+        self._jamo = _GramIndex([decompose_jamo(key) for key in normalized])
+        self._chosung = _GramIndex([extract_chosung(key) for key in normalized])
+
+    @classmethod
+    def from_structure(cls, structure: UniversityStructure) -> "NameSearchIndex":
+        """조직 구조의 이름 인덱스로부터 자동완성 인덱스를 만듭니다. (루트 제외)"""
+        entries: Dict[str, List[NameMatch]] = {}
+        for name in structure.names():
+            for node in structure.nodes_named(name):
+                if node == structure.root:
+                    continue
+                entries.setdefault(name, []).append(
+                    NameMatch(
+                        name=name,
+                        path=structure.path_of(node),
+                        type=structure.type_of(node),
+                    )
+                )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        """색인된 (정규화한) 이름 수"""
+        return len(self._matches)
+
+    def search(self, query: str, limit: int = 10) -> List[NameMatch]:
+        """질의에 맞는 조직을 순위대로 최대 limit개 반환합니다.
+
+        순위는 정확히 일치 > 자모 접두사 > 초성 접두사 > 자모 부분 문자열 >
+        초성 부분 문자열 순이며, 같은 구간에서는 짧은 이름이 먼저 옵니다.
+
+        Args:
+            query (str): 검색어 (완성형, 입력 중인 글자, 초성 모두 가능)
+            limit (int): 최대 결과 수
+
+        Returns:
+            List[NameMatch]: 순위 순서의 결과 목록
+        """
+        key = normalize_name(query)
+        if not key or limit <= 0:
+            return []
+
+        results: List[NameMatch] = []
+        for entry_id in self._ranked_ids(key, limit):
+            for match in self._matches[entry_id]:
+                results.append(match)
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def _ranked_ids(self, key: str, limit: int) -> List[int]:
+        """정규화한 검색어에 맞는 이름 id를 순위대로 최대 limit개 반환합니다."""
+        jamo = decompose_jamo(key)
+        chosung_query = is_chosung_query(key)
+        # 한 이름의 모든 경로가 결과가 되므로, 이름 id는 limit개면 충분
+        ids: List[int] = []
+        seen: set[int] = set()
+
+        def collect(found: Iterable[int]):
+            for entry_id in found:
+                ids.append(entry_id)
+                seen.add(entry_id)
+
+        exact = self._exact.get(key)
+        if exact is not None:
+            collect([exact])
+
+        tiers = [(self._jamo, ANCHOR + jamo)]
+        if chosung_query:
+            tiers.append((self._chosung, ANCHOR + key))
+        tiers.append((self._jamo, jamo))
+        if chosung_query:
+            tiers.append((self._chosung, key))
+
+        for index, needle in tiers:
+            if len(ids) >= limit:
+                break
+            collect(index.search(needle, limit - len(ids), seen))
+        return ids
@@ -0,0 +1,70 @@
+"""Accept 헤더의 q 값을 고려해 응답 형식을 고르는 모듈
+
+RFC 9110의 규칙을 따릅니다.
+
+- 각 후보 형식에는 그 형식과 일치하는 가장 구체적인 범위(`image/jpeg` >
+  `image/*` > `*/*`)의 q 값을 적용하며, q=0이면 제외합니다.
+- q 값이 같으면 형식을 직접 명시한 쪽을, 그래도 같으면 서버가 나열한 순서를 우선합니다.
+- Accept 헤더가 없거나 비어 있으면 첫 번째 후보를 고릅니다.
+"""
+
+from typing import Optional, Sequence
+
+
+def parse_accept(header: str) -> list[tuple[str, str, float]]:
+    """Accept 헤더를 (type, subtype, q) 목록으로 해석합니다. (잘못된 항목은 무시)"""
+    ranges = []
+    for item in header.split(","):
+        media_range, *params = item.split(";")
+        media_type, _, subtype = media_range.strip().lower().partition("/")
+        if not media_type or not subtype:
+            continue
+
+        q = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = -1.0
+        if 0.0 <= q <= 1.0:
+            ranges.append((media_type, subtype, q))
+    return ranges
+
+
+def negotiate(accept: Optional[str], offers: Sequence[str]) -> Optional[str]:
+    """Accept 헤더에 가장 잘 맞는 후보 형식을 고릅니다.
+
+    Args:
+        accept (Optional[str]): 요청의 Accept 헤더 값
+        offers (Sequence[str]): 서버가 제공할 수 있는 MIME 타입 (선호 순서)
+
+    Returns:
+        Optional[str]: 선택된 MIME 타입, 받아들일 수 있는 형식이 없으면 None
+    """
+    if not offers:
+        return None
+    if accept is None or not accept.strip():
+        return offers[0]
+
+    ranges = parse_accept(accept)
+    best, best_score = None, None
+    for order, offer in enumerate(offers):
+        offer_type, _, offer_subtype = offer.lower().partition("/")
+        match = None  # (구체성, q)
+        for media_type, subtype, q in ranges:
+            if media_type not in ("*", offer_type):
+                continue
+            if subtype not in ("*", offer_subtype):
+                continue
+            specificity = (media_type != "*") + (subtype != "*")
+            if match is None or specificity > match[0]:
+                match = (specificity, q)
+        if match is None or match[1] <= 0:
+            continue
+
+        score = (match[1], match[0], -order)
+        if best_score is None or score > best_score:
+            best, best_score = offer, score
+    return best
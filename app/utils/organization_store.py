@@ -0,0 +1,302 @@
+"""school_info.json 기반 조직 구조 스냅샷을 관리하는 모듈
+
+조직 구조는 버전이 붙은 불변 스냅샷으로 보관됩니다.
+파일 변경은 mtime/크기로 감지한 뒤 내용 해시로 확인하며, 새 구조는 이벤트 루프
+밖(스레드)에서 만들고 검증한 다음 참조 하나를 바꾸는 방식으로 교체합니다.
+요청은 시작 시점에 스냅샷을 한 번 잡아 끝까지 사용하므로 교체 중에도 일관된
+데이터를 보게 됩니다.
+
+직렬화된 응답 본문도 스냅샷에 캐시되므로, 데이터 버전이 바뀌면 캐시도 함께
+교체됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, List, Optional
+
+from app.config import Config, logger
+from app.utils.contact_index import ContactIndex
+from app.utils.http_cache import CachedBody
+from app.utils.name_search import NameSearchIndex
+from app.utils.university_structure import NODE_FIELDS, UniversityStructure
+
+TREE_KEY = ("tree",)
+
+
+@dataclass(frozen=True)
+class TreeView:
+    """노드 응답의 모양 (`depth`, `fields`, `flat` 쿼리 옵션)
+
+    Attributes:
+        depth (Optional[int]): 포함할 하위 조직 단계 수 (None이면 전체)
+        fields (tuple[str, ...]): 포함할 노드 필드 (`NODE_FIELDS` 순서)
+        flat (bool): 트리 대신 `path`가 붙은 전위 순회 리스트로 반환
+    """
+
+    depth: Optional[int] = None
+    fields: tuple[str, ...] = NODE_FIELDS
+    flat: bool = False
+
+    def cache_key(self, key: tuple) -> tuple:
+        """기본 모양이면 key 그대로, 아니면 모양을 덧붙인 캐시 키"""
+        return key if self == FULL_VIEW else (*key, self)
+
+
+FULL_VIEW = TreeView()
+
+
+def _dump_json(value) -> bytes:
+    # Pydantic의 model_dump_json과 같은 형식 (공백 없음, 한글 그대로)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def serialize_node(structure: UniversityStructure, node: int) -> bytes:
+    """노드 하나를 응답용 JSON 바이트로 직렬화합니다."""
+    return _dump_json(structure.to_dict(node))
+
+
+def serialize_nodes(structure: UniversityStructure, nodes: List[int]) -> bytes:
+    """노드 리스트를 응답용 JSON 바이트로 직렬화합니다."""
+    return _dump_json([structure.to_dict(node) for node in nodes])
+
+
+def serialize_view(structure: UniversityStructure, node: int, view: TreeView) -> bytes:
+    """노드를 view 모양의 응답용 JSON 바이트로 직렬화합니다."""
+    if view.flat:
+        return _dump_json(structure.to_flat(node, view.depth, view.fields))
+    return _dump_json(structure.to_dict(node, view.depth, view.fields))
+
+
+def serialize_batch(snapshot: "OrganizationSnapshot", queries: List[str]) -> bytes:
+    """일괄 조회 결과를 `OrganizationBatchResponse` 형식의 JSON으로 직렬화합니다.
+
+    모든 질의를 같은 스냅샷에서 `get_unit` 규칙으로 찾으며, 노드 본문은
+    `/organization/{path}` 응답과 같은 스냅샷 캐시를 재사용합니다.
+    같은 질의가 여러 번 오면 한 번만 찾습니다.
+    """
+    structure = snapshot.structure
+    items: dict[str, bytes] = {}
+    for query in queries:
+        if query in items:
+            continue
+        node = structure.get_unit(query)
+        if node is None:
+            items[query] = b'{"query":%s,"found":false,"path":null,"node":null}' % (
+                _dump_json(query)
+            )
+            continue
+        body = snapshot.render(
+            ("node", node), lambda node=node: serialize_node(structure, node)
+        ).body
+        items[query] = b'{"query":%s,"found":true,"path":%s,"node":%s}' % (
+            _dump_json(query),
+            _dump_json(structure.path_of(node)),
+            body,
+        )
+    return b'{"results":[%s]}' % b",".join(items[query] for query in queries)
+
+
+class StructureValidationError(Exception):
+    """조직 구조 데이터가 올바르지 않을 때 발생하는 예외"""
+
+
+@dataclass(frozen=True)
+class OrganizationSnapshot:
+    """특정 시점의 조직 구조 스냅샷
+
+    Attributes:
+        version (int): 프로세스 내에서 단조 증가하는 스냅샷 버전
+        structure (UniversityStructure): 인덱스가 구성된 조직 구조
+        search_index (NameSearchIndex): 이름 자동완성 인덱스
+        contact_index (ContactIndex): 전화번호/URL 역조회 인덱스
+        content_hash (str): 원본 JSON 파일의 SHA-256 해시
+        loaded_at (float): 스냅샷 생성 시각 (epoch seconds)
+        rendered (dict): 캐시 키 -> 직렬화된 응답 본문
+        views (OrderedDict): 기본 모양이 아닌(`TreeView`) 캐시 키 -> 직렬화된 응답 본문
+            (최근 사용 순, 최대 `ORGANIZATION_VIEW_CACHE_SIZE`개)
+    """
+
+    version: int
+    structure: UniversityStructure
+    search_index: NameSearchIndex
+    contact_index: ContactIndex
+    content_hash: str
+    loaded_at: float
+    rendered: dict[Hashable, CachedBody] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    views: OrderedDict[Hashable, CachedBody] = field(
+        default_factory=OrderedDict, compare=False, repr=False
+    )
+
+    def render(self, key: Hashable, serialize: Callable[[], bytes]) -> CachedBody:
+        """key에 해당하는 직렬화 본문을 반환하고, 없으면 만들어 캐시합니다.
+
+        키는 노드 경로처럼 크기가 구조에 의해 제한되는 값이어야 합니다.
+        """
+        cached = self.rendered.get(key)
+        if cached is None:
+            cached = CachedBody.from_bytes(serialize())
+            self.rendered[key] = cached
+        return cached
+
+    def render_view(
+        self, view: TreeView, key: tuple, serialize: Callable[[], bytes]
+    ) -> CachedBody:
+        """view 모양의 직렬화 본문을 반환합니다.
+
+        기본 모양은 `render`로 캐시하고, 그 외 모양은 노드 × 옵션 조합으로 개수가
+        커질 수 있으므로 최근 사용 순 LRU로 캐시합니다.
+        """
+        if view == FULL_VIEW:
+            return self.render(key, serialize)
+        key = view.cache_key(key)
+        cached = self.views.get(key)
+        if cached is not None:
+            self.views.move_to_end(key)
+            return cached
+        cached = CachedBody.from_bytes(serialize())
+        self.views[key] = cached
+        while len(self.views) > Config.ORGANIZATION_VIEW_CACHE_SIZE:
+            self.views.popitem(last=False)
+        return cached
+
+
+def _build_structure(raw: bytes) -> UniversityStructure:
+    """원본 JSON 바이트로 조직 구조를 만들고 검증합니다."""
+    data = json.loads(raw)
+    if not isinstance(data, dict) or not data:
+        raise StructureValidationError("조직 데이터는 비어있지 않은 객체여야 합니다.")
+
+    structure = UniversityStructure.from_dict(data)
+    if not structure.is_group(structure.root):
+        raise StructureValidationError("최상위 조직은 하위 조직을 가져야 합니다.")
+    return structure
+
+
+class OrganizationStore:
+    """조직 구조 스냅샷을 보관하고 파일 변경 시 교체하는 클래스"""
+
+    def __init__(self, path: str):
+        """OrganizationStore를 초기화합니다.
+
+        Args:
+            path (str): 조직 구조 JSON 파일 경로
+        """
+        self.path = path
+        self._snapshot: Optional[OrganizationSnapshot] = None
+        self._stat_key: Optional[tuple[int, int]] = None
+        self._version = 0
+        self._watch_task: Optional[asyncio.Task] = None
+        self._reload_lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> OrganizationSnapshot:
+        """현재 스냅샷을 반환 (아직 로드되지 않았다면 동기 로드)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.load()
+        return snapshot
+
+    def _stat(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self) -> tuple[tuple[int, int], bytes]:
+        stat_key = self._stat()
+        with open(self.path, "rb") as f:
+            return stat_key, f.read()
+
+    def _swap(
+        self, stat_key: tuple[int, int], raw: bytes, content_hash: str
+    ) -> OrganizationSnapshot:
+        """구조를 만들고 검증한 뒤 스냅샷 참조를 교체합니다."""
+        structure = _build_structure(raw)
+        self._version += 1
+        snapshot = OrganizationSnapshot(
+            version=self._version,
+            structure=structure,
+            search_index=NameSearchIndex.from_structure(structure),
+            contact_index=ContactIndex.from_structure(structure),
+            content_hash=content_hash,
+            loaded_at=time.time(),
+        )
+        # 가장 비싼 전체 트리는 교체 전에 미리 직렬화
+        snapshot.render(TREE_KEY, lambda: serialize_node(structure, structure.root))
+        self._snapshot = snapshot  # 참조 대입 한 번으로 원자적으로 교체
+        self._stat_key = stat_key
+        logger.info(
+            f"[OrganizationStore] 조직 구조 v{snapshot.version} 적용 "
+            f"(sha256={content_hash[:12]})"
+        )
+        return snapshot
+
+    def load(self) -> OrganizationSnapshot:
+        """파일을 읽어 스냅샷을 동기적으로 만듭니다. (시작 시 사용)"""
+        stat_key, raw = self._read()
+        return self._swap(stat_key, raw, hashlib.sha256(raw).hexdigest())
+
+    def _reload_if_changed_sync(self) -> bool:
+        stat_key = self._stat()
+        if stat_key == self._stat_key:
+            return False
+
+        stat_key, raw = self._read()
+        # 검증에 실패해도 같은 파일을 반복해서 다시 읽지 않도록 먼저 기록
+        self._stat_key = stat_key
+        content_hash = hashlib.sha256(raw).hexdigest()
+        if self._snapshot is not None and content_hash == self._snapshot.content_hash:
+            return False  # touch 등으로 mtime만 바뀐 경우
+
+        self._swap(stat_key, raw, content_hash)
+        return True
+
+    async def reload_if_changed(self) -> bool:
+        """파일이 바뀌었으면 이벤트 루프 밖에서 재구성 후 교체합니다.
+
+        Returns:
+            bool: 새 스냅샷으로 교체되었으면 True
+        """
+        async with self._reload_lock:
+            try:
+                return await asyncio.to_thread(self._reload_if_changed_sync)
+            except (OSError, ValueError, StructureValidationError) as e:
+                # pydantic ValidationError, JSONDecodeError 모두 ValueError 하위 클래스
+                logger.error(f"[OrganizationStore] 조직 구조 갱신 실패, 기존 유지: {e}")
+                return False
+
+    async def _watch(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await self.reload_if_changed()
+
+    def start_watching(self, interval: float):
+        """interval(초)마다 파일 변경을 확인하는 백그라운드 작업을 시작합니다."""
+        if interval <= 0 or self._watch_task is not None:
+            return
+        self._watch_task = asyncio.create_task(self._watch(interval))
+        logger.info(f"[OrganizationStore] 파일 감시 시작 ({interval}초 간격)")
+
+    async def stop_watching(self):
+        """백그라운드 감시 작업을 종료합니다."""
+        if self._watch_task is None:
+            return
+        self._watch_task.cancel()
+        try:
+            await self._watch_task
+        except asyncio.CancelledError:
+            pass
+        self._watch_task = None
+
+
+organization_store = OrganizationStore(Config.school_info_path)
+
+
+def get_organization_snapshot() -> OrganizationSnapshot:
+    """현재 조직 구조 스냅샷을 반환 (FastAPI 의존성으로 사용)"""
+    return organization_store.snapshot
@@ -0,0 +1,136 @@
+"""이미지 세트 버전별로 미리 만든 응답 본문을 보관하는 모듈
+
+셔틀버스 이미지 응답(json, text, base64)은 그 응답을 이루는 URL 또는 이미지 내용이
+바뀌기 전까지 항상 같으므로, 표현(응답 타입, index)마다 현재 버전의 본문을 한 번만
+만들어 `CachedBody`로 보관합니다. 같은 요청이 다시 오면 dict 조회 한 번으로 끝납니다.
+
+버전이 바뀐 표현은 새로 만든 본문으로 교체되므로, 보관하는 본문 수는 표현 수를
+넘지 않습니다.
+
+본문이 큰 표현(base64)은 `peek`/`tee`로 캐시에 없으면 스트리밍하면서, 크기 제한
+이하일 때만 내보낸 청크로 본문을 채웁니다.
+"""
+
+import asyncio
+import hashlib
+from typing import AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional
+
+from app.config import Config
+from app.utils.cache import CacheStats
+from app.utils.http_cache import CachedBody
+
+
+def urls_version(image_urls: list[str]) -> str:
+    """이미지 URL 목록만으로 만드는 표현(json, text)의 버전을 계산합니다."""
+    return hashlib.sha256("\n".join(image_urls).encode("utf-8")).hexdigest()
+
+
+class RepresentationCache:
+    """표현별로 현재 버전의 응답 본문을 보관하는 캐시"""
+
+    def __init__(self, max_body_bytes: int = Config.SHUTTLE_REPRESENTATION_MAX_BYTES):
+        """RepresentationCache를 초기화합니다.
+
+        Args:
+            max_body_bytes (int): `tee`로 보관할 본문 하나의 최대 크기(바이트)
+        """
+        self.max_body_bytes = max_body_bytes
+        self._bodies: Dict[Hashable, tuple[str, CachedBody]] = {}
+        self._inflight: Dict[tuple[Hashable, str], asyncio.Task] = {}
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        """보관 중인 본문 수"""
+        return len(self._bodies)
+
+    @property
+    def size(self) -> int:
+        """보관 중인 본문의 총 바이트 수"""
+        return sum(len(cached.body) for _, cached in self._bodies.values())
+
+    def peek(self, key: Hashable, version: str) -> Optional[CachedBody]:
+        """key 표현의 version 본문이 있으면 반환합니다. (없으면 None)"""
+        entry = self._bodies.get(key)
+        if entry is not None and entry[0] == version:
+            self.stats.hits += 1
+            return entry[1]
+        self.stats.misses += 1
+        return None
+
+    async def tee(
+        self,
+        key: Hashable,
+        version: str,
+        chunks: AsyncIterator[bytes],
+        etag: str,
+        media_type: str,
+    ) -> AsyncIterator[bytes]:
+        """chunks를 그대로 내보내면서 key 표현의 version 본문으로 보관합니다.
+
+        끝까지 내보냈고 전체 크기가 max_body_bytes 이하일 때만 보관하며, 넘으면 그
+        즉시 모아 둔 청크를 버리므로 메모리에 쌓이는 양은 max_body_bytes를 넘지 않습니다.
+
+        Args:
+            key (Hashable): 표현 키
+            version (str): 표현을 이루는 입력의 버전
+            chunks (AsyncIterator[bytes]): 응답 본문 청크
+            etag (str): 보관할 본문의 ETag
+            media_type (str): 보관할 본문의 Content-Type
+        """
+        buffer: Optional[list[bytes]] = []
+        size = 0
+        async for chunk in chunks:
+            if buffer is not None:
+                size += len(chunk)
+                if size > self.max_body_bytes:
+                    buffer = None
+                else:
+                    buffer.append(chunk)
+            yield chunk
+        if buffer is not None:
+            body = CachedBody(b"".join(buffer), etag, media_type)
+            self._bodies[key] = (version, body)
+
+    async def _render(
+        self,
+        key: Hashable,
+        version: str,
+        render: Callable[[], Awaitable[bytes]],
+        media_type: str,
+    ) -> CachedBody:
+        try:
+            cached = CachedBody.from_bytes(await render(), media_type)
+            self._bodies[key] = (version, cached)
+            return cached
+        finally:
+            self._inflight.pop((key, version), None)
+
+    async def get(
+        self,
+        key: Hashable,
+        version: str,
+        render: Callable[[], Awaitable[bytes]],
+        media_type: str,
+    ) -> CachedBody:
+        """key 표현의 version 본문을 반환하고, 없으면 render로 한 번만 만듭니다.
+
+        Args:
+            key (Hashable): 표현 키 (예: ("base64", None), ("text", 1))
+            version (str): 표현을 이루는 입력의 버전 (URL 목록 해시, 이미지 내용 해시 등)
+            render (Callable[[], Awaitable[bytes]]): 본문을 만드는 코루틴 함수
+            media_type (str): 본문의 Content-Type
+
+        Returns:
+            CachedBody: 미리 만든 본문과 ETag
+        """
+        entry = self._bodies.get(key)
+        if entry is not None and entry[0] == version:
+            self.stats.hits += 1
+            return entry[1]
+
+        self.stats.misses += 1
+        task = self._inflight.get((key, version))
+        if task is None:
+            task = asyncio.create_task(self._render(key, version, render, media_type))
+            self._inflight[(key, version)] = task
+        return await asyncio.shield(task)
@@ -0,0 +1,268 @@
+"""느리거나 불안정한 업스트림을 다루기 위한 모듈
+
+- `LatencyTracker`: 최근 성공 응답 시간의 분위수로 헤지(hedge) 지연을 정합니다.
+- `hedged`: 첫 시도가 지연 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 끝난
+  결과를 씁니다. (멱등 요청에만 사용)
+- `RetryBudget`: 재시도와 헤지 요청이 전체 요청의 일정 비율을 넘지 않게 제한해
+  업스트림 장애 시 재시도가 부하를 키우지 않도록 합니다.
+- `CircuitBreaker`: 연속 실패가 쌓이면 일정 시간 요청을 보내지 않고 바로 실패시킨 뒤,
+  시험 요청 하나로 회복 여부를 확인합니다.
+- `backoff_delay`: full jitter 지수 백오프
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from app.config import Config
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class UpstreamPolicy:
+    """업스트림 호출 정책 (0이면 해당 기능 사용 안 함)
+
+    Attributes:
+        hedge_quantile (float): 헤지 지연으로 쓸 성공 응답 시간 분위수 (0이면 헤지 안 함)
+        hedge_min_delay (float): 헤지 지연 하한(초)
+        hedge_default_delay (float): 응답 시간 표본이 부족할 때의 헤지 지연(초)
+        max_retries (int): 요청 하나당 최대 재시도 횟수
+        retry_base_delay (float): 백오프 기본 지연(초)
+        retry_max_delay (float): 백오프 최대 지연(초)
+        budget_ratio (float): 요청 대비 허용할 재시도/헤지 비율
+        budget_min_per_second (float): 요청이 적을 때도 허용할 초당 재시도/헤지 수
+        breaker_failures (int): 서킷을 열 연속 실패 횟수 (0이면 서킷 사용 안 함)
+        breaker_cooldown (float): 서킷이 열린 뒤 시험 요청을 보내기까지의 시간(초)
+    """
+
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.05
+    hedge_default_delay: float = 1.0
+    max_retries: int = 2
+    retry_base_delay: float = 0.1
+    retry_max_delay: float = 2.0
+    budget_ratio: float = 0.1
+    budget_min_per_second: float = 1.0
+    breaker_failures: int = 5
+    breaker_cooldown: float = 30.0
+
+    @classmethod
+    def from_config(cls) -> "UpstreamPolicy":
+        """Config의 UPSTREAM_* 설정으로 정책을 만듭니다."""
+        return cls(
+            hedge_quantile=Config.UPSTREAM_HEDGE_QUANTILE,
+            hedge_min_delay=Config.UPSTREAM_HEDGE_MIN_DELAY,
+            hedge_default_delay=Config.UPSTREAM_HEDGE_DEFAULT_DELAY,
+            max_retries=Config.UPSTREAM_MAX_RETRIES,
+            retry_base_delay=Config.UPSTREAM_RETRY_BASE_DELAY,
+            retry_max_delay=Config.UPSTREAM_RETRY_MAX_DELAY,
+            budget_ratio=Config.UPSTREAM_RETRY_BUDGET_RATIO,
+            budget_min_per_second=Config.UPSTREAM_RETRY_BUDGET_MIN_PER_SECOND,
+            breaker_failures=Config.UPSTREAM_BREAKER_FAILURES,
+            breaker_cooldown=Config.UPSTREAM_BREAKER_COOLDOWN,
+        )
+
+
+@dataclass
+class ResilienceStats:
+    """헤지/재시도/서킷 카운터
+
+    Attributes:
+        hedges (int): 헤지 요청을 보낸 횟수
+        hedge_wins (int): 헤지 요청이 먼저 끝난 횟수
+        retries (int): 재시도한 횟수
+        budget_exhausted (int): 예산이 없어 재시도/헤지를 하지 않은 횟수
+        short_circuited (int): 서킷이 열려 요청을 보내지 않은 횟수
+        stale_served (int): 서킷이 열려 이전 응답을 대신 돌려준 횟수
+    """
+
+    hedges: int = 0
+    hedge_wins: int = 0
+    retries: int = 0
+    budget_exhausted: int = 0
+    short_circuited: int = 0
+    stale_served: int = 0
+
+
+class LatencyTracker:
+    """최근 성공 응답 시간을 보관하고 분위수를 계산하는 클래스"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """LatencyTracker를 초기화합니다.
+
+        Args:
+            window (int): 보관할 최근 표본 수
+            min_samples (int): 분위수를 계산하기 위한 최소 표본 수
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def observe(self, seconds: float):
+        """성공한 요청의 응답 시간을 기록합니다."""
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """최근 표본의 q 분위수 (표본이 부족하면 None)"""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class RetryBudget:
+    """요청 수에 비례해 재시도/헤지를 허용하는 토큰 버킷
+
+    요청마다 ratio만큼, 시간이 지나면 초당 min_per_second만큼 토큰이 쌓이고
+    재시도/헤지 하나에 토큰 하나를 씁니다.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, capacity: float = 10):
+        """RetryBudget을 초기화합니다. (토큰이 가득 찬 상태로 시작)
+
+        Args:
+            ratio (float): 요청 하나마다 쌓이는 토큰 수
+            min_per_second (float): 요청이 없어도 초당 쌓이는 토큰 수
+            capacity (float): 쌓아 둘 수 있는 최대 토큰 수 (최소 1)
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.min_per_second
+        )
+        self._updated = now
+
+    def deposit(self):
+        """요청 하나를 보낼 때 호출합니다."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """토큰이 있으면 하나 쓰고 True, 없으면 False"""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커
+
+    - closed: 요청을 보냄, 연속 실패가 failures회가 되면 open
+    - open: cooldown 동안 요청을 보내지 않음, 이후 half-open
+    - half-open: 시험 요청 하나만 보내고 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failures: int, cooldown: float):
+        """CircuitBreaker를 초기화합니다. (closed 상태로 시작)
+
+        Args:
+            failures (int): open으로 바꿀 연속 실패 횟수, 0 이하면 항상 closed
+            cooldown (float): open 상태를 유지할 시간(초)
+        """
+        self.failures = failures
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    def allow(self) -> bool:
+        """지금 요청을 보내도 되는지 확인합니다. (half-open이면 시험 요청 하나만 허용)"""
+        if self.failures <= 0 or self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self):
+        """요청 성공을 기록합니다."""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        """요청 실패를 기록합니다."""
+        self.consecutive_failures += 1
+        self._probing = False
+        if self.failures > 0 and (
+            self.state == self.HALF_OPEN or self.consecutive_failures >= self.failures
+        ):
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        """서킷이 열려 있으면 시험 요청까지 남은 시간(초), 아니면 0"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """attempt번째(1부터) 재시도 전 기다릴 시간 (full jitter 지수 백오프)"""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))  # noqa: S311
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    delay: Optional[float],
+    allow_hedge: Callable[[], bool] = lambda: True,
+) -> tuple[T, bool]:
+    """call을 실행하고, delay 안에 끝나지 않으면 한 번 더 실행해 먼저 성공한 결과를 씁니다.
+
+    한쪽이 실패하면 다른 쪽을 기다리며, 둘 다 실패하면 나중 예외를 올립니다.
+    남은 시도는 취소합니다.
+
+    Args:
+        call (Callable[[], Awaitable[T]]): 멱등 요청을 보내는 코루틴 함수
+        delay (Optional[float]): 헤지 요청을 보내기 전 기다릴 시간(초), None이면 헤지 안 함
+        allow_hedge (Callable[[], bool]): 헤지 직전에 호출해 False면 헤지하지 않음 (예산 확인)
+
+    Returns:
+        tuple[T, bool]: 결과와 헤지 요청이 이겼는지 여부
+    """
+    first = asyncio.ensure_future(call())
+    if delay is None:
+        return await first, False
+
+    pending = {first}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if not done and allow_hedge():
+            pending.add(asyncio.ensure_future(call()))
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.cancelled():
+                    error = asyncio.CancelledError()
+                elif task.exception() is None:
+                    return task.result(), task is not first
+                else:
+                    error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
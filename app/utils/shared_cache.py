@@ -0,0 +1,164 @@
+"""여러 워커 프로세스가 셔틀버스 캐시를 나눠 쓰기 위한 모듈
+
+gunicorn/uvicorn 워커마다 iBook을 따로 받으면 워커 수만큼 업스트림 요청과 메모리가
+늘어납니다. 같은 호스트의 워커들은 공유 디렉터리의 잠금 파일(`fcntl.flock`)로 리더를
+하나 정하고, 리더만 iBook에서 bookcode, 이미지 목록, 이미지 바이트를 받아
+`snapshot.json`에 게시합니다.
+
+- 이미지 바이트는 `IMAGE_CACHE_DIR`의 content-addressed 파일을 그대로 공유하므로,
+  게시 파일에는 URL별 내용 해시만 담습니다. 디스크 최대 크기를 넘은 파일은 리더만
+  지웁니다.
+- 나머지 워커(팔로워)는 게시 파일이 바뀌었을 때만 읽어 자기 캐시에 반영하고,
+  이미지는 요청이 올 때 디스크에서 읽습니다.
+- 잠금은 프로세스가 죽으면 운영체제가 풀어주므로, 팔로워가 주기적으로 다시 시도해
+  리더를 이어받습니다.
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from app.config import logger
+
+LOCK_FILE = "leader.lock"
+SNAPSHOT_FILE = "snapshot.json"
+
+
+@dataclass
+class SharedSnapshot:
+    """리더가 게시하는 셔틀버스 캐시 내용
+
+    Attributes:
+        bookcode (str): iBook bookcode
+        image_urls (list[str]): 페이지 순서대로의 이미지 URL
+        digests (list[str]): image_urls와 같은 순서의 이미지 내용 해시
+        content_hash (str): 시간표 해시
+        published_at (float): 게시 시각 (epoch seconds)
+        leader_pid (int): 게시한 프로세스 ID
+    """
+
+    bookcode: str
+    image_urls: list[str]
+    digests: list[str]
+    content_hash: str
+    published_at: float = field(default_factory=time.time)
+    leader_pid: int = field(default_factory=os.getpid)
+
+
+@dataclass
+class SharedCacheStats:
+    """공유 캐시 카운터
+
+    Attributes:
+        published (int): 리더로서 게시한 횟수
+        adopted (int): 다른 프로세스의 게시 내용을 반영한 횟수
+        takeovers (int): 리더가 된 횟수
+    """
+
+    published: int = 0
+    adopted: int = 0
+    takeovers: int = 0
+
+
+def _write_json_atomic(path: str, data: dict):
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class SharedCache:
+    """잠금 파일로 리더를 정하고 리더의 캐시 내용을 게시/조회하는 클래스"""
+
+    def __init__(self, directory: str):
+        """SharedCache를 초기화합니다.
+
+        Args:
+            directory (str): 워커들이 함께 쓰는 디렉터리
+        """
+        self.directory = directory
+        self.stats = SharedCacheStats()
+        self._lock_fd: Optional[int] = None
+        self._seen_mtime: Optional[int] = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def is_leader(self) -> bool:
+        """이 프로세스가 리더 잠금을 가지고 있는지 여부"""
+        return self._lock_fd is not None
+
+    @property
+    def role(self) -> str:
+        """리더면 leader, 아니면 follower"""
+        return "leader" if self.is_leader else "follower"
+
+    def try_lead(self) -> bool:
+        """리더 잠금을 기다리지 않고 시도합니다. (이미 리더면 True)"""
+        if self._lock_fd is not None:
+            return True
+        fd = os.open(os.path.join(self.directory, LOCK_FILE), os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        self._lock_fd = fd
+        self.stats.takeovers += 1
+        logger.info(f"[SharedCache] 리더가 됨 (pid {os.getpid()})")
+        return True
+
+    def release(self):
+        """리더 잠금을 내려놓습니다. (lifespan 종료 시 호출)"""
+        if self._lock_fd is None:
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        os.close(self._lock_fd)
+        self._lock_fd = None
+
+    def publish(self, snapshot: SharedSnapshot):
+        """캐시 내용을 게시 파일에 원자적으로 씁니다. (리더만 호출)"""
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        _write_json_atomic(path, asdict(snapshot))
+        self._seen_mtime = os.stat(path).st_mtime_ns
+        self.stats.published += 1
+
+    def read(self, only_new: bool = True) -> Optional[SharedSnapshot]:
+        """게시된 캐시 내용을 읽습니다.
+
+        Args:
+            only_new (bool): True면 마지막으로 읽거나 쓴 뒤 바뀌지 않았을 때 None 반환
+
+        Returns:
+            Optional[SharedSnapshot]: 게시 내용, 없거나 읽을 수 없으면 None
+        """
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            if only_new and mtime == self._seen_mtime:
+                return None
+            with open(path, encoding="utf-8") as f:
+                snapshot = SharedSnapshot(**json.load(f))
+            if len(snapshot.image_urls) != len(snapshot.digests):
+                raise ValueError("image_urls와 digests의 길이가 다릅니다.")
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"[SharedCache] 게시 파일을 읽지 못했습니다: {e}")
+            return None
+        self._seen_mtime = mtime
+        return snapshot
+
+    def snapshot_status(self) -> dict:
+        """역할과 카운터를 dict로 반환합니다."""
+        return {"role": self.role, "pid": os.getpid(), **asdict(self.stats)}
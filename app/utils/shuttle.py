@@ -0,0 +1,309 @@
+"""셔틀버스 시간표 이미지 정보를 제공하는 모듈
+
+iBook 뷰어의 bookcode와 이미지 URL 목록은 학기 중 몇 번만 바뀌므로
+`AsyncTTLCache`에 보관하고, 동시에 몰린 요청은 iBook 호출 한 번으로 합칩니다.
+
+백그라운드 작업이 시작 시 모든 캐시를 채우고 캐시 TTL보다 짧은 간격으로 다시
+받아 두므로, 평상시 요청은 iBook을 기다리지 않습니다. 갱신할 때마다 bookcode,
+이미지 URL, 이미지 내용 해시를 묶은 해시를 계산해 시간표가 실제로 바뀌었는지
+확인합니다.
+
+`SharedCache`를 주면 같은 호스트의 워커 중 리더 하나만 iBook에서 받아 게시하고,
+나머지 워커는 게시된 내용과 공유 디스크의 이미지 파일을 그대로 씁니다.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import asdict, dataclass
+from typing import Iterable, Optional
+
+import httpx
+from fastapi import Request
+
+from app.config import Config, logger
+from app.utils.aio import gather_bounded
+from app.utils.cache import AsyncTTLCache
+from app.utils.ibookdownloader import BookDownloader
+from app.utils.image_cache import ImageCache
+from app.utils.image_variants import ImageVariantCache
+from app.utils.metrics import Family, cache_families
+from app.utils.representation_cache import RepresentationCache
+from app.utils.shared_cache import SharedCache, SharedSnapshot
+from app.utils.zip_bundle import ZipBundleCache, bundle_key
+
+BOOKCODE_KEY = "bookcode"
+IMAGE_URLS_KEY = "image_urls"
+
+
+@dataclass
+class PrefetchStatus:
+    """백그라운드 갱신 상태
+
+    Attributes:
+        running (bool): 백그라운드 작업 실행 여부
+        interval (float): 갱신 간격(초)
+        content_hash (Optional[str]): 마지막으로 확인한 시간표 해시
+        last_attempt (Optional[float]): 마지막 시도 시각 (epoch seconds)
+        last_success (Optional[float]): 마지막 성공 시각
+        last_change (Optional[float]): 시간표가 마지막으로 바뀐 것을 확인한 시각
+        last_error (Optional[str]): 마지막 실패 사유
+        consecutive_failures (int): 연속 실패 횟수
+        total_failures (int): 전체 실패 횟수
+    """
+
+    running: bool = False
+    interval: float = 0
+    content_hash: Optional[str] = None
+    last_attempt: Optional[float] = None
+    last_success: Optional[float] = None
+    last_change: Optional[float] = None
+    last_error: Optional[str] = None
+    consecutive_failures: int = 0
+    total_failures: int = 0
+
+
+def content_hash(bookcode: str, image_urls: list[str], digests: list[str]) -> str:
+    """bookcode, 이미지 URL, 이미지 내용 해시를 묶은 시간표 해시를 계산합니다."""
+    hasher = hashlib.sha256(bookcode.encode("utf-8"))
+    for url, digest in zip(image_urls, digests, strict=True):
+        hasher.update(b"\0" + url.encode("utf-8") + b"\0" + digest.encode("ascii"))
+    return hasher.hexdigest()
+
+
+class ShuttleImageService:
+    """셔틀버스 이미지 URL 목록과 이미지 바이트를 캐시와 함께 제공하는 클래스"""
+
+    def __init__(
+        self,
+        url: str,
+        client: httpx.AsyncClient,
+        shared: Optional[SharedCache] = None,
+    ):
+        """ShuttleImageService를 초기화합니다.
+
+        Args:
+            url (str): 셔틀버스 시간표 iBook 뷰어 URL
+            client (httpx.AsyncClient): 공용 HTTP 클라이언트
+            shared (Optional[SharedCache]): 워커 간 공유 캐시 (None이면 혼자 갱신)
+        """
+        self.downloader = BookDownloader(url, client=client)
+        self.cache: AsyncTTLCache = AsyncTTLCache(
+            ttl=Config.SHUTTLE_CACHE_TTL,
+            stale_ttl=Config.SHUTTLE_CACHE_STALE_TTL,
+            name="ShuttleImageService",
+        )
+        self.images = ImageCache(self.downloader.fetch_image)
+        if shared is not None:
+            # 공유 디렉터리의 파일은 리더만 정리
+            self.images.can_prune = lambda: shared.is_leader
+        self.variants = ImageVariantCache(self.images)
+        self.bundles = ZipBundleCache(self.images)
+        self.representations = RepresentationCache()
+        self.status = PrefetchStatus()
+        self.shared = shared
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+    async def _load_image_urls(self) -> list[str]:
+        bookcode = await self.get_bookcode()
+        image_urls = await self.downloader.fetch_image_list(bookcode)
+        logger.info(f"[ShuttleImageService] 이미지 목록 갱신 ({len(image_urls)}개)")
+        return image_urls
+
+    async def get_bookcode(self) -> str:
+        """캐시된 bookcode를 반환합니다."""
+        return await self.cache.get(BOOKCODE_KEY, self.downloader.fetch_bookcode)
+
+    async def get_image_urls(self) -> list[str]:
+        """캐시된 이미지 URL 목록을 반환합니다."""
+        return await self.cache.get(IMAGE_URLS_KEY, self._load_image_urls)
+
+    async def refresh(self) -> bool:
+        """bookcode, 이미지 목록, 이미지 바이트를 모두 새로 받아 캐시를 채웁니다.
+
+        전체 이미지 ZIP 묶음이 없으면 함께 만들어 둡니다.
+
+        Returns:
+            bool: 시간표 내용이 이전 갱신과 달라졌으면 True
+        """
+        bookcode = await self.cache.refresh(
+            BOOKCODE_KEY, self.downloader.fetch_bookcode
+        )
+        image_urls = await self.cache.refresh(IMAGE_URLS_KEY, self._load_image_urls)
+        digests = await gather_bounded(
+            lambda url: self.images.digest(url, refresh=True), image_urls
+        )
+
+        new_hash = content_hash(bookcode, image_urls, digests)
+        changed = self._record_hash(new_hash)
+
+        key = bundle_key(digests)
+        if len(image_urls) > 1 and self.bundles.ready(key) is None:
+            await self.bundles.build(image_urls, key)
+
+        if self.shared is not None and self.shared.is_leader:
+            snapshot = SharedSnapshot(bookcode, image_urls, digests, new_hash)
+            await asyncio.to_thread(self.shared.publish, snapshot)
+        return changed
+
+    def _record_hash(self, new_hash: str) -> bool:
+        """시간표 해시를 기록하고 이전과 달라졌으면 True를 반환합니다."""
+        if new_hash == self.status.content_hash:
+            return False
+        if self.status.content_hash is not None:
+            logger.info(f"[ShuttleImageService] 시간표 변경 감지 ({new_hash[:12]})")
+        self.status.content_hash = new_hash
+        self.status.last_change = time.time()
+        return True
+
+    def _adopt(self, snapshot: SharedSnapshot) -> bool:
+        """리더가 게시한 내용을 캐시에 반영합니다.
+
+        Returns:
+            bool: 반영했으면 True, 이미지 파일이 공유 디스크에 없으면 False
+        """
+        pages = zip(snapshot.image_urls, snapshot.digests, strict=True)
+        if not self.images.adopt(pages):
+            logger.warning(
+                "[ShuttleImageService] 게시된 이미지 파일이 디스크에 없어 반영하지 않음"
+            )
+            return False
+        self.cache.set(BOOKCODE_KEY, snapshot.bookcode)
+        self.cache.set(IMAGE_URLS_KEY, snapshot.image_urls)
+        self._record_hash(snapshot.content_hash)
+        self.status.last_success = snapshot.published_at
+        self.shared.stats.adopted += 1
+        return True
+
+    async def _sync_shared(self, interval: float) -> float:
+        """리더 잠금을 시도하고 게시된 내용을 반영한 뒤 다음 확인까지 기다릴 시간을 반환합니다.
+
+        0을 반환하면 이 프로세스가 리더이고 지금 iBook에서 갱신해야 합니다.
+        막 리더가 되었더라도 이전 리더가 interval 안에 게시했다면 남은 시간만큼 기다립니다.
+        """
+        leader = self.shared.try_lead()
+        snapshot = await asyncio.to_thread(self.shared.read)
+        if snapshot is not None:
+            self._adopt(snapshot)
+        if not leader:
+            return min(interval, Config.SHARED_CACHE_POLL_INTERVAL)
+        return max(0.0, (self.status.last_success or 0) + interval - time.time())
+
+    async def _prefetch(self, interval: float):
+        while True:
+            if self.shared is not None:
+                delay = await self._sync_shared(interval)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+            self.status.last_attempt = time.time()
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.status.last_error = f"{type(e).__name__}: {e}"
+                self.status.consecutive_failures += 1
+                self.status.total_failures += 1
+                logger.warning(f"[ShuttleImageService] 미리 갱신 실패: {e}")
+                delay = min(interval, Config.SHUTTLE_PREFETCH_RETRY_INTERVAL)
+            else:
+                self.status.last_success = time.time()
+                self.status.consecutive_failures = 0
+                delay = interval
+            await asyncio.sleep(delay)
+
+    def start_prefetch(self, interval: float):
+        """시작 즉시 캐시를 채우고 interval(초)마다 다시 받는 백그라운드 작업을 시작합니다."""
+        if interval <= 0 or self._prefetch_task is not None:
+            return
+        self.status.interval = interval
+        self.status.running = True
+        self._prefetch_task = asyncio.create_task(self._prefetch(interval))
+        logger.info(f"[ShuttleImageService] 미리 갱신 시작 ({interval}초 간격)")
+
+    async def stop_prefetch(self):
+        """백그라운드 갱신 작업을 종료합니다."""
+        if self._prefetch_task is None:
+            return
+        self._prefetch_task.cancel()
+        try:
+            await self._prefetch_task
+        except asyncio.CancelledError:
+            pass
+        self._prefetch_task = None
+        self.status.running = False
+
+    async def close(self):
+        """백그라운드 갱신을 멈추고 변환 프로세스 풀과 리더 잠금을 정리합니다. (lifespan 종료 시 호출)"""
+        await self.stop_prefetch()
+        self.variants.close()
+        if self.shared is not None:
+            self.shared.release()
+
+    def collect_metrics(self) -> Iterable[Family]:
+        """캐시별 적중률과 백그라운드 갱신 상태를 메트릭으로 내보냅니다."""
+        image_stats = self.images.stats
+        yield from cache_families(
+            {
+                "shuttle_metadata": (self.cache.stats.hits, self.cache.stats.misses),
+                "image": (
+                    image_stats.memory_hits + image_stats.disk_hits,
+                    image_stats.misses,
+                ),
+                "image_variant": (self.variants.stats.hits, self.variants.stats.misses),
+                "representation": (
+                    self.representations.stats.hits,
+                    self.representations.stats.misses,
+                ),
+            }
+        )
+        yield from self.downloader.collect_metrics()
+        yield (
+            "shuttle_prefetch_failures_total",
+            "counter",
+            "셔틀버스 백그라운드 갱신 실패 횟수",
+            [({}, self.status.total_failures, "")],
+        )
+        yield (
+            "shuttle_prefetch_last_success_timestamp_seconds",
+            "gauge",
+            "셔틀버스 백그라운드 갱신 마지막 성공 시각",
+            [({}, self.status.last_success or 0, "")],
+        )
+        if self.shared is not None:
+            yield (
+                "shuttle_shared_cache_leader",
+                "gauge",
+                "이 워커가 셔틀버스 공유 캐시 리더인지 여부",
+                [({}, int(self.shared.is_leader), "")],
+            )
+
+    def snapshot_status(self) -> dict:
+        """백그라운드 갱신 상태, 업스트림 요청 카운터/서킷 상태, 공유 캐시 역할을 dict로 반환합니다."""
+        breaker = self.downloader.breaker
+        return {
+            **asdict(self.status),
+            "upstream": asdict(self.downloader.stats),
+            "resilience": asdict(self.downloader.resilience),
+            "circuit": {
+                "state": breaker.state,
+                "consecutive_failures": breaker.consecutive_failures,
+                "retry_after": breaker.retry_after(),
+            },
+            "shared": self.shared.snapshot_status() if self.shared else None,
+        }
+
+
+def open_shuttle_service(client: httpx.AsyncClient) -> ShuttleImageService:
+    """프로세스 공용 서비스를 만듭니다. (lifespan 시작 시 호출, `app.state.shuttle`에 보관)"""
+    shared = (
+        SharedCache(Config.SHARED_CACHE_DIR) if Config.SHARED_CACHE_ENABLED else None
+    )
+    return ShuttleImageService(Config.SHUTTLE_URL, client, shared)
+
+
+def get_shuttle_service(request: Request) -> ShuttleImageService:
+    """lifespan이 만든 공용 서비스를 반환 (FastAPI 의존성으로 사용)"""
+    service = getattr(request.app.state, "shuttle", None)
+    if service is None:
+        raise RuntimeError("셔틀버스 이미지 서비스가 아직 생성되지 않았습니다.")
+    return service
@@ -1,12 +1,31 @@
-"""학교 조직 구조를 관리하는 모듈"""
+"""학교 조직 구조를 관리하는 모듈
 
-from typing import Dict, Optional, List, Union, Literal
+조직 트리는 노드마다 객체를 만들지 않고 배열 몇 개로 보관합니다.
+
+- 노드 id는 전위 순회 순서(루트가 0)이므로 노드 i의 하위 트리는 id 구간
+  `[i, subtree_end[i])`이고, 첫 자식은 i + 1, 다음 형제는 `subtree_end[자식]`입니다.
+- 이름은 한 번만 저장(intern)하고 노드는 이름 id만 가집니다.
+- 자식 목록(이름 id 순 정렬)과 이름별 노드 목록은 오프셋 배열 + 값 배열(CSR)입니다.
+- 전화번호/URL은 노드 id로 찾는 열(column) 리스트입니다.
+
+Pydantic 모델(`OrganizationUnit`, `OrganizationGroup`)은 API 응답 스키마로만 쓰이며,
+응답 본문은 `to_dict`로 같은 모양의 dict를 만들어 직렬화합니다.
+"""
+
+from array import array
+from bisect import bisect_left
 from collections import deque
+from typing import Dict, Iterator, List, Literal, Optional, Union
 
 from pydantic import BaseModel
 
 from app.config import Config
 
+ROOT = 0
+ROOT_NAME = "Root"
+# 응답에 넣을 수 있는 노드 필드 (그룹은 phone/url 대신 subunits를 가짐)
+NODE_FIELDS = ("type", "name", "phone", "url")
+
 
 class OrganizationUnit(BaseModel):
     """조직의 기본 단위 (전화번호, URL 등 포함)
@@ -30,47 +49,286 @@ class OrganizationGroup(BaseModel):
     name: str
     subunits: Dict[str, Union["OrganizationUnit", "OrganizationGroup"]] = {}
 
-    def add_subunit(
-        self, subunit_name: str, subunit: Union["OrganizationUnit", "OrganizationGroup"]
-    ):
-        """하위 조직 추가"""
-        self.subunits[subunit_name] = subunit
-
-    def __iter__(self):
-        return iter(self.subunits.values())
 
-    def as_list(self) -> List[Union["OrganizationUnit", "OrganizationGroup"]]:
-        """하위 조직을 리스트로 반환"""
-        return list(self.subunits.values())
+class UniversityStructure:
+    """학교 전체 조직 구조를 관리하는 클래스
 
+    노드는 int id로 다루며, id는 이 구조 안에서만 의미가 있습니다.
+    """
 
-class UniversityStructure(BaseModel):
-    """학교 전체 조직 구조를 관리하는 클래스"""
-
-    type: Literal["root"] = "root"
-    root: Union[OrganizationGroup, OrganizationUnit]
+    __slots__ = (
+        "_names",
+        "_name_ids",
+        "_node_name",
+        "_parent",
+        "_level",
+        "_subtree_end",
+        "_is_group",
+        "_phone",
+        "_url",
+        "_child_offsets",
+        "_children",
+        "_name_offsets",
+        "_name_nodes",
+        "_height",
+    )
+
+    root = ROOT
+
+    def __init__(self, data: Dict):
+        """JSON 데이터로 조직 구조를 만듭니다.
+
+        Raises:
+            ValueError: 노드가 객체가 아니거나 phone/url이 문자열이 아닌 경우
+        """
+        self._names: List[str] = []  # 이름 id -> 이름
+        self._name_ids: Dict[str, int] = {}  # 이름 -> 이름 id
+        self._node_name = array("i")  # 노드 -> 이름 id
+        self._parent = array("i")  # 노드 -> 부모 노드 (루트는 -1)
+        self._level = array("H")  # 노드 -> 깊이 (루트는 0)
+        self._subtree_end = array("i")  # 노드 -> 하위 트리 다음 id
+        self._is_group = bytearray()
+        self._phone: List[Optional[str]] = []
+        self._url: List[Optional[str]] = []
+
+        self._build(data)
+        self._child_offsets, self._children = self._group_by(
+            self._parent, len(self), start=ROOT + 1
+        )
+        self._sort_children()
+        self._name_offsets, self._name_nodes = self._group_by(
+            self._node_name, len(self._names)
+        )
+        self._height = max(self._level)
 
     @classmethod
     def from_dict(cls, data: Dict) -> "UniversityStructure":
-        """JSON 데이터를 Pydantic 모델로 변환"""
-        return cls(root=cls._parse_data("Root", data))
+        """JSON 데이터(school_info.json 형식)로 조직 구조를 만듭니다."""
+        return cls(data)
+
+    def _add(self, name: str, data, parent: int) -> bool:
+        """노드 하나를 추가하고 하위 조직을 가진 그룹인지 반환합니다."""
+        if not isinstance(data, dict):
+            raise ValueError(f"조직 데이터는 객체여야 합니다: {name}")
+
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        node = len(self._node_name)
+        self._node_name.append(name_id)
+        self._parent.append(parent)
+        self._level.append(self._level[parent] + 1 if parent >= 0 else 0)
+        self._subtree_end.append(node + 1)
 
-    @classmethod
-    def _parse_data(
-        cls, name: str, data: Dict
-    ) -> Union[OrganizationGroup, OrganizationUnit]:
-        """재귀적으로 데이터를 파싱하여 Pydantic 모델로 변환"""
         if "phone" in data or "url" in data:
-            return OrganizationUnit(
-                name=name, phone=data.get("phone"), url=data.get("url")
-            )
+            phone, url = data.get("phone"), data.get("url")
+            for value in (phone, url):
+                if value is not None and not isinstance(value, str):
+                    raise ValueError(f"phone/url은 문자열이어야 합니다: {name}")
+            self._is_group.append(0)
+            self._phone.append(phone)
+            self._url.append(url)
+            return False
+
+        self._is_group.append(1)
+        self._phone.append(None)
+        self._url.append(None)
+        return True
+
+    def _build(self, data: Dict) -> None:
+        """트리를 전위 순회하며 노드 배열을 채웁니다. (재귀 없이 스택 사용)"""
+        if not self._add(ROOT_NAME, data, -1):
+            return
+        stack = [(ROOT, iter(data.items()))]
+        while stack:
+            node, items = stack[-1]
+            for key, value in items:
+                child = len(self._node_name)
+                if self._add(key, value, node):
+                    stack.append((child, iter(value.items())))
+                    break
+            else:
+                stack.pop()
+                self._subtree_end[node] = len(self._node_name)
+
+    @staticmethod
+    def _group_by(keys: array, size: int, start: int = 0) -> tuple[array, array]:
+        """노드를 key별로 묶은 CSR 배열 (오프셋, 노드)을 만듭니다.
+
+        같은 key 안에서는 노드 id(전위 순회) 순서가 유지됩니다.
+        """
+        offsets = array("i", bytes(4 * (size + 1)))
+        for node in range(start, len(keys)):
+            offsets[keys[node] + 1] += 1
+        for key in range(size):
+            offsets[key + 1] += offsets[key]
+
+        cursor = offsets[:-1]
+        nodes = array("i", bytes(4 * (len(keys) - start)))
+        for node in range(start, len(keys)):
+            key = keys[node]
+            nodes[cursor[key]] = node
+            cursor[key] += 1
+        return offsets, nodes
+
+    def _sort_children(self) -> None:
+        """자식 목록을 부모별로 이름 id 순으로 정렬합니다. (`child`의 이진 탐색용)"""
+        offsets, children, node_name = (
+            self._child_offsets,
+            self._children,
+            self._node_name,
+        )
+        for node in range(len(self)):
+            lo, hi = offsets[node], offsets[node + 1]
+            if hi - lo > 1:
+                children[lo:hi] = array(
+                    "i", sorted(children[lo:hi], key=node_name.__getitem__)
+                )
+
+    def __len__(self) -> int:
+        """루트를 포함한 노드 수"""
+        return len(self._node_name)
+
+    @property
+    def height(self) -> int:
+        """가장 깊은 노드의 깊이 (루트만 있으면 0)"""
+        return self._height
+
+    def name_of(self, node: int) -> str:
+        """노드 이름"""
+        return self._names[self._node_name[node]]
+
+    def is_group(self, node: int) -> bool:
+        """하위 조직을 가질 수 있는 그룹 노드인지 여부"""
+        return bool(self._is_group[node])
+
+    def type_of(self, node: int) -> Literal["unit", "group"]:
+        """API 응답의 `type` 값"""
+        return "group" if self._is_group[node] else "unit"
+
+    def phone_of(self, node: int) -> Optional[str]:
+        """유닛의 전화번호 (그룹은 None)"""
+        return self._phone[node]
+
+    def url_of(self, node: int) -> Optional[str]:
+        """유닛의 URL (그룹은 None)"""
+        return self._url[node]
+
+    def children(self, node: int) -> List[int]:
+        """하위 조직을 원본 데이터 순서대로 반환 (유닛은 빈 리스트)"""
+        subtree_end = self._subtree_end
+        end = subtree_end[node]
+        result = []
+        child = node + 1
+        while child < end:
+            result.append(child)
+            child = subtree_end[child]
+        return result
+
+    def child(self, node: int, name: str) -> Optional[int]:
+        """이름이 name인 하위 조직 (없으면 None)"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return None
+        lo, hi = self._child_offsets[node], self._child_offsets[node + 1]
+        index = bisect_left(
+            self._children, name_id, lo, hi, key=self._node_name.__getitem__
+        )
+        if index < hi and self._node_name[self._children[index]] == name_id:
+            return self._children[index]
+        return None
+
+    def nodes_named(self, name: str) -> List[int]:
+        """이름이 name인 모든 노드를 트리 전위 순회 순서로 반환"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return []
+        return self._name_nodes[
+            self._name_offsets[name_id] : self._name_offsets[name_id + 1]
+        ].tolist()
+
+    def names(self) -> Iterator[str]:
+        """모든 조직 이름 (처음 등장한 순서, 중복 없음)"""
+        return iter(self._names)
+
+    def units(self) -> Iterator[int]:
+        """모든 유닛 노드 (전위 순회 순서)"""
+        return (node for node, group in enumerate(self._is_group) if not group)
+
+    def path_of(self, node: int) -> str:
+        """노드의 전체 경로를 반환 (루트는 빈 문자열)"""
+        parts = []
+        while node != ROOT:
+            parts.append(self._names[self._node_name[node]])
+            node = self._parent[node]
+        return "/".join(reversed(parts))
+
+    def _project(self, node: int, fields: tuple[str, ...]) -> Dict:
+        """노드의 fields만 담은 dict (그룹에는 phone/url이 없음)"""
+        group = self._is_group[node]
+        item = {}
+        for field in fields:
+            if field == "type":
+                item["type"] = "group" if group else "unit"
+            elif field == "name":
+                item["name"] = self._names[self._node_name[node]]
+            elif not group:
+                item[field] = self._phone[node] if field == "phone" else self._url[node]
+        return item
+
+    def to_dict(
+        self,
+        node: int,
+        depth: Optional[int] = None,
+        fields: tuple[str, ...] = NODE_FIELDS,
+    ) -> Dict:
+        """노드를 `OrganizationGroup`/`OrganizationUnit` JSON과 같은 모양의 dict로 변환
 
-        subunits = {key: cls._parse_data(key, value) for key, value in data.items()}
-        return OrganizationGroup(name=name, subunits=subunits)
+        Args:
+            node (int): 변환할 노드
+            depth (Optional[int]): 포함할 하위 조직 단계 수 (None이면 전체,
+                0이면 노드만 - 그룹의 subunits는 빈 객체)
+            fields (tuple[str, ...]): 포함할 `NODE_FIELDS` (그룹의 subunits는 항상 포함)
+        """
+        item = self._project(node, fields)
+        if self._is_group[node]:
+            if depth == 0:
+                item["subunits"] = {}
+            else:
+                child_depth = None if depth is None else depth - 1
+                item["subunits"] = {
+                    self.name_of(child): self.to_dict(child, child_depth, fields)
+                    for child in self.children(node)
+                }
+        return item
+
+    def to_flat(
+        self,
+        node: int,
+        depth: Optional[int] = None,
+        fields: tuple[str, ...] = NODE_FIELDS,
+    ) -> List[Dict]:
+        """노드와 하위 조직을 전위 순회 순서의 `path` 포함 dict 리스트로 변환
 
-    def get_unit(
-        self, query: str
-    ) -> OrganizationUnit | OrganizationGroup | None:
+        루트는 경로가 없으므로 리스트에 넣지 않습니다. depth/fields는 `to_dict`와 같습니다.
+        """
+        level, subtree_end = self._level, self._subtree_end
+        max_level = None if depth is None else level[node] + depth
+        result = []
+        current, end = node, subtree_end[node]
+        while current < end:
+            if max_level is not None and level[current] > max_level:
+                current = subtree_end[current]  # 더 깊은 하위 트리는 건너뜀
+                continue
+            if current != ROOT:
+                item = {"path": self.path_of(current)}
+                item.update(self._project(current, fields))
+                result.append(item)
+            current += 1
+        return result
+
+    def get_unit(self, query: str) -> Optional[int]:
         """조직 구조에서 해당하는 부분을 찾아 반환
 
         Args:
@@ -79,89 +337,108 @@ class UniversityStructure(BaseModel):
                 예) "단과대학/SW대학/컴퓨터공학부"
 
         Returns:
-            Union[OrganizationUnit, List[Union[OrganizationUnit, OrganizationGroup]], None]:
-                해당하는 조직을 찾은 경우 해당 조직을 반환
-                찾은 조직이 OrganizationGroup인 경우 하위 조직을 리스트로 반환
-                찾지 못한 경우 None 반환
+            Optional[int]: 해당하는 조직의 노드, 찾지 못한 경우 None
         """
         parts = query.strip("/").split("/")  # '/'가 끝에 있으면 제거 후 분리
-        return self._bfs_search(self.root, parts)
 
-    def _bfs_search(
-        self,
-        current_node: OrganizationGroup | OrganizationUnit,
-        parts: list[str],
-    ) -> OrganizationGroup | OrganizationUnit | None:
+        # 루트부터 정확히 일치하는 전체 경로라면 BFS 없이 바로 반환
+        node = ROOT
+        for part in parts:
+            node = self.child(node, part)
+            if node is None:
+                return self._bfs_search(ROOT, parts)
+        return node
+
+    def get_children(self, query: str) -> List[int]:
+        """경로에 해당하는 조직의 하위 조직 리스트를 반환
+
+        Args:
+            query (str): 조직 경로 (`get_unit`과 같은 규칙)
+
+        Returns:
+            List[int]: 조직이 그룹인 경우 하위 조직 리스트,
+                유닛이거나 찾지 못한 경우 빈 리스트
+        """
+        node = self.get_unit(query)
+        if node is None:
+            return []
+        return self.children(node)
+
+    def _bfs_search(self, current_node: int, parts: list[str]) -> Optional[int]:
         """BFS 방식으로 각 part를 순차적으로 탐색
 
-        BFS 방식으로 각 part를 순차적으로 탐색하여 조직 구조를 찾는 함수입니다.
-        이 함수는 주어진 현재 노드에서 시작하여 남은 경로(parts)를 BFS 방식으로 탐색합니다.
-        각 단계에서 현재 노드가 OrganizationGroup인 경우 하위 유닛에서 다음 경로를 찾고,
-        그렇지 않은 경우 트리 전체에서 이름으로 탐색합니다.
+        주어진 현재 노드에서 시작하여 남은 경로(parts)를 BFS 방식으로 탐색합니다.
+        각 단계에서 현재 노드가 그룹이면 하위 조직에서 다음 경로를 찾고,
+        하위 조직에 없으면 트리 전체에서 이름으로 찾습니다.
 
         Args:
-            current_node (Union[OrganizationGroup, OrganizationUnit]): 현재 노드
+            current_node (int): 현재 노드
             parts (List[str]): 남은 경로
 
         Returns:
-            Union[OrganizationUnit, List[Union[OrganizationUnit, OrganizationGroup]], None]:
-                해당하는 조직을 찾은 경우 해당 조직을 반환
-                찾지 못한 경우 None 반환
+            Optional[int]: 해당하는 조직의 노드, 찾지 못한 경우 None
         """
         queue = deque([(current_node, parts)])  # (현재 노드, 남은 parts)
 
         while queue:
-            node, remaining_parts = queue.popleft()  # 큐에서 노드 꺼내기
+            node, remaining_parts = queue.popleft()
 
             # 경로가 모두 탐색된 경우, 현재 노드를 반환
             if not remaining_parts:
                 return node
 
-            # 현재 노드가 OrganizationGroup인 경우 하위 유닛에서 찾기
-            if isinstance(node, OrganizationGroup):
-                part = remaining_parts[0]  # 현재 찾고 있는 부분
-
-                # 하위 유닛에서 찾기
-                if part in node.subunits:
-                    queue.append(
-                        (node.subunits[part], remaining_parts[1:])
-                    )  # 하위 유닛으로 재귀적 탐색
+            if self._is_group[node]:
+                part = remaining_parts[0]
+                child = self.child(node, part)
+                if child is not None:
+                    queue.append((child, remaining_parts[1:]))
                 else:
-                    # 하위 유닛에 없는 경우, 트리 전체에서 이름으로 탐색
-                    candidates = self._search_by_name(self.root, part)
-
-                    for candidate in candidates:
-                        queue.append(
-                            (candidate, remaining_parts[1:])
-                        )  # 재귀적으로 나머지 part 탐색
+                    # 하위 조직에 없는 경우, 이름 인덱스에서 탐색
+                    for candidate in self.nodes_named(part):
+                        queue.append((candidate, remaining_parts[1:]))
 
-        return None  # 찾지 못한 경우 None 반환
+        return None
 
-    def _search_by_name(
-        self, node: Union[OrganizationGroup, OrganizationUnit], query: str
-    ) -> List[Union[OrganizationUnit, OrganizationGroup]]:
-        """이름 기반 전체 검색 (트리 순회)"""
-        results = []
-        if node.name == query:
-            results.append(node)
+    def _search_by_name(self, node: int, query: str) -> List[int]:
+        """이름 기반 전체 검색
 
-        if isinstance(node, OrganizationGroup):
-            for subunit in node.subunits.values():
-                results.extend(self._search_by_name(subunit, query))
+        루트에서 시작하는 검색은 이름 인덱스를 조회하고,
+        하위 노드에서 시작하는 검색은 하위 트리 id 구간만 훑습니다.
+        """
+        if node == ROOT:
+            return self.nodes_named(query)
 
-        return results
+        name_id = self._name_ids.get(query)
+        if name_id is None:
+            return []
+        node_name = self._node_name
+        return [
+            candidate
+            for candidate in range(node, self._subtree_end[node])
+            if node_name[candidate] == name_id
+        ]
 
 
 def get_tukorea_structure() -> UniversityStructure:
-    """한국공학대학교 조직 구조를 반환"""
-    return UniversityStructure.from_dict(Config.get_school_info_file())
+    """한국공학대학교 조직 구조를 반환
+
+    `organization_store`가 보관 중인 현재 스냅샷의 구조를 반환합니다.
+    아직 로드되지 않았다면(스크립트 실행 등) 이 시점에 로드합니다.
+    """
+    from app.utils.organization_store import organization_store  # 순환 import 방지
+
+    return organization_store.snapshot.structure
 
 
 if __name__ == "__main__":
     # 학교 조직 구조를 불러옴
     school_structure = UniversityStructure.from_dict(Config.get_school_info_file())
 
-    print(school_structure.get_unit("단과대학/SW대학/컴퓨터공학부"))
-    print(school_structure.get_unit("컴퓨터공학부"))  # 단독 검색 가능
-    print(school_structure.get_unit("SW대학/컴퓨터공학부"))  # 상위 구조 일부 포함 가능
-    print(school_structure.get_unit("단과대학/컴퓨터공학부"))  # 부분 포함 가능
+    for query in (
+        "단과대학/SW대학/컴퓨터공학부",
+        "컴퓨터공학부",  # 단독 검색 가능
+        "SW대학/컴퓨터공학부",  # 상위 구조 일부 포함 가능
+        "단과대학/컴퓨터공학부",  # 부분 포함 가능
+    ):
+        node = school_structure.get_unit(query)
+        print(query, "->", None if node is None else school_structure.to_dict(node))
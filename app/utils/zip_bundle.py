@@ -0,0 +1,178 @@
+"""전체 셔틀버스 이미지 ZIP 묶음을 디스크에 보관하는 모듈
+
+ZIP은 고정 수정 시각으로 만들므로 같은 이미지 세트(페이지별 내용 해시 목록)에서는
+항상 같은 바이트가 나옵니다. 따라서 이미지 세트 해시를 ETag로 쓰면, 처음 스트리밍한
+응답과 나중에 디스크에서 보내는 응답이 같은 표현이 되어 Range/If-Range로 이어받을 수
+있습니다. 아직 받지 않은 페이지가 있으면 이미지 세트 해시를 알 수 없으므로
+`cached_key`는 None을 반환합니다. (호출자는 페이지를 모두 받기를 기다리지 않고 스트리밍)
+
+묶음 파일은 백그라운드에서 한 번만 만들고(single-flight), 최신 `ZIP_BUNDLE_KEEP`개만
+남깁니다.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from app.config import Config, logger
+from app.utils.aio import gather_bounded, map_bounded
+from app.utils.image_cache import ImageCache
+from app.utils.zipstream import REPRODUCIBLE_DATE_TIME, stream_zip
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+async def page_entries(
+    pages: AsyncIterable[bytes],
+) -> AsyncIterator[tuple[str, bytes]]:
+    """페이지 바이트에 ZIP 항목 이름(shuttle_1.jpg, ...)을 붙입니다."""
+    idx = 1
+    async for content in pages:
+        yield f"shuttle_{idx}.jpg", content
+        idx += 1
+
+
+def stream_bundle(pages: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """페이지들로 디스크 묶음과 같은 바이트의 ZIP을 스트리밍합니다."""
+    return stream_zip(page_entries(pages), REPRODUCIBLE_DATE_TIME)
+
+
+def bundle_key(digests: list[str]) -> str:
+    """페이지 순서대로의 내용 해시 목록으로 이미지 세트 해시를 계산합니다."""
+    return hashlib.sha256("\n".join(digests).encode("ascii")).hexdigest()
+
+
+def _write_chunks(f, chunks: list[bytes]):
+    f.writelines(chunks)
+
+
+def _open_temp(directory: str):
+    """directory에 임시 파일을 만들고 (쓰기용 파일 객체, 경로)를 반환합니다."""
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    return os.fdopen(fd, "wb"), tmp_path
+
+
+def _discard(f, tmp_path: str):
+    f.close()
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+
+
+class ZipBundleCache:
+    """이미지 세트별 ZIP 묶음 파일 캐시"""
+
+    def __init__(
+        self,
+        images: ImageCache,
+        directory: str = Config.ZIP_BUNDLE_DIR,
+        keep: int = Config.ZIP_BUNDLE_KEEP,
+    ):
+        """ZipBundleCache를 초기화합니다.
+
+        Args:
+            images (ImageCache): 페이지 이미지 캐시
+            directory (str): 묶음 파일 디렉터리
+            keep (int): 남겨둘 묶음 파일 수
+        """
+        self.images = images
+        self.directory = directory
+        self.keep = keep
+        self._building: dict[str, asyncio.Task] = {}
+
+    async def key(self, image_urls: list[str]) -> str:
+        """이미지 세트(페이지 순서와 내용 해시)의 해시를 반환합니다."""
+        return bundle_key(await gather_bounded(self.images.digest, image_urls))
+
+    async def cached_key(self, image_urls: list[str]) -> Optional[str]:
+        """모든 페이지의 내용 해시를 이미 알고 있으면 이미지 세트 해시를, 아니면 None을 반환합니다."""
+        if any(self.images.known_digest(url) is None for url in image_urls):
+            return None
+        return await self.key(image_urls)
+
+    def path_for(self, key: str) -> str:
+        """묶음 파일 경로를 반환합니다."""
+        return os.path.join(self.directory, f"{key}.zip")
+
+    @staticmethod
+    def etag(key: str) -> str:
+        """묶음의 강한 ETag를 반환합니다."""
+        return f'"{key[:32]}"'
+
+    def ready(self, key: str) -> Optional[str]:
+        """묶음 파일이 있으면 경로를, 없으면 None을 반환합니다."""
+        path = self.path_for(key)
+        return path if os.path.exists(path) else None
+
+    def build(self, image_urls: list[str], key: str) -> asyncio.Task:
+        """묶음 파일을 만드는 작업을 시작합니다. (진행 중이면 그 작업을 반환)"""
+        task = self._building.get(key)
+        if task is None:
+            task = asyncio.create_task(self._build(image_urls, key))
+            task.add_done_callback(self._on_done)
+            self._building[key] = task
+        return task
+
+    def _on_done(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"[ZipBundleCache] 묶음 생성 실패: {task.exception()}")
+
+    async def _build(self, image_urls: list[str], key: str) -> str:
+        try:
+            f, tmp_path = await asyncio.to_thread(_open_temp, self.directory)
+            path = self.path_for(key)
+            try:
+                await self._write(f, image_urls, key)
+                await asyncio.to_thread(f.close)
+                await asyncio.to_thread(os.replace, tmp_path, path)
+            except BaseException:
+                await asyncio.to_thread(_discard, f, tmp_path)
+                raise
+            logger.info(f"[ZipBundleCache] 묶음 생성 → {path}")
+            await asyncio.to_thread(self._prune, path)
+            return path
+        finally:
+            self._building.pop(key, None)
+
+    async def _write(self, f, image_urls: list[str], key: str):
+        digests = []
+
+        async def pages() -> AsyncIterator[bytes]:
+            async for data in map_bounded(self.images.get, image_urls):
+                digests.append(hashlib.sha256(data).hexdigest())
+                yield data
+
+        buffer: list[bytes] = []
+        buffered = 0
+        async for chunk in stream_bundle(pages()):
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= WRITE_BUFFER_SIZE:
+                await asyncio.to_thread(_write_chunks, f, buffer)
+                buffer, buffered = [], 0
+        await asyncio.to_thread(_write_chunks, f, buffer)
+
+        # 만드는 도중 이미지가 갱신되었다면 key와 내용이 달라지므로 버림
+        if bundle_key(digests) != key:
+            raise ValueError("묶음을 만드는 중 이미지가 바뀌었습니다.")
+
+    def _prune(self, current: str):
+        """최신 keep개를 남기고 오래된 묶음 파일을 삭제합니다."""
+        bundles = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".zip") and path != current:
+                try:
+                    bundles.append((os.stat(path).st_mtime, path))
+                except FileNotFoundError:
+                    pass  # 다른 워커가 먼저 지운 경우
+        bundles.sort(reverse=True)
+        for _, path in bundles[max(self.keep - 1, 0) :]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,158 @@
+"""ZIP 아카이브를 메모리에 모으지 않고 순서대로 만들어 내보내는 모듈
+
+JPEG은 다시 압축해도 거의 줄지 않으므로 모든 항목을 stored(무압축) 방식으로 씁니다.
+항목 데이터를 받은 뒤 CRC와 크기를 계산해 local file header를 먼저 쓰고, 데이터를
+청크 단위로 내보낸 다음, 마지막에 central directory를 씁니다.
+표준 `zipfile` 모듈로 읽을 수 있는 형식이며 ZIP64는 지원하지 않습니다.
+
+수정 시각을 고정하면(`date_time`) 같은 항목으로 항상 같은 바이트가 만들어지므로,
+따로 만든 아카이브도 같은 ETag와 Range 요청에 사용할 수 있습니다.
+"""
+
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Iterator, Optional
+
+CHUNK_SIZE = 64 * 1024
+_ZIP_MAX = 0xFFFFFFFF
+_ZIP_MAX_ENTRIES = 0xFFFF
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+
+_VERSION = 20  # 2.0: 디렉터리 없는 stored 항목에 충분한 버전
+_FLAG_UTF8 = 0x0800
+_STORED = 0
+
+
+DateTime = tuple[int, int, int, int, int, int]
+
+# 재현 가능한 아카이브용 고정 시각 (MS-DOS 시각의 시작)
+REPRODUCIBLE_DATE_TIME: DateTime = (1980, 1, 1, 0, 0, 0)
+
+
+def _dos_datetime(date_time: DateTime) -> tuple[int, int]:
+    """(년, 월, 일, 시, 분, 초)를 ZIP 헤더용 MS-DOS 날짜/시간 값으로 변환합니다."""
+    year, month, day, hour, minute, second = date_time
+    dos_date = ((max(year, 1980) - 1980) << 9) | (month << 5) | day
+    dos_time = (hour << 11) | (minute << 5) | (second // 2)
+    return dos_date, dos_time
+
+
+@dataclass
+class _Entry:
+    name: bytes
+    crc: int
+    size: int
+    offset: int
+
+
+class ZipStreamWriter:
+    """stored 항목으로 ZIP 바이트를 순서대로 만들어내는 클래스"""
+
+    def __init__(self, date_time: Optional[DateTime] = None):
+        """ZipStreamWriter를 초기화합니다.
+
+        Args:
+            date_time (Optional[DateTime]): 항목 수정 시각
+                (`zipfile.ZipInfo.date_time`과 같은 형식, 없으면 현재 시각)
+        """
+        if date_time is None:
+            date_time = time.localtime()[:6]
+        self._date, self._time = _dos_datetime(date_time)
+        self._entries: list[_Entry] = []
+        self._offset = 0
+
+    def add(self, name: str, data: bytes) -> Iterator[bytes]:
+        """항목 하나의 local file header와 데이터를 청크로 내보냅니다.
+
+        Raises:
+            ValueError: 아카이브가 ZIP64 없이 표현할 수 있는 크기를 넘은 경우
+        """
+        encoded = name.encode("utf-8")
+        if len(data) > _ZIP_MAX or self._offset > _ZIP_MAX:
+            raise ValueError("ZIP64가 필요한 크기는 지원하지 않습니다.")
+
+        crc = zlib.crc32(data)
+        entry = _Entry(name=encoded, crc=crc, size=len(data), offset=self._offset)
+        header = _LOCAL_HEADER.pack(
+            0x04034B50,
+            _VERSION,
+            _FLAG_UTF8,
+            _STORED,
+            self._time,
+            self._date,
+            crc,
+            len(data),
+            len(data),
+            len(encoded),
+            0,
+        )
+        self._entries.append(entry)
+        self._offset += len(header) + len(encoded) + len(data)
+
+        yield header + encoded
+        view = memoryview(data)
+        for start in range(0, len(view), CHUNK_SIZE):
+            yield bytes(view[start : start + CHUNK_SIZE])
+
+    def finish(self) -> bytes:
+        """central directory와 end of central directory 레코드를 반환합니다."""
+        directory = bytearray()
+        for entry in self._entries:
+            directory += _CENTRAL_HEADER.pack(
+                0x02014B50,
+                _VERSION,
+                _VERSION,
+                _FLAG_UTF8,
+                _STORED,
+                self._time,
+                self._date,
+                entry.crc,
+                entry.size,
+                entry.size,
+                len(entry.name),
+                0,
+                0,
+                0,
+                0,
+                0,
+                entry.offset,
+            )
+            directory += entry.name
+        if self._offset > _ZIP_MAX or len(self._entries) > _ZIP_MAX_ENTRIES:
+            raise ValueError("ZIP64가 필요한 크기는 지원하지 않습니다.")
+
+        directory += _END_RECORD.pack(
+            0x06054B50,
+            0,
+            0,
+            len(self._entries),
+            len(self._entries),
+            len(directory),
+            self._offset,
+            0,
+        )
+        return bytes(directory)
+
+
+async def stream_zip(
+    entries: AsyncIterable[tuple[str, bytes]], date_time: Optional[DateTime] = None
+) -> AsyncIterator[bytes]:
+    """(이름, 데이터) 항목을 받는 대로 ZIP 바이트 청크로 내보냅니다.
+
+    Args:
+        entries (AsyncIterable[tuple[str, bytes]]): 아카이브에 넣을 항목
+        date_time (Optional[DateTime]): 항목 수정 시각 (없으면 현재 시각)
+
+    Yields:
+        bytes: ZIP 아카이브 청크
+    """
+    writer = ZipStreamWriter(date_time)
+    async for name, data in entries:
+        for chunk in writer.add(name, data):
+            yield chunk
+    yield writer.finish()
@@ -0,0 +1,60 @@
+"""조직 이름 자동완성 인덱스 벤치마크
+
+현재 데이터의 100배 크기 합성 트리에서 인덱스 구성 시간과 질의 지연을 측정합니다.
+
+    python -m benchmarks.bench_autocomplete [--factor 100] [--repeat 2000]
+"""
+
+import argparse
+import statistics
+import time
+
+from app.utils.name_search import NameSearchIndex
+from app.utils.university_structure import UniversityStructure
+from benchmarks.synthetic import scaled_school_info
+
+QUERIES = [
+    "ㅋㅍㅌ",
+    "컴퓨터",
+    "컴퓨턱",
+    "공학",
+    "ㄱ",
+    "가나",
+    "ㄱㄴ",
+    "팀",
+    "sw대",
+    "없는이름",
+]
+
+
+def main():
+    """합성 트리로 인덱스를 만들고 질의별 지연 분위수를 표로 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--factor", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    structure = UniversityStructure.from_dict(scaled_school_info(args.factor))
+    started = time.perf_counter()
+    index = NameSearchIndex.from_structure(structure)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"nodes={len(structure)} names={len(index)} build={build_ms:.1f}ms")
+
+    print(f"{'query':<10} {'hits':>4} {'p50(us)':>8} {'p99(us)':>8} {'max(us)':>8}")
+    for query in QUERIES:
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            hits = index.search(query, args.limit)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+        samples.sort()
+        p99 = samples[int(len(samples) * 0.99) - 1]
+        print(
+            f"{query:<10} {len(hits):>4} {statistics.median(samples):>8.1f} "
+            f"{p99:>8.1f} {samples[-1]:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Base64 이미지 응답의 메모리 사용량 벤치마크
+
+한 번에 JSON 문서를 만들던 이전 방식(buffered)과 라우트가 쓰는 `build_response_base64`를
+같은 조건에서 동시 요청으로 실행하고, 각 방식을 별도 프로세스에서 돌려 피크 RSS 증가량과
+tracemalloc 피크를 비교합니다.
+
+- streaming: 본문 보관 한도를 0으로 두어 매 요청 페이지를 받는 대로 스트리밍 (캐시 미스)
+- cached: 첫 요청이 스트리밍하며 보관한 본문을 반복 요청이 함께 씀 (캐시 적중)
+
+    python -m benchmarks.bench_base64_memory [--pages 8] [--page-kb 600] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from types import SimpleNamespace
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.utils.image_response import build_response_base64
+from app.utils.representation_cache import RepresentationCache
+from app.utils.zip_bundle import bundle_key
+
+MODES = ("buffered", "streaming", "cached")
+
+
+class _MemoryImages:
+    """URL마다 같은 크기의 무작위 바이트를 돌려주는 ImageCache 대용"""
+
+    def __init__(self, urls: list[str], page_bytes: int):
+        self._data = {url: os.urandom(page_bytes) for url in urls}
+
+    async def get(self, url: str) -> bytes:
+        await asyncio.sleep(0)
+        return self._data[url]
+
+
+class _Bundles:
+    """이미지 세트 버전만 계산하는 ZipBundleCache 대용"""
+
+    async def cached_key(self, image_urls: list[str]) -> str:
+        return bundle_key(image_urls)
+
+
+def _shuttle(mode: str, images: _MemoryImages) -> SimpleNamespace:
+    """라우트가 쓰는 ShuttleImageService 속성만 가진 대용"""
+    max_body_bytes = 0 if mode == "streaming" else 1 << 40
+    return SimpleNamespace(
+        images=images,
+        bundles=_Bundles(),
+        representations=RepresentationCache(max_body_bytes),
+    )
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "headers": []})
+
+
+async def _buffered(image_urls: list[str], images: _MemoryImages) -> JSONResponse:
+    """변경 전 build_response_base64와 같은 방식"""
+    base64_list = []
+    for url in image_urls:
+        content = await images.get(url)
+        base64_list.append(base64.b64encode(content).decode("utf-8"))
+    return JSONResponse(
+        content=(
+            {"image_base64_list": base64_list}
+            if len(base64_list) > 1
+            else {"image_base64": base64_list[0]}
+        )
+    )
+
+
+async def _consume(
+    mode: str, image_urls: list[str], images: _MemoryImages, shuttle: SimpleNamespace
+) -> int:
+    if mode == "buffered":
+        return len((await _buffered(image_urls, images)).body)
+    response = await build_response_base64(image_urls, _request(), shuttle)
+    if not hasattr(response, "body_iterator"):
+        return len(response.body)
+    size = 0
+    async for chunk in response.body_iterator:
+        size += len(chunk)
+    return size
+
+
+def _max_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def _run(mode: str, pages: int, page_bytes: int, concurrency: int) -> dict:
+    image_urls = [f"https://example.invalid/{i}.jpg" for i in range(pages)]
+    images = _MemoryImages(image_urls, page_bytes)
+    shuttle = _shuttle(mode, images)
+    await _consume(mode, image_urls, images, shuttle)  # 임포트/첫 호출 비용 제외
+
+    rss_before = _max_rss_kb()
+    tracemalloc.start()
+    started = time.perf_counter()
+    sizes = await asyncio.gather(
+        *(_consume(mode, image_urls, images, shuttle) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - started
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": mode,
+        "body_bytes": sizes[0],
+        "elapsed_ms": elapsed * 1000,
+        "rss_growth_mb": (_max_rss_kb() - rss_before) / 1024,
+        "traced_peak_mb": traced_peak / 1024 / 1024,
+    }
+
+
+def main():
+    """방식마다 자식 프로세스를 띄워 본문 크기, 시간, 메모리 증가량을 비교합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--page-kb", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mode", choices=MODES)
+    args = parser.parse_args()
+
+    if args.mode:
+        # 자식 프로세스: 한 가지 방식만 실행하고 결과를 JSON으로 출력
+        result = asyncio.run(
+            _run(args.mode, args.pages, args.page_kb * 1024, args.concurrency)
+        )
+        print(json.dumps(result))
+        return
+
+    payload_mb = args.pages * args.page_kb / 1024
+    print(
+        f"pages={args.pages} page={args.page_kb}KB payload={payload_mb:.1f}MB "
+        f"concurrency={args.concurrency}"
+    )
+    print(
+        f"{'mode':<10} {'body(MB)':>9} {'time(ms)':>9} "
+        f"{'rss+(MB)':>9} {'traced(MB)':>10}"
+    )
+    for mode in MODES:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.bench_base64_memory",
+                "--mode",
+                mode,
+                "--pages",
+                str(args.pages),
+                "--page-kb",
+                str(args.page_kb),
+                "--concurrency",
+                str(args.concurrency),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<10} {result['body_bytes'] / 1024 / 1024:>9.1f} "
+            f"{result['elapsed_ms']:>9.1f} {result['rss_growth_mb']:>9.1f} "
+            f"{result['traced_peak_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
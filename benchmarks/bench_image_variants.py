@@ -0,0 +1,81 @@
+"""셔틀버스 이미지 변환본(WebP/축소)의 크기 절감과 인코딩 지연 벤치마크
+
+실제 시간표 이미지(--image) 또는 시간표와 비슷한 합성 JPEG으로 변환 옵션별
+결과 크기와 인코딩 시간을 측정합니다. Pillow가 필요합니다.
+
+    python -m benchmarks.bench_image_variants [--image page_1.jpg] [--repeat 10]
+"""
+
+import argparse
+import io
+import statistics
+import time
+
+from app.utils.image_variants import VariantSpec, pillow_available, render_variant
+
+SPECS = [
+    VariantSpec("jpeg", None, 80),
+    VariantSpec("webp", None, 80),
+    VariantSpec("jpeg", 720, 80),
+    VariantSpec("webp", 720, 80),
+    VariantSpec("webp", 720, 60),
+    VariantSpec("webp", 360, 60),
+]
+
+
+def synthetic_timetable(width: int = 1654, height: int = 2339) -> bytes:
+    """표 선과 글자가 있는 A4 크기 시간표 모양의 JPEG을 만듭니다."""
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    for y in range(120, height, 48):
+        draw.line((60, y, width - 60, y), fill=(120, 120, 120), width=2)
+        for col, x in enumerate(range(60, width - 200, 260)):
+            draw.text((x + 12, y + 14), f"{(y // 48) % 24:02d}:{col * 10:02d}", "black")
+    for x in range(60, width, 260):
+        draw.line((x, 120, x, height - 60), fill=(120, 120, 120), width=2)
+    draw.rectangle((60, 40, width - 60, 110), fill=(30, 60, 150))
+
+    output = io.BytesIO()
+    image.save(output, "JPEG", quality=92)
+    return output.getvalue()
+
+
+def main():
+    """원본 JPEG을 변형별로 변환하며 크기와 변환 시간을 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--image", help="원본 JPEG 경로 (없으면 합성 이미지)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if not pillow_available():
+        raise SystemExit("Pillow가 필요합니다: pip install pillow")
+
+    if args.image:
+        with open(args.image, "rb") as f:
+            source = f.read()
+    else:
+        source = synthetic_timetable()
+
+    print(f"source={len(source) / 1024:.1f}KB repeat={args.repeat}")
+    print(
+        f"{'format':<6} {'width':>6} {'q':>4} {'size(KB)':>9} {'saved':>7} "
+        f"{'p50(ms)':>8} {'max(ms)':>8}"
+    )
+    for spec in SPECS:
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            output = render_variant(source, spec)
+            samples.append((time.perf_counter() - started) * 1000)
+        saved = 1 - len(output) / len(source)
+        print(
+            f"{spec.format:<6} {spec.width or 'orig':>6} {spec.quality:>4} "
+            f"{len(output) / 1024:>9.1f} {saved:>7.1%} "
+            f"{statistics.median(samples):>8.1f} {max(samples):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
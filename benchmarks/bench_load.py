@@ -0,0 +1,283 @@
+"""셔틀버스 API 종단 간 부하 테스트
+
+로컬 가짜 iBook 업스트림(`benchmarks.fake_ibook`)과 그 업스트림을 바라보는 서비스를
+각각 별도 프로세스로 띄운 뒤, 모든 `/bus/*` 라우트와 Accept 형식을 정해진 동시성으로
+호출해 처리량과 p50/p95/p99 지연을 측정합니다. 결과는 JSON으로 저장하며,
+`--baseline`으로 이전 커밋의 결과를 주면 처리량과 p95 변화를 함께 출력합니다.
+
+    python -m benchmarks.bench_load [--concurrency 1,8,32] [--requests 300]
+        [--latency-ms 50] [--jitter-ms 20] [--error-rate 0.0]
+        [--slow-rate 0.0] [--slow-ms 3000]
+        [--output bench_load.json] [--baseline old.json] [--only images]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Optional
+
+import httpx
+
+SCENARIOS = [
+    ("/bus/images", "application/json"),
+    ("/bus/images", "application/base64"),
+    ("/bus/images", "application/zip"),
+    ("/bus/images", "application/octet-stream"),
+    ("/bus/image/1", "application/json"),
+    ("/bus/image/1", "application/base64"),
+    ("/bus/image/1", "application/octet-stream"),
+    ("/bus/image/1", "application/zip"),
+    ("/bus/image/1", "text/plain"),
+    ("/bus/image/1", "image/jpeg"),
+    ("/bus/image/1", "image/webp"),
+    ("/bus/image/1?width=720", "image/jpeg"),
+    ("/bus/cache/stats", "application/json"),
+    ("/bus/status", "application/json"),
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git_commit() -> Optional[str]:
+    git = shutil.which("git")
+    if git is None:
+        return None
+    try:
+        return subprocess.run(
+            [git, "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"프로세스가 종료되었습니다: {process.args}")
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise TimeoutError(f"{url} 준비 대기 시간 초과")
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+async def _drive(
+    client: httpx.AsyncClient, path: str, accept: str, concurrency: int, requests: int
+) -> dict:
+    """path를 accept로 requests번, concurrency개씩 동시에 호출합니다."""
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    received = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal received, remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, headers={"Accept": accept})
+                statuses[str(response.status_code)] += 1
+                received += len(response.content)
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "accept": accept,
+        "concurrency": concurrency,
+        "requests": requests,
+        "elapsed_s": elapsed,
+        "rps": requests / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "bytes_per_request": received / requests,
+        "statuses": dict(statuses),
+    }
+
+
+async def _run(base_url: str, scenarios: list, levels: list[int], requests: int):
+    results = []
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        for path, accept in scenarios:
+            await client.get(path, headers={"Accept": accept})  # 캐시 채우기
+            for concurrency in levels:
+                result = await _drive(client, path, accept, concurrency, requests)
+                results.append(result)
+                print(
+                    f"{path:<24} {accept:<26} c={concurrency:<4} "
+                    f"{result['rps']:>8.1f} rps  p50={result['p50_ms']:>7.2f}ms "
+                    f"p95={result['p95_ms']:>7.2f}ms p99={result['p99_ms']:>7.2f}ms "
+                    f"{result['statuses']}"
+                )
+    return results
+
+
+def _compare(results: list[dict], baseline_path: str):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {
+        (r["path"], r["accept"], r["concurrency"]): r for r in baseline["results"]
+    }
+    print(f"\n기준 결과와 비교: {baseline_path} ({baseline['meta'].get('commit')})")
+    for result in results:
+        old = previous.get((result["path"], result["accept"], result["concurrency"]))
+        if old is None:
+            continue
+        rps = (result["rps"] / old["rps"] - 1) * 100 if old["rps"] else 0.0
+        p95 = (result["p95_ms"] / old["p95_ms"] - 1) * 100 if old["p95_ms"] else 0.0
+        print(
+            f"{result['path']:<24} {result['accept']:<26} "
+            f"c={result['concurrency']:<4} rps {rps:+7.1f}%  p95 {p95:+7.1f}%"
+        )
+
+
+def main():
+    """가짜 업스트림과 서비스를 띄우고 시나리오별 처리량과 지연을 측정합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표로 구분한 동시성")
+    parser.add_argument("--requests", type=int, default=300, help="시나리오별 요청 수")
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="꼬리 지연 확률")
+    parser.add_argument("--slow-ms", type=float, default=3000)
+    parser.add_argument("--only", help="경로나 Accept에 이 문자열이 있는 시나리오만")
+    parser.add_argument("--output", default="bench_load.json")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    scenarios = [
+        (path, accept)
+        for path, accept in SCENARIOS
+        if not args.only or args.only in path or args.only in accept
+    ]
+
+    upstream_port, app_port = _free_port(), _free_port()
+    workdir = tempfile.mkdtemp(prefix="bench_load-")
+    env = {
+        **os.environ,
+        "SHUTTLE_URL": f"http://127.0.0.1:{upstream_port}/Viewer/bus01",
+        "IMAGE_CACHE_DIR": os.path.join(workdir, "images"),
+        "ZIP_BUNDLE_DIR": os.path.join(workdir, "bundles"),
+    }
+    log = open(os.path.join(workdir, "server.log"), "w")
+    upstream = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.fake_ibook",
+            "--port",
+            str(upstream_port),
+            "--pages",
+            str(args.pages),
+            "--latency-ms",
+            str(args.latency_ms),
+            "--jitter-ms",
+            str(args.jitter_ms),
+            "--error-rate",
+            str(args.error_rate),
+            "--slow-rate",
+            str(args.slow_rate),
+            "--slow-ms",
+            str(args.slow_ms),
+        ],
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(app_port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        _wait_ready(f"http://127.0.0.1:{upstream_port}/_stats", upstream)
+        _wait_ready(f"http://127.0.0.1:{app_port}/health", server)
+        results = asyncio.run(
+            _run(f"http://127.0.0.1:{app_port}", scenarios, levels, args.requests)
+        )
+        upstream_requests = httpx.get(f"http://127.0.0.1:{upstream_port}/_stats").json()
+    except Exception:
+        print(f"서버 로그: {log.name}", file=sys.stderr)
+        raise
+    finally:
+        for process in (server, upstream):
+            process.terminate()
+            process.wait(timeout=10)
+        log.close()
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pages": args.pages,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "slow_rate": args.slow_rate,
+            "slow_ms": args.slow_ms,
+            "requests": args.requests,
+            "concurrency": levels,
+        },
+        "upstream_requests": upstream_requests,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {args.output} (업스트림 요청 {upstream_requests})")
+
+    if args.baseline:
+        _compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
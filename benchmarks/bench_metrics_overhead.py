@@ -0,0 +1,104 @@
+"""메트릭 기록 비용 벤치마크
+
+아무 일도 하지 않는 ASGI 앱을 `MetricsMiddleware`로 감쌌을 때와 감싸지 않았을 때
+요청 하나를 처리하는 시간을 비교하고, 업스트림 데코레이터와 `/metrics` 직렬화
+비용도 함께 측정합니다. 실제 서버를 띄우지 않고 ASGI 호출만 반복하므로 차이가
+곧 계측 비용입니다.
+
+    python -m benchmarks.bench_metrics_overhead [--requests 200000] [--series 50]
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.middleware.metrics import MetricsMiddleware
+from app.utils.metrics import observe_upstream, registry
+
+
+class _Route:
+    def __init__(self, path: str):
+        self.path = path
+
+
+async def _endpoint(scope, receive, send):
+    scope["route"] = _Route("/bus/image/{index}")
+    scope["state"]["response_type"] = "jpeg"
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"x" * 1024})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message):
+    pass
+
+
+async def _per_request_us(app, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        scope = {"type": "http", "method": "GET", "path": "/bus/image/1", "state": {}}
+        await app(scope, _receive, _send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def _upstream_us(calls: int) -> tuple[float, float]:
+    async def plain():
+        return None
+
+    timed = observe_upstream("bench")(plain)
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        await plain()
+    baseline = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        await timed()
+    return baseline / calls * 1e6, (time.perf_counter() - started) / calls * 1e6
+
+
+async def _run(requests: int, series: int):
+    # 라벨 조합이 여러 개인 실제 상황처럼 미리 채워 둠
+    for i in range(series):
+        scope = {"type": "http", "method": "GET", "path": "/", "state": {}}
+
+        async def endpoint(scope, receive, send, i=i):
+            scope["route"] = _Route(f"/route/{i}")
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        await MetricsMiddleware(endpoint)(scope, _receive, _send)
+
+    await _per_request_us(_endpoint, 1000)  # 워밍업
+    bare = min([await _per_request_us(_endpoint, requests) for _ in range(3)])
+    wrapped_app = MetricsMiddleware(_endpoint)
+    wrapped = min([await _per_request_us(wrapped_app, requests) for _ in range(3)])
+    print(f"requests={requests} series={series}")
+    print(f"{'bare ASGI':<22} {bare:>8.2f} us/req")
+    print(f"{'with MetricsMiddleware':<22} {wrapped:>8.2f} us/req")
+    print(f"{'overhead':<22} {wrapped - bare:>8.2f} us/req")
+
+    plain, timed = await _upstream_us(requests)
+    print(f"{'observe_upstream':<22} {timed - plain:>8.2f} us/call")
+
+    started = time.perf_counter()
+    body = registry.render()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{'/metrics render':<22} {elapsed:>8.2f} ms ({len(body) / 1024:.1f}KB)")
+
+
+def main():
+    """계측 유무에 따른 요청당 처리 시간과 /metrics 렌더링 비용을 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--series", type=int, default=50, help="미리 만들 라우트 수")
+    args = parser.parse_args()
+    asyncio.run(_run(args.requests, args.series))
+
+
+if __name__ == "__main__":
+    main()
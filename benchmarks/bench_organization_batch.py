@@ -0,0 +1,111 @@
+"""조직 일괄 조회 벤치마크
+
+연락처 페이지처럼 조직 N개가 필요한 경우를 세 가지 방법으로 비교합니다.
+
+- sequential: `GET /organization/{path}`를 N번 차례로 호출
+- concurrent: `GET /organization/{path}` N개를 동시에 호출
+- batch: `POST /organization/batch` 한 번
+
+질의는 현재 school_info.json의 전체 경로, 경로 일부, 이름, 없는 이름을 섞어 만듭니다.
+`--url`을 주지 않으면 서버를 띄우지 않고 앱을 직접(ASGI) 호출하므로 네트워크 왕복
+없이 서버 쪽 비용만 비교하며, `--url`로 실행 중인 서버를 지정하면 왕복 비용까지
+포함됩니다.
+
+    python -m benchmarks.bench_organization_batch [--items 50] [--repeat 50]
+        [--url http://127.0.0.1:8000]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from urllib.parse import quote
+
+import httpx
+
+from app.utils.organization_store import organization_store
+
+
+def _queries(items: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    structure = organization_store.snapshot.structure
+    paths = [
+        structure.path_of(node)
+        for node in range(1, len(structure))
+        if not structure.is_group(node)
+    ]
+    queries = []
+    for i in range(items):
+        path = rng.choice(paths)
+        # 전체 경로, 경로 일부, 이름, 없는 조직을 번갈아 사용
+        shapes = (
+            path,
+            "/".join(path.split("/")[-2:]),
+            path.rsplit("/", 1)[-1],
+            f"없는조직{i}",
+        )
+        queries.append(shapes[i % len(shapes)])
+    return queries
+
+
+async def _sequential(client: httpx.AsyncClient, queries: list[str]):
+    for query in queries:
+        await client.get(f"/organization/{quote(query)}")
+
+
+async def _concurrent(client: httpx.AsyncClient, queries: list[str]):
+    await asyncio.gather(
+        *(client.get(f"/organization/{quote(query)}") for query in queries)
+    )
+
+
+async def _batch(client: httpx.AsyncClient, queries: list[str]):
+    response = await client.post("/organization/batch", json={"queries": queries})
+    response.raise_for_status()
+
+
+async def _run(url: str, items: int, repeat: int, seed: int):
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=60)
+    else:
+        from main import app
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        )
+
+    queries = _queries(items, seed)
+    print(f"items={items} repeat={repeat} target={url or 'in-process ASGI'}")
+    async with client:
+        for name, method in (
+            ("sequential", _sequential),
+            ("concurrent", _concurrent),
+            ("batch", _batch),
+        ):
+            await method(client, queries)  # 워밍업 (스냅샷 캐시 채우기)
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                await method(client, queries)
+                samples.append((time.perf_counter() - started) * 1000)
+            requests = 1 if name == "batch" else items
+            print(
+                f"{name:<11} {requests:>4} req  median={statistics.median(samples):>8.2f}ms "
+                f"min={min(samples):>8.2f}ms"
+            )
+
+
+def main():
+    """N개 조직을 개별 요청, 동시 요청, 일괄 요청으로 가져오는 시간을 비교합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50, help="필요한 조직 수 N")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="실행 중인 서버 주소 (생략하면 ASGI 직접 호출)")
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.items, args.repeat, args.seed))
+
+
+if __name__ == "__main__":
+    main()
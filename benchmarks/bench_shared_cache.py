@@ -0,0 +1,170 @@
+"""워커 수에 따른 업스트림 요청 수/메모리 벤치마크 (공유 캐시 사용 여부 비교)
+
+가짜 iBook 업스트림(`benchmarks.fake_ibook`)과 `uvicorn --workers N`으로 서비스를 띄우고,
+`--duration`초 동안 `/bus/*` 요청을 보내면서 백그라운드 갱신을 짧은 간격으로 돌립니다.
+끝나면 업스트림이 받은 요청 수와 워커 프로세스 RSS 합계를 워커 수별로 출력합니다.
+공유 캐시를 켜면 워커가 늘어도 업스트림 요청 수가 거의 같아야 합니다. (Linux 전용)
+
+    python -m benchmarks.bench_shared_cache [--workers 1,2,4] [--duration 10]
+        [--prefetch-interval 2] [--pages 8] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.bench_load import _free_port, _wait_ready
+
+PATHS = [
+    ("/bus/images", "application/json"),
+    ("/bus/image/1", "image/jpeg"),
+    ("/bus/images", "application/zip"),
+]
+
+
+def _children(pid: int) -> list[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except FileNotFoundError:
+        return []
+
+
+def _rss_bytes(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except FileNotFoundError:
+        pass
+    return 0
+
+
+async def _drive(base_url: str, duration: float, concurrency: int) -> int:
+    """duration초 동안 PATHS를 번갈아 호출하고 응답 수를 반환합니다."""
+    deadline = time.monotonic() + duration
+    done = 0
+
+    async def worker(client: httpx.AsyncClient, offset: int):
+        nonlocal done
+        idx = offset
+        while time.monotonic() < deadline:
+            path, accept = PATHS[idx % len(PATHS)]
+            idx += 1
+            try:
+                await client.get(path, headers={"Accept": accept})
+                done += 1
+            except httpx.HTTPError:
+                pass
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        await asyncio.gather(*(worker(client, i) for i in range(concurrency)))
+    return done
+
+
+def _run_case(args, upstream_port: int, workers: int, shared: bool) -> dict:
+    workdir = tempfile.mkdtemp(prefix="bench_shared_cache-")
+    app_port = _free_port()
+    env = {
+        **os.environ,
+        "SHUTTLE_URL": f"http://127.0.0.1:{upstream_port}/Viewer/bus01",
+        "IMAGE_CACHE_DIR": os.path.join(workdir, "images"),
+        "ZIP_BUNDLE_DIR": os.path.join(workdir, "bundles"),
+        "SHARED_CACHE_DIR": os.path.join(workdir, "shared"),
+        "SHARED_CACHE_ENABLED": str(shared).lower(),
+        "SHARED_CACHE_POLL_INTERVAL": str(args.prefetch_interval / 2),
+        "SHUTTLE_PREFETCH_INTERVAL": str(args.prefetch_interval),
+    }
+    upstream_url = f"http://127.0.0.1:{upstream_port}/_stats"
+    before = sum(httpx.get(upstream_url).json().values())
+    log = open(os.path.join(workdir, "server.log"), "w")
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(app_port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        _wait_ready(f"http://127.0.0.1:{app_port}/health", server)
+        responses = asyncio.run(
+            _drive(f"http://127.0.0.1:{app_port}", args.duration, args.concurrency)
+        )
+        # --workers 1이면 자식 프로세스 없이 직접 요청을 처리
+        pids = _children(server.pid) or [server.pid]
+        rss = sum(_rss_bytes(pid) for pid in pids)
+        upstream = sum(httpx.get(upstream_url).json().values()) - before
+    except Exception:
+        print(f"서버 로그: {log.name}", file=sys.stderr)
+        raise
+    finally:
+        server.terminate()
+        server.wait(timeout=15)
+        log.close()
+    return {"responses": responses, "upstream": upstream, "rss": rss}
+
+
+def main():
+    """워커 수별로 서비스를 띄워 업스트림 요청 수와 RSS 합계를 비교합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", default="1,2,4", help="쉼표로 구분한 워커 수")
+    parser.add_argument(
+        "--duration", type=float, default=10, help="워커 수별 실행 시간(초)"
+    )
+    parser.add_argument("--prefetch-interval", type=float, default=2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    upstream_port = _free_port()
+    upstream = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.fake_ibook",
+            "--port",
+            str(upstream_port),
+            "--pages",
+            str(args.pages),
+            "--latency-ms",
+            str(args.latency_ms),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        _wait_ready(f"http://127.0.0.1:{upstream_port}/_stats", upstream)
+        for workers in (int(n) for n in args.workers.split(",")):
+            for shared in (False, True):
+                result = _run_case(args, upstream_port, workers, shared)
+                print(
+                    f"workers={workers:<3} shared={str(shared):<6} "
+                    f"upstream={result['upstream']:<6} "
+                    f"responses={result['responses']:<7} "
+                    f"rss={result['rss'] / 1024 / 1024:>7.1f}MB"
+                )
+    finally:
+        upstream.terminate()
+        upstream.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""UniversityStructure 규모별 성능 벤치마크
+
+합성 조직 트리(10²~10⁶ 노드)에서 다음 연산의 시간과 메모리를 측정하고, 노드 수에
+대한 증가율(log-log 기울기, 1이면 선형)을 출력합니다.
+
+- build: `from_dict` (dict → 노드 배열, 자식/이름 인덱스)
+- unit_path: 전체 경로 `get_unit` (루트부터 자식 이진 탐색)
+- unit_partial: 상위 경로 일부만 준 `get_unit` (`_bfs_search`, 이름 인덱스 대체 탐색)
+- unit_name: 이름 하나만 준 `get_unit`
+- unit_miss: 없는 경로 `get_unit`
+- bfs_full: 루트에서 전체 경로로 `_bfs_search`
+- name_root: 루트에서 `_search_by_name` (이름 인덱스)
+- name_subtree: 첫 최상위 그룹에서 `_search_by_name` (하위 트리 구간 순회)
+
+메모리는 tracemalloc으로 구성 중 최대 할당량과 구성 후 남은 양(노드당 바이트)을 잽니다.
+
+    python -m benchmarks.bench_structure_scaling [--sizes 100,1000,10000,100000,1000000]
+        [--depth 6] [--fanout 12] [--collisions 0.1] [--queries 200] [--output scaling.json]
+"""
+
+import argparse
+import gc
+import json
+import math
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Callable
+
+from app.utils.university_structure import UniversityStructure
+from benchmarks.synthetic import synthetic_tree
+
+QUERY_OPS = (
+    "unit_path",
+    "unit_partial",
+    "unit_name",
+    "unit_miss",
+    "bfs_full",
+    "name_root",
+    "name_subtree",
+)
+
+
+def _median_us(func: Callable, args_list: list) -> float:
+    samples = []
+    for args in args_list:
+        started = time.perf_counter()
+        func(*args)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+
+def _slope(sizes: list[int], values: list[float]) -> float:
+    """log(값)을 log(노드 수)에 최소제곱으로 맞춘 기울기"""
+    pairs = [(n, v) for n, v in zip(sizes, values, strict=True) if v > 0]
+    try:
+        return statistics.linear_regression(
+            [math.log(n) for n, _ in pairs], [math.log(v) for _, v in pairs]
+        ).slope
+    except statistics.StatisticsError:  # 점이 2개 미만
+        return float("nan")
+
+
+def _measure_memory(data: dict) -> tuple[float, float]:
+    """from_dict 중 최대 할당량과 구성 후 남은 양(MB)"""
+    gc.collect()
+    tracemalloc.start()
+    structure = UniversityStructure.from_dict(data)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return peak / 1024 / 1024, current / 1024 / 1024
+
+
+def _measure(data: dict, queries: int, memory: bool, seed: int) -> dict:
+    rng = random.Random(seed)
+
+    gc.collect()
+    started = time.perf_counter()
+    structure = UniversityStructure.from_dict(data)
+    build_ms = (time.perf_counter() - started) * 1000
+    nodes = len(structure)
+
+    paths = [structure.path_of(rng.randrange(1, nodes)) for _ in range(queries * 4)]
+    sample = ([path for path in paths if "/" in path] or paths)[:queries]
+    partial = ["/".join(path.split("/")[-2:]) for path in sample]
+    names = [path.rsplit("/", 1)[-1] for path in sample]
+    subtree = structure.children(structure.root)[0]
+
+    result = {
+        "nodes": nodes,
+        "distinct_names": sum(1 for _ in structure.names()),
+        "build_ms": build_ms,
+        "unit_path_us": _median_us(structure.get_unit, [(p,) for p in sample]),
+        "unit_partial_us": _median_us(structure.get_unit, [(p,) for p in partial]),
+        "unit_name_us": _median_us(structure.get_unit, [(n,) for n in names]),
+        "unit_miss_us": _median_us(
+            structure.get_unit, [("없는조직/없는이름",)] * queries
+        ),
+        "bfs_full_us": _median_us(
+            structure._bfs_search,
+            [(structure.root, path.split("/")) for path in sample],
+        ),
+        "name_root_us": _median_us(
+            structure._search_by_name, [(structure.root, n) for n in names]
+        ),
+        "name_subtree_us": _median_us(
+            structure._search_by_name,
+            [(subtree, n) for n in names[: max(1, queries // 20)]],
+        ),
+    }
+    del structure
+    if memory:
+        peak_mb, retained_mb = _measure_memory(data)
+        result["build_peak_mb"] = peak_mb
+        result["retained_mb"] = retained_mb
+        result["bytes_per_node"] = retained_mb * 1024 * 1024 / nodes
+    return result
+
+
+def main():
+    """노드 수별 구성 시간, 메모리, 조회 지연과 증가 기울기를 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,1000,10000,100000,1000000")
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--fanout", type=int, default=12)
+    parser.add_argument("--collisions", type=float, default=0.1)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 생략")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(
+        f"depth={args.depth} fanout={args.fanout} collisions={args.collisions} "
+        f"queries={args.queries}"
+    )
+    header = f"{'nodes':>8} {'names':>8} {'build(ms)':>10}"
+    header += "".join(f" {op + '(us)':>17}" for op in QUERY_OPS)
+    if not args.no_memory:
+        header += f" {'peak(MB)':>9} {'B/node':>7}"
+    print(header)
+
+    results = []
+    for size in sizes:
+        data = synthetic_tree(
+            size, args.depth, args.fanout, args.collisions, seed=args.seed
+        )
+        result = _measure(data, args.queries, not args.no_memory, args.seed)
+        results.append(result)
+        row = (
+            f"{result['nodes']:>8} {result['distinct_names']:>8} "
+            f"{result['build_ms']:>10.1f}"
+        )
+        row += "".join(f" {result[op + '_us']:>17.1f}" for op in QUERY_OPS)
+        if not args.no_memory:
+            row += f" {result['build_peak_mb']:>9.1f} {result['bytes_per_node']:>7.0f}"
+        print(row, flush=True)
+        del data
+
+    node_counts = [result["nodes"] for result in results]
+    metrics = ["build_ms", *(op + "_us" for op in QUERY_OPS)]
+    if not args.no_memory:
+        metrics.append("retained_mb")
+    slopes = {
+        metric: _slope(node_counts, [result[metric] for result in results])
+        for metric in metrics
+    }
+    print("\n증가율 (log-log 기울기: 0=상수, 1=선형, 2=제곱)")
+    for metric, slope in slopes.items():
+        print(f"  {metric:<18} {slope:>5.2f}")
+
+    if args.output:
+        report = {
+            "params": vars(args),
+            "results": results,
+            "slopes": slopes,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""조직 트리 응답 모양별 크기/직렬화 시간 벤치마크
+
+`/organization/tree`의 `depth`, `fields`, `flat` 조합마다 응답 본문 크기와
+직렬화 시간(캐시되기 전 첫 요청 비용)을 측정합니다. `--factor`로 현재
+school_info.json을 여러 배로 늘린 합성 데이터에서도 잴 수 있습니다.
+
+    python -m benchmarks.bench_tree_views [--factor 100] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from app.utils.organization_store import TreeView, serialize_view
+from app.utils.university_structure import UniversityStructure
+from benchmarks.synthetic import scaled_school_info
+
+VIEWS = [
+    ("full", TreeView()),
+    ("depth=2", TreeView(depth=2)),
+    ("depth=2&fields=name", TreeView(depth=2, fields=("name",))),
+    ("fields=name", TreeView(fields=("name",))),
+    ("fields=name,phone", TreeView(fields=("name", "phone"))),
+    ("flat", TreeView(flat=True)),
+    ("flat&fields=name", TreeView(fields=("name",), flat=True)),
+    ("flat&depth=2&fields=name", TreeView(depth=2, fields=("name",), flat=True)),
+]
+
+
+def main():
+    """옵션 조합별 응답 본문 크기와 직렬화 시간을 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--factor", type=int, default=1, help="데이터 배수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    structure = UniversityStructure.from_dict(scaled_school_info(args.factor))
+    print(f"nodes={len(structure)} height={structure.height}")
+    full_size = None
+    for label, view in VIEWS:
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            body = serialize_view(structure, structure.root, view)
+            samples.append((time.perf_counter() - started) * 1000)
+        full_size = full_size or len(body)
+        print(
+            f"{label:<26} {len(body) / 1024:>9.1f}KB ({len(body) / full_size:>6.1%}) "
+            f"{statistics.median(samples):>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""iBook 업스트림 헤지/재시도/서킷 브레이커 벤치마크
+
+가짜 iBook 업스트림(`benchmarks.fake_ibook`)을 같은 프로세스에서 ASGI로 호출하면서
+`BookDownloader`를 정책 없이(plain)와 기본 정책(resilient)으로 각각 실행해 비교합니다.
+
+- tail: `--slow-rate` 확률로 `--slow-ms`만큼 늦는 업스트림에서 이미지 받기
+  (헤지 효과: p99/최대 지연)
+- errors: `--error-rate` 확률로 503을 주는 업스트림에서 이미지 받기
+  (재시도 효과: 성공률, 업스트림 요청 증가량)
+- outage: 한 번 받은 뒤 업스트림이 느리게 모두 실패할 때 이미지 목록 받기
+  (서킷 효과: 바로 실패하거나 이전 목록 재사용)
+
+    python -m benchmarks.bench_upstream_resilience [--requests 400] [--concurrency 8]
+        [--latency-ms 20] [--slow-rate 0.05] [--slow-ms 2000] [--error-rate 0.2]
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import asdict, replace
+from functools import partial
+
+import httpx
+
+from app.utils.ibookdownloader import BookDownloader, FetchError
+from app.utils.resilience import UpstreamPolicy
+from benchmarks.fake_ibook import FaultConfig, create_app
+
+PLAIN = UpstreamPolicy(hedge_quantile=0, max_retries=0, breaker_failures=0)
+RESILIENT = UpstreamPolicy(breaker_cooldown=60)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(percent / 100 * len(ordered)))]
+
+
+async def _drive(call, requests: int, concurrency: int) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                await call()
+            except (FetchError, httpx.HTTPError):
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+def _report(label: str, latencies: list[float], errors: int, upstream: int, stats):
+    print(
+        f"  {label:<10} p50={_percentile(latencies, 50):>8.1f}ms "
+        f"p95={_percentile(latencies, 95):>8.1f}ms "
+        f"p99={_percentile(latencies, 99):>8.1f}ms max={max(latencies):>8.1f}ms "
+        f"errors={errors:<4} upstream={upstream:<5} {stats}"
+    )
+
+
+async def _scenario(name: str, faults: FaultConfig, args, call_name: str):
+    """장애 없이 이미지 목록을 한 번 받은 뒤 faults를 적용하고 호출을 반복합니다."""
+    print(f"[{name}] {asdict(faults)}")
+    for label, policy in (("plain", PLAIN), ("resilient", RESILIENT)):
+        app_faults = FaultConfig()
+        app = create_app(args.pages, app_faults)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://fake", timeout=10
+        ) as client:
+            downloader = BookDownloader(
+                "http://fake/Viewer/bus01", client=client, policy=policy
+            )
+            image_urls = await downloader.fetch_image_list()
+            for field, value in asdict(faults).items():
+                setattr(app_faults, field, value)
+            before = sum((await client.get("/_stats")).json().values())
+
+            if call_name == "image":
+                call = partial(downloader.fetch_image, image_urls[0])
+            else:
+                call = downloader.fetch_image_list
+            latencies, errors = await _drive(call, args.requests, args.concurrency)
+            stats = (await client.get("/_stats")).json()
+            upstream = sum(stats.values()) - before
+            resilience = {k: v for k, v in asdict(downloader.resilience).items() if v}
+            _report(label, latencies, errors, upstream, resilience)
+
+
+async def _run(args):
+    base = FaultConfig(latency_ms=args.latency_ms, jitter_ms=args.latency_ms / 4)
+    await _scenario(
+        "tail",
+        replace(base, slow_rate=args.slow_rate, slow_ms=args.slow_ms),
+        args,
+        "image",
+    )
+    await _scenario("errors", replace(base, error_rate=args.error_rate), args, "image")
+    await _scenario(
+        "outage", replace(base, latency_ms=args.outage_ms, error_rate=1.0), args, "list"
+    )
+
+
+def main():
+    """tail, errors, outage 시나리오마다 plain과 resilient 정책을 비교합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=2000)
+    parser.add_argument("--error-rate", type=float, default=0.2)
+    parser.add_argument("--outage-ms", type=float, default=500, help="장애 중 지연")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""부하 테스트용 로컬 가짜 iBook 업스트림
+
+실제 ibook.tukorea.ac.kr 대신 같은 형태의 응답을 돌려주는 서버입니다.
+
+- `GET /Viewer/{name}`: `var bookcode = '...';`가 들어 있는 뷰어 HTML
+- `GET /Viewer/getBookXML/{bookcode}`: 페이지 이미지 목록 JSON (`//host/...` 형태의 src)
+- `POST /web/RawFileList`: 첨부파일 목록 XML
+- `GET /contents/...`: 페이지 JPEG과 첨부파일 (ETag/If-None-Match 지원)
+- `GET /_stats`: 경로별 요청 수 (부하 테스트 결과에 포함)
+
+모든 요청에 지연(`--latency-ms` ± `--jitter-ms`)을 주고, `--slow-rate` 확률로
+`--slow-ms`만큼 더 늦게(꼬리 지연) 응답하며, `--error-rate` 확률로 `--error-status`
+응답을 돌려줍니다. 서비스를 이 서버에 연결하려면
+`SHUTTLE_URL=http://127.0.0.1:8900/Viewer/bus01`로 실행합니다.
+
+    python -m benchmarks.fake_ibook [--port 8900] [--pages 8] [--latency-ms 50]
+        [--jitter-ms 20] [--slow-rate 0.05] [--slow-ms 3000] [--error-rate 0.05]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app.utils.image_variants import pillow_available
+
+BOOKCODE = "FAKE000001"
+FILE_NAME = "shuttle.xlsx"
+
+
+@dataclass
+class FaultConfig:
+    """지연과 실패 주입 설정
+
+    Attributes:
+        latency_ms (float): 기본 지연(ms)
+        jitter_ms (float): 지연에 더하거나 뺄 최대 흔들림(ms)
+        error_rate (float): 실패 응답을 돌려줄 확률 (0~1)
+        error_status (int): 실패 응답 상태 코드
+        slow_rate (float): slow_ms만큼 더 늦게 응답할 확률 (0~1)
+        slow_ms (float): 느린 응답에 더할 지연(ms)
+    """
+
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0
+    error_status: int = 503
+    slow_rate: float = 0
+    slow_ms: float = 0
+
+
+def page_images(pages: int) -> list[bytes]:
+    """페이지마다 내용이 다른 시간표 JPEG을 만듭니다.
+
+    Pillow가 있으면 실제로 디코딩 가능한 이미지를, 없으면 JPEG 마커만 있는
+    무작위 바이트를 만듭니다. (이 경우 WebP/리사이즈 변환은 실패)
+    """
+    if pillow_available():
+        from benchmarks.bench_image_variants import synthetic_timetable
+
+        base = synthetic_timetable()
+        # EOI 뒤의 데이터는 디코더가 무시하므로 페이지 번호를 붙여 해시만 다르게 함
+        return [base + f"page-{i}".encode() for i in range(1, pages + 1)]
+    return [b"\xff\xd8" + os.urandom(300 * 1024) + b"\xff\xd9" for _ in range(pages)]
+
+
+class FakeIBook:
+    """가짜 iBook의 라우트 핸들러와 경로별 요청 수"""
+
+    def __init__(self, pages: int, faults: FaultConfig):
+        """FakeIBook을 초기화하고 페이지 이미지와 첨부파일을 만듭니다.
+
+        Args:
+            pages (int): 시간표 페이지 수
+            faults (FaultConfig): 지연과 실패 주입 설정
+        """
+        self.pages = pages
+        self.faults = faults
+        self.images = page_images(pages)
+        self.etags = [
+            f'"{hashlib.sha256(data).hexdigest()[:16]}"' for data in self.images
+        ]
+        self.attachment = os.urandom(64 * 1024)
+        self.counts: Counter = Counter()
+
+    async def inject(self, request: Request) -> Optional[Response]:
+        """지연을 준 뒤 실패해야 하면 실패 응답을 반환합니다."""
+        faults = self.faults
+        self.counts[request.url.path] += 1
+        delay = faults.latency_ms + random.uniform(-faults.jitter_ms, faults.jitter_ms)
+        if random.random() < faults.slow_rate:
+            self.counts["_slow"] += 1
+            delay += faults.slow_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if random.random() < faults.error_rate:
+            self.counts["_errors"] += 1
+            return Response(status_code=faults.error_status)
+        return None
+
+    async def viewer(self, request: Request):
+        """bookcode가 들어 있는 뷰어 HTML"""
+        if (failed := await self.inject(request)) is not None:
+            return failed
+        html = f"<html><script>\nvar bookcode = '{BOOKCODE}';\n</script></html>"
+        return Response(html, media_type="text/html")
+
+    async def book_xml(self, request: Request):
+        """페이지 이미지 목록 JSON"""
+        if (failed := await self.inject(request)) is not None:
+            return failed
+        host = request.headers["host"]
+        body = [
+            {"src": f"//{host}/contents/img/{i}.jpg"} for i in range(1, self.pages + 1)
+        ]
+        return Response(json.dumps(body).replace("/", "\\/"), media_type="text/plain")
+
+    async def raw_file_list(self, request: Request):
+        """첨부파일 목록 XML"""
+        if (failed := await self.inject(request)) is not None:
+            return failed
+        host = request.headers["host"]
+        xml = (
+            f'<files bookcode="{BOOKCODE}"><file name="{FILE_NAME}" host="{host}" '
+            f'file_url="http://{host}/contents/raw/{FILE_NAME}"/></files>'
+        )
+        return Response(xml, media_type="application/xml")
+
+    async def page(self, request: Request):
+        """페이지 JPEG (If-None-Match가 ETag와 같으면 304)"""
+        if (failed := await self.inject(request)) is not None:
+            return failed
+        index = request.path_params["index"] - 1
+        if not 0 <= index < self.pages:
+            return Response(status_code=404)
+        headers = {"ETag": self.etags[index]}
+        if request.headers.get("if-none-match") == self.etags[index]:
+            self.counts["_not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+        return Response(self.images[index], media_type="image/jpeg", headers=headers)
+
+    async def raw_file(self, request: Request):
+        """첨부파일 바이트"""
+        if (failed := await self.inject(request)) is not None:
+            return failed
+        return Response(self.attachment, media_type="application/octet-stream")
+
+    async def stats(self, request: Request):
+        """경로별 요청 수"""
+        return JSONResponse(dict(self.counts))
+
+
+def create_app(pages: int = 8, faults: Optional[FaultConfig] = None) -> Starlette:
+    """가짜 iBook 업스트림 ASGI 앱을 만듭니다.
+
+    Args:
+        pages (int): 시간표 페이지 수
+        faults (Optional[FaultConfig]): 지연과 실패 주입 설정 (None이면 지연/실패 없음)
+    """
+    fake = FakeIBook(pages, faults or FaultConfig())
+    return Starlette(
+        routes=[
+            Route("/_stats", fake.stats),
+            Route("/Viewer/getBookXML/{bookcode}", fake.book_xml),
+            Route("/Viewer/{name}", fake.viewer),
+            Route("/web/RawFileList", fake.raw_file_list, methods=["POST"]),
+            Route("/contents/img/{index:int}.jpg", fake.page),
+            Route("/contents/raw/{name}", fake.raw_file),
+        ]
+    )
+
+
+def main():
+    """명령행 옵션대로 지연/실패를 주입하는 가짜 업스트림 서버를 실행합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--slow-rate", type=float, default=0)
+    parser.add_argument("--slow-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        args.latency_ms,
+        args.jitter_ms,
+        args.error_rate,
+        args.error_status,
+        args.slow_rate,
+        args.slow_ms,
+    )
+    uvicorn.run(
+        create_app(args.pages, faults),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""벤치마크용 합성 조직 데이터 생성 모듈"""
+
+import copy
+import random
+from collections import deque
+from typing import Dict
+
+from app.config import Config
+
+SYLLABLES = (
+    "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+)
+
+
+def _random_word(rng: random.Random, length: int = 2) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(length))
+
+
+def _rename(data: Dict, prefix: str) -> Dict:
+    """그룹/유닛 이름 앞에 prefix를 붙인 사본을 만듭니다. (phone/url 키는 유지)"""
+    if "phone" in data or "url" in data:
+        return copy.deepcopy(data)
+    return {f"{prefix}{key}": _rename(value, prefix) for key, value in data.items()}
+
+
+def scaled_school_info(factor: int, seed: int = 0) -> Dict:
+    """현재 school_info.json을 factor배로 늘린 합성 데이터를 반환합니다.
+
+    각 사본은 `캠퍼스{i}` 아래에 놓이고, 모든 이름 앞에 무작위 두 글자가 붙어
+    이름 대부분이 서로 다르게 됩니다.
+    """
+    rng = random.Random(seed)
+    base = Config.get_school_info_file()
+    return {f"캠퍼스{i}": _rename(base, _random_word(rng)) for i in range(factor)}
+
+
+# 여러 학과/부서에 흔히 반복되는 이름 (이름 충돌용)
+COMMON_NAMES = (
+    "행정실",
+    "학과사무실",
+    "교학팀",
+    "연구실",
+    "실험실",
+    "조교실",
+    "상담실",
+)
+
+
+def synthetic_tree(
+    nodes: int,
+    depth: int = 6,
+    fanout: int = 12,
+    collision_rate: float = 0.1,
+    seed: int = 0,
+) -> Dict:
+    """school_info.json 형식의 합성 조직 트리를 만듭니다.
+
+    루트 아래로 너비 우선으로 노드를 fanout개씩 붙여 총 nodes개(루트 제외)를 만들고,
+    depth 단계에 닿거나 하위 조직이 생기지 않은 노드는 phone/url을 가진 유닛이 됩니다.
+    nodes가 트리 용량(fanout + fanout² + ... + fanout^depth)보다 크면 용량만큼만 만듭니다.
+
+    Args:
+        nodes (int): 만들 노드 수 (루트 제외)
+        depth (int): 최대 깊이 (루트 바로 아래가 1)
+        fanout (int): 그룹당 하위 조직 수
+        collision_rate (float): 이름을 `COMMON_NAMES`에서 골라 다른 노드와 겹치게 할 확률
+        seed (int): 난수 시드
+
+    Returns:
+        Dict: `UniversityStructure.from_dict`에 넣을 수 있는 dict
+    """
+    rng = random.Random(seed)
+    root: Dict = {}
+    queue = deque([(root, 0)])
+    created = 0
+    while queue and created < nodes:
+        parent, level = queue.popleft()
+        for _ in range(min(fanout, nodes - created)):
+            name = f"{_random_word(rng)}{created}"
+            if rng.random() < collision_rate:
+                common = rng.choice(COMMON_NAMES)
+                name = common if common not in parent else name
+            created += 1
+            if level + 1 >= depth:
+                parent[name] = {"phone": f"031-8041-{created % 10000:04d}"}
+            else:
+                parent[name] = {}
+                queue.append((parent[name], level + 1))
+
+    # 하위 조직이 생기지 않은 그룹은 유닛으로 바꿈
+    for group, _ in queue:
+        group["phone"] = f"031-8041-{rng.randrange(10000):04d}"
+        group["url"] = "https://www.tukorea.ac.kr/"
+    return root
@@ -5,17 +5,34 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import uvicorn
 
-from app.routers import bus_router, organization_router
-from app.config.config import logger
+from app.middleware import MetricsMiddleware
+from app.routers import bus_router, metrics_router, organization_router
+from app.config.config import Config, logger
+from app.utils.http_client import close_http_client, open_http_client
+from app.utils.metrics import registry
+from app.utils.organization_store import organization_store
+from app.utils.shuttle import open_shuttle_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI의 lifespan 이벤트 핸들러"""
     logger.info("🚀 서비스 시작:")
+    organization_store.load()  # 조직 구조와 인덱스는 시작 시 한 번 구성
+    organization_store.start_watching(Config.SCHOOL_INFO_RELOAD_INTERVAL)
+    app.state.http_client = open_http_client()  # iBook 요청용 공용 커넥션 풀
+    app.state.shuttle = open_shuttle_service(app.state.http_client)
+    # 시작 시 셔틀버스 캐시를 채우고 TTL 전에 미리 갱신
+    app.state.shuttle.start_prefetch(Config.SHUTTLE_PREFETCH_INTERVAL)
+    registry.register_collector("shuttle", app.state.shuttle.collect_metrics)
 
     yield  # FastAPI가 실행 중인 동안 유지됨
 
+    registry.unregister_collector("shuttle")
+    await app.state.shuttle.close()
+    await organization_store.stop_watching()
+    await close_http_client(app.state.http_client)
+
     # 애플리케이션 종료 시 로그 출력
     logger.info("🛑 서비스 종료:")
 
@@ -24,6 +41,9 @@ async def lifespan(app: FastAPI):
 app = FastAPI(lifespan=lifespan, root_path="/static-info")
 app.include_router(bus_router)
 app.include_router(organization_router)
+if Config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
 
 @app.get("/")
 async def root():